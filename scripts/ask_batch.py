@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Answer a JSONL file of questions and write the answers as JSONL.
+
+Each input line is a JSON object with a "question" field (any other fields,
+such as an "id", are copied to the output) or a bare JSON string. Each
+output line holds the input fields plus "answer", "sources", "model",
+"cached" and, for failed generations, "error".
+
+Questions are processed in chunks of --batch-size through
+`RAGChain.ask_batch`: one batched query-embedding call per chunk and up to
+--concurrency concurrent Gemini calls. Output is flushed after every chunk,
+so --resume continues an interrupted run.
+
+Usage:
+    python scripts/ask_batch.py questions.jsonl answers.jsonl
+    python scripts/ask_batch.py questions.jsonl answers.jsonl --concurrency 16 --resume
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.rbi_nbfc_chatbot.chains import build_rag_chain
+from src.rbi_nbfc_chatbot.config import BATCH_CONCURRENCY
+
+
+def read_questions(path: str) -> List[Dict[str, Any]]:
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, str):
+                record = {"question": record}
+            if not isinstance(record, dict) or not record.get("question"):
+                raise ValueError(f"{path}:{line_number}: expected a JSON string or an object with a 'question'")
+            records.append(record)
+    return records
+
+
+def count_lines(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Answer a JSONL file of questions")
+    parser.add_argument("input", help="JSONL file of questions")
+    parser.add_argument("output", help="JSONL file to write answers to")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="concurrent LLM calls")
+    parser.add_argument("--batch-size", type=int, default=100, help="questions per batched retrieval")
+    parser.add_argument("--no-sources", action="store_true", help="omit source excerpts from the output")
+    parser.add_argument("--resume", action="store_true", help="skip questions already answered in OUTPUT")
+    args = parser.parse_args()
+
+    records = read_questions(args.input)
+    output = Path(args.output)
+    done = count_lines(output) if args.resume else 0
+    if done:
+        print(f"♻️  Resuming: {done} of {len(records)} questions already answered")
+
+    rag_chain = build_rag_chain()
+    start = time.time()
+    errors = cached = 0
+
+    with open(output, "a" if done else "w", encoding="utf-8") as f:
+        for offset in range(done, len(records), args.batch_size):
+            chunk = records[offset:offset + args.batch_size]
+            responses = rag_chain.ask_batch(
+                [record["question"] for record in chunk],
+                concurrency=args.concurrency,
+                return_sources=not args.no_sources,
+            )
+            for record, response in zip(chunk, responses):
+                f.write(json.dumps({**record, **response}, ensure_ascii=False) + "\n")
+                errors += "error" in response
+                cached += response.get("cached", False)
+            f.flush()
+            answered = offset + len(chunk)
+            rate = (answered - done) / (time.time() - start)
+            print(f"   {answered}/{len(records)} answered ({rate:.1f} questions/s)")
+
+    print(f"✅ Wrote {output} in {time.time() - start:.1f}s ({cached} cached, {errors} errors)")
+
+
+if __name__ == "__main__":
+    main()
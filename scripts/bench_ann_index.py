@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark approximate FAISS index types against the exact flat index.
+
+Builds every index type from `build_faiss_index` over the same vectors and,
+for a sweep of query-time settings (nprobe for IVF, efSearch for HNSW),
+reports recall@k against exact flat search, single-query latency
+(p50/p95) and the serialized index size.
+
+By default the corpus is synthetic: clustered, L2-normalized 768-d vectors
+shaped like text embeddings, at a size where ANN indexes matter. --index
+benchmarks the vectors of an existing vector store instead (queries are
+perturbed copies of stored vectors).
+
+Usage:
+    python scripts/bench_ann_index.py --vectors 100000 --queries 500
+    python scripts/bench_ann_index.py --index data/vector_store/index.faiss
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import faiss
+import numpy as np
+
+from src.rbi_nbfc_chatbot.utils.faiss_index import build_faiss_index, configure_search
+
+SWEEPS = {
+    "flat": [{}],
+    "ivf-flat": [{"nprobe": p} for p in (1, 4, 16, 64)],
+    "hnsw": [{"ef_search": ef} for ef in (16, 64, 128, 256)],
+    "ivf-pq": [{"nprobe": p} for p in (4, 16, 64)],
+}
+
+
+def normalize(x: np.ndarray) -> np.ndarray:
+    return (x / np.linalg.norm(x, axis=1, keepdims=True)).astype(np.float32)
+
+
+def synthetic_corpus(n: int, num_queries: int, d: int, seed: int):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, n // 200), d), dtype=np.float32)
+
+    def sample(count: int) -> np.ndarray:
+        labels = rng.integers(0, len(centers), count)
+        return normalize(centers[labels] + 0.6 * rng.standard_normal((count, d), dtype=np.float32))
+
+    return sample(n), sample(num_queries)
+
+
+def stored_corpus(index_path: str, num_queries: int, seed: int):
+    index = faiss.read_index(os.path.join(index_path, "index.faiss"))
+    vectors = index.reconstruct_n(0, index.ntotal)
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(vectors), num_queries)
+    noise = 0.02 * rng.standard_normal((num_queries, vectors.shape[1]), dtype=np.float32)
+    return vectors, normalize(vectors[picks] + noise)
+
+
+def latency_ms(index: faiss.Index, queries: np.ndarray, k: int) -> np.ndarray:
+    times = np.empty(len(queries))
+    for i in range(len(queries)):
+        start = time.perf_counter()
+        index.search(queries[i:i + 1], k)
+        times[i] = time.perf_counter() - start
+    return times * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recall@k vs. latency for FAISS index types")
+    parser.add_argument("--vectors", type=int, default=50000, help="synthetic corpus size")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--index", help="use the vectors of an existing vector store directory instead")
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--types", nargs="+", default=list(SWEEPS))
+    parser.add_argument("--threads", type=int, default=1, help="FAISS OpenMP threads")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    faiss.omp_set_num_threads(args.threads)
+    if args.index:
+        vectors, queries = stored_corpus(args.index, args.queries, args.seed)
+    else:
+        vectors, queries = synthetic_corpus(args.vectors, args.queries, args.dim, args.seed)
+
+    print("=" * 78)
+    print(f"ANN INDEX BENCHMARK: {len(vectors)} vectors x {vectors.shape[1]}-d, "
+          f"{len(queries)} queries, recall@{args.k}, {args.threads} thread(s)")
+    print("=" * 78)
+
+    exact = faiss.IndexFlatL2(vectors.shape[1])
+    exact.add(vectors)
+    _, truth = exact.search(queries, args.k)
+
+    print(f"{'index':<10} {'setting':<14} {'build s':>8} {'size MB':>8} {'recall':>7} {'p50 ms':>8} {'p95 ms':>8}")
+    for index_type in args.types:
+        start = time.perf_counter()
+        index = build_faiss_index(vectors, index_type)
+        build_seconds = time.perf_counter() - start
+        size_mb = len(faiss.serialize_index(index)) / 1e6
+
+        for setting in SWEEPS[index_type]:
+            configure_search(index, **setting)
+            _, found = index.search(queries, args.k)
+            recall = np.mean([len(set(f) & set(t)) / args.k for f, t in zip(found, truth)])
+            times = latency_ms(index, queries, args.k)
+            label = ", ".join(f"{key}={value}" for key, value in setting.items()) or "exact"
+            print(
+                f"{index_type:<10} {label:<14} {build_seconds:>8.2f} {size_mb:>8.1f} {recall:>7.3f} "
+                f"{np.percentile(times, 50):>8.3f} {np.percentile(times, 95):>8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
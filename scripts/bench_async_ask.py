@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for the async /ask path.
+
+Drives the FastAPI app in-process (no sockets) with a RAG chain built from
+offline stand-ins: hashed bag-of-words embeddings and a chat model that sleeps
+for a fixed "generation" time. Because the handler awaits retrieval and
+generation, throughput should grow roughly linearly with concurrency until the
+single event loop saturates.
+
+Usage:
+    python scripts/bench_async_ask.py --requests 128 --llm-latency 0.2
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains import RAGChain
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+
+QUESTIONS = [
+    "What is the minimum Net Owned Fund requirement?",
+    "Can NBFCs accept demand deposits?",
+    "What is the Scale Based Regulatory Framework?",
+    "What are the capital adequacy requirements for NBFCs?",
+]
+
+
+def build_fake_chain(embed_latency: float, llm_latency: float) -> RAGChain:
+    """Build a RAG chain over a small synthetic corpus with simulated latency."""
+    documents = [
+        Document(
+            page_content=f"Paragraph {i}: NBFC regulation text about capital, deposits and registration number {i}.",
+            metadata={"page": i, "source": "synthetic"},
+        )
+        for i in range(200)
+    ]
+    embeddings = HashingEmbeddings(latency=embed_latency)
+    vectorstore = FAISS.from_documents(documents, HashingEmbeddings())
+    vectorstore.embedding_function = embeddings
+    return RAGChain(
+        llm=FakeChatModel(latency=llm_latency),
+        retriever=vectorstore.as_retriever(search_kwargs={"k": 4}),
+    )
+
+
+async def run_level(client: httpx.AsyncClient, total: int, concurrency: int) -> float:
+    """Send `total` questions with at most `concurrency` in flight; return req/s."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            response = await client.post("/ask", json={"question": QUESTIONS[i % len(QUESTIONS)]})
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server._rag_chain = build_fake_chain(args.embed_latency, args.llm_latency)
+    transport = httpx.ASGITransport(app=server.app)
+
+    print("=" * 60)
+    print("ASYNC /ask LOAD BENCHMARK (fake embeddings + fake LLM)")
+    print("=" * 60)
+    print(f"requests per level: {args.requests}")
+    print(f"embed latency: {args.embed_latency * 1000:.0f} ms, LLM latency: {args.llm_latency * 1000:.0f} ms")
+    print()
+    print(f"{'concurrency':>12} {'req/s':>10} {'speedup':>10}")
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        baseline = None
+        for concurrency in args.concurrency:
+            throughput = await run_level(client, args.requests, concurrency)
+            baseline = baseline or throughput
+            print(f"{concurrency:>12} {throughput:>10.1f} {throughput / baseline:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent /ask throughput")
+    parser.add_argument("--requests", type=int, default=128)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--embed-latency", type=float, default=0.05)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
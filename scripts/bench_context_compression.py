@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Measure context compression on the RBI FAQ questions.
+
+Retrieves chunks for every FAQ question from the bundled vector store (BM25
+retrieval, so no API key is needed) and compares the full "stuff" context
+with `ContextCompressor` output at several token budgets: context tokens,
+tokens saved, compression time, and how many of the expected answer's terms
+that were in the full context survive compression.
+
+With --gemini (requires GOOGLE_API_KEY) each question is also answered by
+Gemini from both prompts to measure the change in time to first token and
+total generation time.
+
+Usage:
+    python scripts/bench_context_compression.py
+    python scripts/bench_context_compression.py --k 8 --budgets 0 1200 600 --gemini
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.rbi_nbfc_chatbot.chains.context import ContextCompressor, get_token_counter
+from src.rbi_nbfc_chatbot.chains.rag_chain import DEFAULT_PROMPT_TEMPLATE
+from src.rbi_nbfc_chatbot.chains.retriever import DocumentRetriever, load_bm25_index
+from src.rbi_nbfc_chatbot.config import GEMINI_MODEL, GOOGLE_API_KEY, VECTOR_STORE_PATH
+from src.rbi_nbfc_chatbot.faq_samples import RBI_FAQ_SAMPLES
+from src.rbi_nbfc_chatbot.utils.bm25 import tokenize
+from src.rbi_nbfc_chatbot.utils.faiss_index import load_vector_store
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+def answer_term_retention(answer: str, full: str, compressed: str) -> float:
+    """Share of the answer's terms present in the full context that survive compression."""
+    available = set(tokenize(answer)) & set(tokenize(full))
+    if not available:
+        return 1.0
+    return len(available & set(tokenize(compressed))) / len(available)
+
+
+def time_generation(llm, prompt: str):
+    start = time.perf_counter()
+    first = None
+    for _ in llm.stream(prompt):
+        if first is None:
+            first = time.perf_counter() - start
+    return first * 1000, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Context compression on the RBI FAQ questions")
+    parser.add_argument("--index", default=VECTOR_STORE_PATH, help="vector store directory")
+    parser.add_argument("--k", type=int, default=4, help="chunks retrieved per question")
+    parser.add_argument(
+        "--budgets", type=int, nargs="+", default=[0, 1200, 800, 500], help="token budgets (0: overlap removal only)"
+    )
+    parser.add_argument("--gemini", action="store_true", help="also time Gemini on full vs compressed prompts")
+    args = parser.parse_args()
+
+    vectorstore = load_vector_store(args.index, HashingEmbeddings())
+    retriever = DocumentRetriever(
+        vectorstore=vectorstore, bm25=load_bm25_index(vectorstore, args.index), mode="lexical", k=args.k
+    )
+    count_tokens = get_token_counter()
+    questions = [sample["question"] for sample in RBI_FAQ_SAMPLES]
+    retrieved = [retriever.retrieve(question) for question in questions]
+    full = ["\n\n".join(doc.page_content for doc in docs) for docs in retrieved]
+    full_tokens = np.array([count_tokens(context) for context in full])
+
+    print("=" * 78)
+    num_chunks = len(vectorstore.index_to_docstore_id)
+    print(f"CONTEXT COMPRESSION: {len(questions)} FAQ questions, k={args.k}, {num_chunks} chunks")
+    print("=" * 78)
+    print(f"Full context: {full_tokens.mean():.0f} tokens on average\n")
+    print(f"{'budget':>7} {'filter':>6} {'tokens':>7} {'saved':>7} {'retained':>9} {'p50 ms':>7} {'p95 ms':>7}")
+
+    compressed_for_gemini = None
+    for budget in args.budgets:
+        for sentence_filter in (False, True):
+            compressor = ContextCompressor(
+                max_tokens=budget, sentence_filter=sentence_filter, token_counter=count_tokens
+            )
+            tokens, retention, times = [], [], []
+            contexts = []
+            for sample, docs, context in zip(RBI_FAQ_SAMPLES, retrieved, full):
+                start = time.perf_counter()
+                compressed = compressor.compress(sample["question"], docs)
+                times.append((time.perf_counter() - start) * 1000)
+                tokens.append(compressed.tokens)
+                retention.append(answer_term_retention(sample["answer"], context, compressed.text))
+                contexts.append(compressed.text)
+            if budget == args.budgets[-1] and not sentence_filter:
+                compressed_for_gemini = contexts
+            saved = 1 - np.mean(tokens) / full_tokens.mean()
+            print(
+                f"{budget or '-':>7} {'yes' if sentence_filter else 'no':>6} {np.mean(tokens):>7.0f} {saved:>7.1%} "
+                f"{np.mean(retention):>9.1%} {np.percentile(times, 50):>7.2f} {np.percentile(times, 95):>7.2f}"
+            )
+
+    if not args.gemini:
+        print("\nRun with --gemini to measure the generation latency change.")
+        return
+    if not GOOGLE_API_KEY:
+        print("\n❌ --gemini needs GOOGLE_API_KEY")
+        sys.exit(1)
+
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    llm = ChatGoogleGenerativeAI(model=GEMINI_MODEL, google_api_key=GOOGLE_API_KEY, temperature=0)
+    results = {"full": [], "compressed": []}
+    for question, context, compressed in zip(questions, full, compressed_for_gemini):
+        for name, text in (("full", context), ("compressed", compressed)):
+            prompt = DEFAULT_PROMPT_TEMPLATE.format(context=text, question=question)
+            results[name].append(time_generation(llm, prompt))
+
+    print(f"\nGemini ({GEMINI_MODEL}), budget {args.budgets[-1]}:")
+    print(f"{'prompt':<11} {'first token p50':>16} {'total p50':>10} {'total p95':>10}")
+    for name, timings in results.items():
+        first, total = np.array(timings).T
+        print(
+            f"{name:<11} {np.percentile(first, 50):>14.0f}ms "
+            f"{np.percentile(total, 50):>8.0f}ms {np.percentile(total, 95):>8.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark the batched embedding pipeline against a local fake embedding server.
+
+Starts an HTTP server on localhost that behaves like a remote embedding API:
+each request costs a fixed latency plus a per-text cost, and the server
+answers 429 once more than --server-rps requests arrive per second. The
+pipeline is then run at several worker counts, reporting chunks/second and
+how many rate-limit retries the token bucket and backoff absorbed.
+
+Usage:
+    python scripts/bench_embedding_pipeline.py --chunks 2000 --workers 1 2 4 8 16
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Deque, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.embeddings import Embeddings
+
+from src.rbi_nbfc_chatbot.utils.embedding_pipeline import EmbeddingStats, embed_in_batches
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+def make_handler(request_latency: float, per_text_latency: float, server_rps: float):
+    fake = HashingEmbeddings()
+    recent: Deque[float] = deque()
+    lock = threading.Lock()
+
+    def admit() -> bool:
+        """Sliding one-second window: reject once server_rps requests were seen."""
+        now = time.monotonic()
+        with lock:
+            while recent and now - recent[0] > 1.0:
+                recent.popleft()
+            if len(recent) >= server_rps:
+                return False
+            recent.append(now)
+            return True
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):  # noqa: N802 (http.server naming)
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if not admit():
+                self.send_response(429)
+                self.end_headers()
+                return
+            texts = body["texts"]
+            time.sleep(request_latency + per_text_latency * len(texts))
+            payload = json.dumps({"embeddings": fake.embed_documents(texts)}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+class HttpEmbeddings(Embeddings):
+    """Embeddings client for the fake server; urllib raises HTTPError(code=429)."""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"texts": texts}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return json.loads(response.read())["embeddings"]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark embed_in_batches vs. worker count")
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--request-latency", type=float, default=0.1)
+    parser.add_argument("--per-text-latency", type=float, default=0.001)
+    parser.add_argument("--server-rps", type=float, default=40.0, help="server-side 429 threshold")
+    parser.add_argument("--client-rps", type=float, default=50.0, help="client token-bucket rate")
+    args = parser.parse_args()
+
+    handler = make_handler(args.request_latency, args.per_text_latency, args.server_rps)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    embeddings = HttpEmbeddings(f"http://127.0.0.1:{server.server_address[1]}/embed")
+
+    texts = [f"Chunk {i}: NBFC regulatory text about capital, deposits and governance." for i in range(args.chunks)]
+
+    print("=" * 60)
+    print("BATCHED EMBEDDING PIPELINE BENCHMARK (local fake server)")
+    print("=" * 60)
+    print(f"chunks: {args.chunks}, batch size: {args.batch_size}")
+    print(f"server: {args.request_latency * 1000:.0f} ms/request + {args.per_text_latency * 1000:.1f} ms/text, "
+          f"429 above {args.server_rps:.0f} req/s; client budget {args.client_rps:.0f} req/s")
+    print()
+    print(f"{'workers':>8} {'chunks/s':>10} {'seconds':>9} {'429 retries':>12}")
+
+    try:
+        for workers in args.workers:
+            stats = EmbeddingStats()
+            vectors = embed_in_batches(
+                texts,
+                embeddings,
+                batch_size=args.batch_size,
+                max_workers=workers,
+                requests_per_second=args.client_rps,
+                stats=stats,
+            )
+            assert len(vectors) == len(texts)
+            print(f"{workers:>8} {len(texts) / stats.seconds:>10.0f} {stats.seconds:>9.2f} {stats.retries:>12}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark vector-store startup: load time and memory per worker process.
+
+For each vector store and load mode (heap copy vs. FAISS mmap), starts
+--workers processes at once, the way several uvicorn workers plus Streamlit
+would. Each one loads the index and docstore the way `load_vector_store`
+does, runs a query that scans every vector (so every page is touched), and
+reports:
+
+- index s / docstore s: time to read the FAISS index and to unpickle the
+  docstore (cold: files evicted from the page cache first; warm: loaded
+  again straight after)
+- RSS MB: resident memory added by the load, counting shared pages in full
+- PSS MB: proportional set size added, with shared pages split between the
+  processes mapping them (the real per-worker cost)
+
+With --synthetic N, flat and IVF-Flat stores of N random 768-d vectors are
+built in a temporary directory; otherwise the configured vector store is used.
+
+Usage:
+    python scripts/bench_index_load.py --synthetic 200000 --workers 4
+    python scripts/bench_index_load.py --index data/vector_store/index.faiss
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+from statistics import mean
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.rbi_nbfc_chatbot.config import VECTOR_STORE_PATH
+from src.rbi_nbfc_chatbot.utils.faiss_index import (
+    build_faiss_index,
+    configure_search,
+    index_type_of,
+    read_faiss_index,
+)
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+def memory_kb(field: str) -> int:
+    """Read a field such as "Rss" or "Pss" from /proc/self/smaps_rollup."""
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def evict_page_cache(index_path: str) -> None:
+    for name in ("index.faiss", "index.pkl"):
+        path = os.path.join(index_path, name)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def worker(index_path: str, mmap: bool, barrier, results) -> None:
+    rss0, pss0 = memory_kb("Rss"), memory_kb("Pss")
+    # The two halves of load_vector_store, timed separately
+    start = time.perf_counter()
+    index = read_faiss_index(os.path.join(index_path, "index.faiss"), mmap=mmap)
+    index_seconds = time.perf_counter() - start
+    with open(os.path.join(index_path, "index.pkl"), "rb") as f:
+        docstore = pickle.load(f)
+    docstore_seconds = time.perf_counter() - start - index_seconds
+
+    # Touch every stored vector, as a long-running worker eventually would
+    configure_search(index, nprobe=getattr(index, "nlist", 1))
+    index.search(np.zeros((1, index.d), dtype=np.float32), 1)
+
+    barrier.wait()  # all workers alive, so shared pages are split between them
+    rss, pss = (memory_kb("Rss") - rss0) / 1e3, (memory_kb("Pss") - pss0) / 1e3
+    results.put((index_seconds, docstore_seconds, rss, pss))
+    del docstore
+    barrier.wait()
+
+
+def run_round(index_path: str, mmap: bool, workers: int):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(index_path, mmap, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return [mean(column) for column in zip(*rows)]
+
+
+def build_synthetic_stores(n: int, directory: str):
+    from langchain_community.vectorstores import FAISS
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((n, 768), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    store = FAISS.from_embeddings(
+        [(f"chunk {i}", vector) for i, vector in enumerate(vectors)],
+        HashingEmbeddings(),
+        metadatas=[{"page": i} for i in range(n)],
+    )
+    paths = []
+    for index_type in ("flat", "ivf-flat"):
+        path = os.path.join(directory, index_type)
+        store.index = build_faiss_index(vectors, index_type, nlist=256)
+        store.save_local(path)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vector-store load time and RSS/PSS per worker")
+    parser.add_argument("--index", default=VECTOR_STORE_PATH)
+    parser.add_argument("--synthetic", type=int, help="build flat + IVF stores with N random vectors instead")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = build_synthetic_stores(args.synthetic, tmp) if args.synthetic else [args.index]
+
+        print("=" * 96)
+        print(f"VECTOR STORE LOAD BENCHMARK: {args.workers} concurrent workers")
+        print("=" * 96)
+        print(f"{'index':<10} {'vectors':>8} {'file MB':>8} {'mode':<5} {'index s':>15} {'docstore s':>15} "
+              f"{'RSS MB':>8} {'PSS MB':>8}")
+        print(f"{'':<34} {'cold / warm':>15} {'cold / warm':>15}")
+        for path in paths:
+            probe = read_faiss_index(os.path.join(path, "index.faiss"), mmap=True)
+            file_mb = os.path.getsize(os.path.join(path, "index.faiss")) / 1e6
+            for mmap in (False, True):
+                evict_page_cache(path)
+                cold_index, cold_docstore, _, _ = run_round(path, mmap, args.workers)
+                warm_index, warm_docstore, rss, pss = run_round(path, mmap, args.workers)
+                print(
+                    f"{index_type_of(probe):<10} {probe.ntotal:>8} {file_mb:>8.1f} "
+                    f"{'mmap' if mmap else 'copy':<5} {cold_index:>7.2f} / {warm_index:<5.2f} "
+                    f"{cold_docstore:>7.2f} / {warm_docstore:<5.2f} {rss:>8.1f} {pss:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compare PDF extraction backends on speed and extracted text.
+
+For each backend, loads the PDF (best of --repeat runs) and reports
+pages/second, then compares its text against the pypdf baseline page by page:
+
+- similarity: difflib ratio of the whitespace-normalized page text
+- word recall: share of pypdf's words (as a multiset) that the backend also found
+
+Usage:
+    python scripts/bench_pdf_backends.py
+    python scripts/bench_pdf_backends.py --pdf path/to/other.pdf --repeat 5
+"""
+
+import argparse
+import difflib
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from statistics import mean
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.rbi_nbfc_chatbot.config import PDF_PATH
+from src.rbi_nbfc_chatbot.utils.pdf_backends import PDF_BACKENDS
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def word_recall(reference: str, candidate: str) -> float:
+    ref = Counter(_WORD_RE.findall(reference.lower()))
+    if not ref:
+        return 1.0
+    found = Counter(_WORD_RE.findall(candidate.lower()))
+    return sum(min(count, found[word]) for word, count in ref.items()) / sum(ref.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends")
+    parser.add_argument("--pdf", default=str(PDF_PATH))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backends", nargs="+", default=list(PDF_BACKENDS))
+    parser.add_argument("--worst", type=int, default=3, help="show the N least similar pages per backend")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"PDF BACKEND BENCHMARK: {Path(args.pdf).name}")
+    print("=" * 78)
+
+    results = {}
+    for name in args.backends:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            pages = PDF_BACKENDS[name](args.pdf)
+            best = min(best, time.perf_counter() - start)
+        results[name] = (pages, best)
+
+    baseline = [normalize(p.page_content) for p in results.get("pypdf", (None,))[0] or PDF_BACKENDS["pypdf"](args.pdf)]
+
+    print(f"{'backend':<16} {'pages':>6} {'seconds':>8} {'pages/s':>9} {'chars':>9} {'similarity':>11} {'recall':>8}")
+    worst_pages = {}
+    for name, (pages, seconds) in results.items():
+        texts = [normalize(p.page_content) for p in pages]
+        ratios = [
+            difflib.SequenceMatcher(None, ref, text, autojunk=False).ratio()
+            for ref, text in zip(baseline, texts)
+        ]
+        recalls = [word_recall(ref, text) for ref, text in zip(baseline, texts)]
+        worst_pages[name] = sorted(range(len(ratios)), key=ratios.__getitem__)[: args.worst]
+        print(
+            f"{name:<16} {len(pages):>6} {seconds:>8.2f} {len(pages) / seconds:>9.0f} "
+            f"{sum(map(len, texts)):>9} {mean(ratios):>11.3f} {mean(recalls):>8.3f}"
+        )
+
+    print()
+    for name, indices in worst_pages.items():
+        if name == "pypdf":
+            continue
+        pages = results[name][0]
+        print(f"Least similar pages for {name}:")
+        for i in indices:
+            print(f"  page {i}: pypdf={baseline[i][:60]!r}")
+            print(f"  {' ' * len(str(i))}       {name}={normalize(pages[i].page_content)[:60]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Convert a vector store's pickled docstore (index.pkl) into a chunk store.
+
+Stores built by the ingestion pipeline already include a chunk store; use
+this for older stores (such as the bundled one) or stores saved directly
+with `FAISS.save_local`. index.pkl is left in place for tools that still use
+`FAISS.load_local`.
+
+Usage:
+    python scripts/convert_docstore.py
+    python scripts/convert_docstore.py path/to/index.faiss [more/index.faiss ...]
+"""
+
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.rbi_nbfc_chatbot.config import VECTOR_STORE_PATH
+from src.rbi_nbfc_chatbot.utils.chunk_store import ChunkStore, write_chunk_store
+
+
+def convert(index_path: str) -> None:
+    start = time.perf_counter()
+    with open(os.path.join(index_path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    pickle_seconds = time.perf_counter() - start
+
+    documents = [docstore.search(index_to_docstore_id[i]) for i in range(len(index_to_docstore_id))]
+    write_chunk_store(index_path, documents)
+
+    start = time.perf_counter()
+    store = ChunkStore(index_path)
+    open_seconds = time.perf_counter() - start
+    for row in range(len(documents)):
+        converted = store.search(row)
+        if (converted.page_content, converted.metadata) != (documents[row].page_content, documents[row].metadata):
+            raise ValueError(f"Row {row} did not round-trip through the chunk store")
+
+    print(f"✅ {index_path}: {len(documents)} chunks")
+    print(f"   index.pkl load: {pickle_seconds * 1000:.1f} ms, chunk store open: {open_seconds * 1000:.1f} ms")
+
+
+def main() -> None:
+    for index_path in sys.argv[1:] or [VECTOR_STORE_PATH]:
+        convert(index_path)
+
+
+if __name__ == "__main__":
+    main()
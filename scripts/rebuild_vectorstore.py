@@ -3,6 +3,8 @@
 Rebuild the Gemini FAISS vector store.
 
 This is equivalent to running the ingestion pipeline with force=True.
+Chunks whose content hash matches the existing manifest reuse their stored
+vectors; pass --full to re-embed everything.
 """
 
 import sys
@@ -23,10 +25,14 @@ try:
     from src.rbi_nbfc_chatbot.utils.ingest import ingest_documents
 
     print("✅ Modules imported")
+    full = "--full" in sys.argv[1:]
     print("\nRebuilding vector store with Gemini embeddings...")
-    print("This will take 5-10 minutes...\n")
+    if full:
+        print("Full rebuild requested: every chunk will be re-embedded (5-10 minutes)...\n")
+    else:
+        print("Only new or changed chunks will be embedded...\n")
 
-    vectorstore = ingest_documents(force=True)
+    vectorstore = ingest_documents(force=True, incremental=not full)
 
     print("\n" + "=" * 80)
     print("✅ SUCCESS! Vector store rebuilt with Gemini embeddings")
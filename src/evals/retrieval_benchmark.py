@@ -0,0 +1,342 @@
+"""Offline retrieval benchmark over the RBI NBFC FAQ questions.
+
+Runs the curated FAQ questions (`RBI_FAQ_SAMPLES`) against the
+retriever for a grid of configurations (chunking strategy, chunk size, k,
+index type, retrieval mode and reranker) and reports recall@k, MRR, retrieved context
+size and p50/p95/p99 retrieval latency. Everything runs locally: chunks and questions are embedded with
+the deterministic `HashingEmbeddings` stand-in, so results are reproducible
+and comparable between commits (though not equal to Gemini quality).
+
+The FAQ has expected answers but no chunk labels. A question's relevant
+pages are the Master Direction pages that best match its expected answer
+(BM25, top --relevant-pages), and a retrieved chunk counts as relevant if it
+comes from one of them, so the labels do not depend on chunk size.
+
+Usage:
+    python -m src.evals.retrieval_benchmark --output results.json
+    python -m src.evals.retrieval_benchmark --chunk-sizes 500 1000 --k 2 4 8 --index-types flat hnsw
+    python -m src.evals.retrieval_benchmark --strategies recursive regulatory --k 2 4
+    python -m src.evals.retrieval_benchmark --rerankers none lexical --k 2 4 8
+    python -m src.evals.retrieval_benchmark --output new.json --compare results.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+from langchain.schema import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+
+from src.rbi_nbfc_chatbot.chains.reranker import RERANKERS, create_reranker
+from src.rbi_nbfc_chatbot.chains.retriever import RETRIEVAL_MODES, DocumentRetriever
+from src.rbi_nbfc_chatbot.config import (
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    CHUNK_STRATEGY,
+    RERANK_CANDIDATES,
+    RERANKER,
+    RETRIEVAL_FETCH_K,
+    RETRIEVAL_MERGE_ADJACENT,
+    RETRIEVAL_RRF_K,
+)
+from src.rbi_nbfc_chatbot.faq_samples import RBI_FAQ_SAMPLES
+from src.rbi_nbfc_chatbot.utils.bm25 import BM25Index
+from src.rbi_nbfc_chatbot.utils.document_loader import CHUNK_STRATEGIES, load_pdf, split_documents
+from src.rbi_nbfc_chatbot.utils.faiss_index import INDEX_TYPES, build_faiss_index, configure_search
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+# Fields identifying a configuration, for matching runs against a baseline
+CONFIG_KEYS = ("chunk_strategy", "chunk_size", "chunk_overlap", "index_type", "mode", "merge_adjacent", "reranker", "k")
+
+
+def label_relevant_pages(pages: Sequence[Document], answers: Sequence[str], top_n: int = 3) -> List[Set[int]]:
+    """
+    Pages most relevant to each expected answer, by BM25 over page text.
+
+    Args:
+        pages: One Document per PDF page, with a "page" metadata field
+        answers: Expected answer for each question
+        top_n: Pages labelled relevant per answer
+
+    Returns:
+        The relevant page numbers for each answer
+    """
+    bm25 = BM25Index.build([page.page_content for page in pages])
+    return [{pages[row].metadata["page"] for row, _ in bm25.search(answer, top_n)} for answer in answers]
+
+
+def recall_at_k(retrieved_pages: Sequence[int], relevant: Set[int], k: int) -> float:
+    """Fraction of relevant pages covered by the top-k retrieved chunks."""
+    if not relevant:
+        return 0.0
+    return len(set(retrieved_pages[:k]) & relevant) / len(relevant)
+
+
+def reciprocal_rank(retrieved_pages: Sequence[int], relevant: Set[int]) -> float:
+    """1 / rank of the first retrieved chunk from a relevant page (0 if none)."""
+    for rank, page in enumerate(retrieved_pages, start=1):
+        if page in relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def latency_percentiles(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99 of per-query latencies, in milliseconds."""
+    values = np.asarray(latencies_ms, dtype=np.float64)
+    return {f"p{p}": round(float(np.percentile(values, p)), 3) for p in (50, 95, 99)}
+
+
+def build_retriever(
+    chunks: List[Document],
+    vectors: np.ndarray,
+    embeddings: HashingEmbeddings,
+    index_type: str,
+    mode: str,
+    bm25: Optional[BM25Index] = None,
+    merge_adjacent: bool = RETRIEVAL_MERGE_ADJACENT,
+    reranker: str = "none"
+) -> DocumentRetriever:
+    """Retriever over pre-embedded chunks, built the way ingestion builds the index."""
+    index = build_faiss_index(vectors, index_type)
+    configure_search(index)
+    vectorstore = FAISS(
+        embeddings,
+        index,
+        InMemoryDocstore({str(i): chunk for i, chunk in enumerate(chunks)}),
+        {i: str(i) for i in range(len(chunks))},
+    )
+    return DocumentRetriever(
+        vectorstore=vectorstore,
+        bm25=bm25 if mode != "dense" else None,
+        mode=mode,
+        fetch_k=RETRIEVAL_FETCH_K,
+        rrf_k=RETRIEVAL_RRF_K,
+        merge_adjacent=merge_adjacent,
+        reranker=create_reranker(reranker, bm25=bm25),
+        rerank_candidates=RERANK_CANDIDATES,
+    )
+
+
+def evaluate(
+    retriever: DocumentRetriever,
+    questions: Sequence[str],
+    relevant: Sequence[Set[int]],
+    k: int
+) -> Dict[str, Any]:
+    """Recall@k, MRR, mean retrieved characters and latency percentiles of one retriever."""
+    recalls, ranks, sizes, latencies = [], [], [], []
+    for question, relevant_pages in zip(questions, relevant):
+        start = time.perf_counter()
+        docs = retriever.retrieve(question, k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        pages = [doc.metadata["page"] for doc in docs]
+        sizes.append(sum(len(doc.page_content) for doc in docs))
+        recalls.append(recall_at_k(pages, relevant_pages, k))
+        ranks.append(reciprocal_rank(pages, relevant_pages))
+    return {
+        "recall_at_k": round(float(np.mean(recalls)), 4),
+        "mrr": round(float(np.mean(ranks)), 4),
+        "context_chars": round(float(np.mean(sizes)), 1),
+        "latency_ms": latency_percentiles(latencies),
+    }
+
+
+def run_benchmark(
+    pages: List[Document],
+    samples: Sequence[Dict[str, str]],
+    chunk_sizes: Sequence[int],
+    ks: Sequence[int],
+    index_types: Sequence[str],
+    modes: Sequence[str],
+    overlap_ratio: float = CHUNK_OVERLAP / CHUNK_SIZE,
+    relevant_pages: int = 3,
+    embeddings: Optional[HashingEmbeddings] = None,
+    merge_adjacent: bool = RETRIEVAL_MERGE_ADJACENT,
+    strategies: Sequence[str] = (CHUNK_STRATEGY,),
+    rerankers: Sequence[str] = (RERANKER,)
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark every combination of the given settings.
+
+    Each strategy and chunk size is split and embedded once; each index
+    type is built once per split.
+
+    Args:
+        pages: One Document per PDF page
+        samples: FAQ samples with "question" and "answer"
+        chunk_sizes: Chunk sizes to split the pages with
+        ks: Numbers of chunks to retrieve
+        index_types: FAISS index types (see `INDEX_TYPES`)
+        modes: Retrieval modes (see `RETRIEVAL_MODES`)
+        overlap_ratio: Chunk overlap as a fraction of the chunk size
+        relevant_pages: Pages labelled relevant per question
+        embeddings: Local embedding model (default: HashingEmbeddings)
+        merge_adjacent: Merge overlapping chunks into passages (default: from config)
+        strategies: Chunking strategies (see `split_documents`; default: from config)
+        rerankers: Rerankers, "none" for first-stage ranking only (default: from config)
+
+    Returns:
+        One result dictionary per configuration
+    """
+    embeddings = embeddings or HashingEmbeddings()
+    questions = [sample["question"] for sample in samples]
+    relevant = label_relevant_pages(pages, [sample["answer"] for sample in samples], relevant_pages)
+
+    results = []
+    for strategy, chunk_size in ((strategy, size) for strategy in strategies for size in chunk_sizes):
+        chunk_overlap = int(chunk_size * overlap_ratio)
+        chunks = split_documents(pages, chunk_size=chunk_size, chunk_overlap=chunk_overlap, strategy=strategy)
+        texts = [chunk.page_content for chunk in chunks]
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        needs_bm25 = any(mode != "dense" for mode in modes) or "lexical" in rerankers
+        bm25 = BM25Index.build(texts) if needs_bm25 else None
+
+        for index_type in index_types:
+            for mode, reranker in ((mode, reranker) for mode in modes for reranker in rerankers):
+                retriever = build_retriever(
+                    chunks, vectors, embeddings, index_type, mode, bm25, merge_adjacent, reranker
+                )
+                for k in ks:
+                    results.append({
+                        "chunk_strategy": strategy,
+                        "chunk_size": chunk_size,
+                        "chunk_overlap": chunk_overlap,
+                        "index_type": index_type,
+                        "mode": mode,
+                        "merge_adjacent": merge_adjacent,
+                        "reranker": reranker,
+                        "k": k,
+                        "num_chunks": len(chunks),
+                        **evaluate(retriever, questions, relevant, k),
+                    })
+    return results
+
+
+def compare(results: Sequence[Dict[str, Any]], baseline: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Differences from a baseline run, for configurations present in both.
+
+    Returns:
+        One dictionary per configuration with its fields and the change in
+        recall@k, MRR and p95 latency (new minus baseline)
+    """
+    previous = {tuple(result.get(key) for key in CONFIG_KEYS): result for result in baseline}
+    deltas = []
+    for result in results:
+        old = previous.get(tuple(result.get(key) for key in CONFIG_KEYS))
+        if old is None:
+            continue
+        deltas.append({
+            **{key: result.get(key) for key in CONFIG_KEYS},
+            "recall_at_k": round(result["recall_at_k"] - old["recall_at_k"], 4),
+            "mrr": round(result["mrr"] - old["mrr"], 4),
+            "p95_ms": round(result["latency_ms"]["p95"] - old["latency_ms"]["p95"], 3),
+        })
+    return deltas
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _label(result: Dict[str, Any]) -> str:
+    return (
+        f"{result.get('chunk_strategy', '-'):<10} {result['chunk_size']:>6} {result['index_type']:<9} "
+        f"{result['mode']:<8} {result.get('reranker', 'none'):<13} {result['k']:>3}"
+    )
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Offline retrieval benchmark on the RBI NBFC FAQ")
+    parser.add_argument("--pdf", help="PDF to chunk (default: the bundled Master Direction)")
+    parser.add_argument("--pdf-backend", help="PDF text extraction backend (default: from config)")
+    parser.add_argument("--strategies", nargs="+", choices=CHUNK_STRATEGIES, default=[CHUNK_STRATEGY])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[CHUNK_SIZE])
+    parser.add_argument("--overlap-ratio", type=float, default=CHUNK_OVERLAP / CHUNK_SIZE)
+    parser.add_argument("--k", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--index-types", nargs="+", choices=INDEX_TYPES, default=["flat", "hnsw"])
+    parser.add_argument("--modes", nargs="+", choices=RETRIEVAL_MODES, default=list(RETRIEVAL_MODES))
+    parser.add_argument("--rerankers", nargs="+", choices=["none", *RERANKERS], default=[RERANKER])
+    parser.add_argument("--no-merge", action="store_true", help="do not merge overlapping chunks into passages")
+    parser.add_argument("--relevant-pages", type=int, default=3, help="pages labelled relevant per question")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to report changes against")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("RBI NBFC FAQ Retrieval Benchmark")
+    print("=" * 80)
+
+    pages = load_pdf(args.pdf, backend=args.pdf_backend)
+    print(f"\n📄 {len(pages)} pages, {len(RBI_FAQ_SAMPLES)} questions, local hashing embeddings\n")
+
+    results = run_benchmark(
+        pages,
+        RBI_FAQ_SAMPLES,
+        chunk_sizes=args.chunk_sizes,
+        ks=args.k,
+        index_types=args.index_types,
+        modes=args.modes,
+        overlap_ratio=args.overlap_ratio,
+        relevant_pages=args.relevant_pages,
+        merge_adjacent=RETRIEVAL_MERGE_ADJACENT and not args.no_merge,
+        strategies=args.strategies,
+        rerankers=args.rerankers,
+    )
+
+    print(
+        f"{'strategy':<10} {'chunk':>6} {'index':<9} {'mode':<8} {'reranker':<13} {'k':>3} {'recall':>7} {'mrr':>6} "
+        f"{'chars':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    for result in results:
+        latency = result["latency_ms"]
+        print(
+            f"{_label(result)} {result['recall_at_k']:>7.3f} {result['mrr']:>6.3f} {result['context_chars']:>6.0f} "
+            f"{latency['p50']:>8.3f} {latency['p95']:>8.3f} {latency['p99']:>8.3f}"
+        )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        deltas = compare(results, baseline["results"])
+        print(f"\n📊 Change vs {args.compare} (commit {baseline.get('commit') or 'unknown'}):")
+        print(
+            f"{'strategy':<10} {'chunk':>6} {'index':<9} {'mode':<8} {'reranker':<13} {'k':>3} "
+            f"{'recall':>7} {'mrr':>7} {'p95 ms':>8}"
+        )
+        for delta in deltas:
+            print(f"{_label(delta)} {delta['recall_at_k']:>+7.3f} {delta['mrr']:>+7.3f} {delta['p95_ms']:>+8.3f}")
+
+    if args.output:
+        report = {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(),
+            "dataset": "rbi-nbfc-faq",
+            "num_questions": len(RBI_FAQ_SAMPLES),
+            "embeddings": "hashing-768",
+            "relevant_pages": args.relevant_pages,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,47 @@
 """FastAPI server for RBI NBFC Chatbot."""
 
+import asyncio
+import copy
+import hmac
+import json
+import os
+import re
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
-from ..chains import RAGChain, build_rag_chain
-from ..config import API_HOST, API_PORT, GEMINI_MODEL
+from ..chains import ChainPool, RAGChain, build_rag_chain
+from ..chains.cache import normalize_question
+from ..config import (
+    ADMIN_TOKEN,
+    API_HOST,
+    API_PORT,
+    DOCUMENTS_DIR,
+    GEMINI_MODEL,
+    INGEST_MAX_UPLOAD_MB,
+    INGEST_UPLOAD_DIR,
+    REQUEST_COALESCING_ENABLED,
+    SNAPSHOT_WATCH_INTERVAL,
+    VECTOR_STORE_SNAPSHOTS,
+    VECTOR_STORE_SNAPSHOTS_DIR,
+)
+from ..utils.ingest_jobs import IngestJobQueue
+from ..utils.metrics import PIPELINE_METRICS
+from ..utils.snapshots import list_snapshots, publish_snapshot, resolve_index_path, snapshot_path
+
+# Larger batches (e.g. nightly checklists) should use scripts/ask_batch.py
+MAX_BATCH_QUESTIONS = 100
+# Bounds on per-request chain settings
+MAX_REQUEST_K = 20
+MAX_TEMPERATURE = 2.0
+# Uploaded file names: a plain name ending in .pdf
+_UPLOAD_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._ -]*\.pdf$", re.IGNORECASE)
 
 
 @asynccontextmanager
@@ -19,6 +50,8 @@ async def lifespan(app: FastAPI):
 
     Replaces deprecated @app.on_event("startup") while keeping the same behavior:
     attempt to initialize the RAG chain at startup, but fall back to lazy init.
+    With snapshots enabled, also watches for newly published snapshots and
+    hot-swaps them in (see `reload_rag_chain`).
     """
     print("=" * 70)
     print("🚀 RBI NBFC Chatbot API Starting...")
@@ -31,15 +64,39 @@ async def lifespan(app: FastAPI):
         print(f"⚠️  Warning: Could not initialize chatbot on startup: {e}")
         print("   Chatbot will be initialized on first request.")
 
+    try:
+        # Resumes ingestion jobs interrupted by the last shutdown
+        get_ingest_queue()
+    except Exception as e:
+        print(f"⚠️  Warning: Could not start the ingestion job queue: {e}")
+
     print("=" * 70)
     print("📡 API Endpoints:")
     print("   GET  /          - API information")
     print("   GET  /health    - Health check")
     print("   POST /ask       - Ask a question")
+    print("   POST /ask/stream - Ask a question (Server-Sent Events)")
+    print("   POST /ask/batch - Ask many questions at once")
+    print("   GET  /cache/stats - Answer cache hit/miss counters")
+    print("   GET  /metrics   - Pipeline stage latencies (Prometheus)")
+    print("   GET  /admin/snapshots - Vector store snapshots")
+    print("   POST /admin/reload - Load a vector store snapshot without downtime")
+    print("   POST /ingest    - Ingest PDFs in the background")
+    print("   POST /ingest/upload - Upload a PDF and ingest it")
+    print("   GET  /ingest/{job_id} - Ingestion job progress")
     print("   GET  /docs      - Interactive API documentation")
     print("=" * 70)
 
-    yield
+    watcher = None
+    if VECTOR_STORE_SNAPSHOTS and SNAPSHOT_WATCH_INTERVAL > 0:
+        watcher = asyncio.create_task(_watch_snapshots(SNAPSHOT_WATCH_INTERVAL))
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        if _ingest_queue is not None:
+            _ingest_queue.shutdown()
 
 
 # Initialize FastAPI app
@@ -66,6 +123,11 @@ class QuestionRequest(BaseModel):
     """Request model for asking questions."""
     question: str
     max_sources: Optional[int] = 4
+    include_timings: bool = False
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    k: Optional[int] = None
+    max_context_tokens: Optional[int] = None
 
 class QuestionResponse(BaseModel):
     """Response model for answers."""
@@ -75,23 +137,340 @@ class QuestionResponse(BaseModel):
     timestamp: str
     model: str
     processing_time_ms: float
+    cached: bool = False
+    coalesced: bool = False
+    faq_match: Optional[Dict[str, Any]] = None
+    timings: Optional[Dict[str, Any]] = None
+
+class BatchQuestionRequest(BaseModel):
+    """Request model for answering several questions at once."""
+    questions: List[str]
+    max_sources: Optional[int] = 4
+    concurrency: Optional[int] = None
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    k: Optional[int] = None
+    max_context_tokens: Optional[int] = None
+
+class BatchAnswer(BaseModel):
+    """One answer within a batch response."""
+    question: str
+    answer: str
+    sources: List[Dict[str, Any]]
+    model: str
+    cached: bool = False
+    faq_match: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class ReloadRequest(BaseModel):
+    """Request model for reloading the vector store."""
+    snapshot: Optional[str] = None  # Publish this snapshot first (default: reload the current one)
+    wait: bool = False  # Respond after the new index is serving instead of with 202
+
+
+class IngestRequest(BaseModel):
+    """Request model for an ingestion job."""
+    paths: List[str]  # PDF files, directories or globs under the documents directory
+    mode: str = "add"  # "add" to the current corpus, or "replace" it
+
+
+class BatchQuestionResponse(BaseModel):
+    """Response model for batch answers, in request order."""
+    results: List[BatchAnswer]
+    timestamp: str
+    processing_time_ms: float
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+    
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task instead of starting their own. The
+    task is shielded, so a caller disconnecting does not cancel it for the
+    others. Each caller gets its own copy of the result.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run `func` unless a call for `key` is already in flight.
+        
+        Args:
+            key: Deduplication key
+            func: Coroutine function producing the result
+        
+        Returns:
+            (result, coalesced) where `coalesced` is True if this caller
+            shared another caller's execution.
+        """
+        task = self._in_flight.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result), coalesced
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
+
 
 # Global RAG chain (lazy loaded)
 _rag_chain: Optional[RAGChain] = None
+# Chains for per-request model/temperature/k, sharing the global chain's index
+_chain_pool: Optional[ChainPool] = None
+
+# Concurrent /ask requests for the same normalized question share one run
+_single_flight = SingleFlight()
+
+# The vector store the global chain serves, and the state of reloads
+_index_status: Dict[str, Any] = {
+    "index_path": None,
+    "snapshot": None,
+    "loaded_at": None,
+    "reloading": False,
+    "last_error": None,
+}
+# Serializes reloads; created lazily inside the running event loop
+_reload_lock: Optional[asyncio.Lock] = None
+# Background reloads started by /admin/reload (kept so they are not garbage collected)
+_reload_tasks: set = set()
+
+# Ingestion jobs (lazy loaded; resumes unfinished jobs when created)
+_ingest_queue: Optional[IngestJobQueue] = None
+
+
+def _set_rag_chain(rag_chain: RAGChain) -> None:
+    """Make `rag_chain` the global chain and record the index it serves."""
+    global _rag_chain
+
+    index_path = rag_chain.index_path
+    snapshots_dir = os.path.abspath(VECTOR_STORE_SNAPSHOTS_DIR)
+    in_snapshots = index_path and os.path.dirname(os.path.abspath(index_path)) == snapshots_dir
+    _index_status.update(
+        index_path=index_path,
+        snapshot=os.path.basename(index_path) if in_snapshots else None,
+        loaded_at=datetime.now().isoformat(),
+        last_error=None,
+    )
+    # A single reference assignment: requests that already hold the old
+    # chain finish on it, new requests get this one
+    _rag_chain = rag_chain
 
 
 def get_rag_chain() -> RAGChain:
     """Get or initialize the RAG chain."""
-    global _rag_chain
-
     if _rag_chain is None:
         print("🔄 Initializing RAG chain...")
-        _rag_chain = build_rag_chain()
+        _set_rag_chain(build_rag_chain())
         print("✅ RAG chain initialized!")
 
     return _rag_chain
 
 
+async def reload_rag_chain(index_path: Optional[str] = None) -> RAGChain:
+    """
+    Build a chain over a vector store in the background and swap it in.
+    
+    The index, BM25 and FAQ files are loaded in a worker thread while the
+    current chain keeps serving. Requests in flight finish on the chain
+    they started with; the chain pool and answer cache follow the new
+    chain (the cache is keyed by index version).
+    
+    Args:
+        index_path: Vector store directory (default: the current snapshot)
+    
+    Returns:
+        The new global chain
+    
+    Raises:
+        Exception: Whatever building the chain raised; the old chain keeps serving
+    """
+    global _reload_lock
+
+    if _reload_lock is None:
+        _reload_lock = asyncio.Lock()
+    async with _reload_lock:
+        index_path = resolve_index_path(index_path)
+        _index_status["reloading"] = True
+        try:
+            print(f"🔄 Loading vector store {index_path}...")
+            rag_chain = await asyncio.to_thread(build_rag_chain, index_path=index_path)
+        except Exception as e:
+            _index_status["last_error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _index_status["reloading"] = False
+        _set_rag_chain(rag_chain)
+        print(f"✅ Now serving {index_path}")
+        return rag_chain
+
+
+async def _watch_snapshots(interval: float) -> None:
+    """Reload whenever a different snapshot is published (polls `CURRENT`)."""
+    failed_path = None
+    while True:
+        await asyncio.sleep(interval)
+        if _rag_chain is None or (_reload_lock is not None and _reload_lock.locked()):
+            continue
+        index_path = resolve_index_path()
+        if index_path in (_rag_chain.index_path, failed_path):
+            continue
+        try:
+            await reload_rag_chain(index_path)
+        except Exception as e:
+            # Do not retry a broken snapshot every interval; wait for the next one
+            failed_path = index_path
+            print(f"⚠️  Could not load vector store snapshot {index_path}: {e}")
+
+
+def get_ingest_queue() -> IngestJobQueue:
+    """Get or create the ingestion job queue (call from the event loop)."""
+    global _ingest_queue
+
+    if _ingest_queue is None:
+        loop = asyncio.get_running_loop()
+
+        def on_success(job: Dict[str, Any]) -> None:
+            # Serve the new index now rather than at the next watcher poll; a
+            # failed reload is reported in /health (retrieving it here keeps it quiet)
+            future = asyncio.run_coroutine_threadsafe(reload_rag_chain(job["index_path"]), loop)
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        _ingest_queue = IngestJobQueue(on_success=on_success)
+    return _ingest_queue
+
+
+def _ingest_path(path: str) -> str:
+    """
+    Resolve a client path against the documents directory.
+    
+    Raises:
+        HTTPException: 400 if the path leads outside the documents or upload directory
+    """
+    resolved = os.path.realpath(os.path.join(str(DOCUMENTS_DIR), path))
+    for allowed in (str(DOCUMENTS_DIR), INGEST_UPLOAD_DIR):
+        allowed = os.path.realpath(allowed)
+        if os.path.commonpath([resolved, allowed]) == allowed:
+            return resolved
+    raise HTTPException(status_code=400, detail=f"Path '{path}' is outside the documents directory")
+
+
+def _submit_ingest_job(paths: List[str], mode: str) -> JSONResponse:
+    """Queue an ingestion job and answer 202 with it."""
+    try:
+        job = get_ingest_queue().submit(paths, mode=mode)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return JSONResponse(status_code=202, content=job)
+
+
+def _check_admin_token(token: Optional[str]) -> None:
+    """
+    Reject admin requests unless they carry the configured ADMIN_TOKEN.
+
+    Fails closed: without an ADMIN_TOKEN the admin and ingestion endpoints
+    are disabled (503) rather than open to anyone.
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=503, detail="Admin endpoints are disabled: set ADMIN_TOKEN to enable them")
+    if not isinstance(token, str) or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Token")
+
+
+def _check_ingestion_enabled() -> None:
+    """
+    Reject API ingestion (409) unless vector-store snapshots are enabled.
+
+    Ingestion jobs publish new snapshots; without snapshots the server
+    serves a store that ingestion would have to rewrite in place.
+    """
+    if not VECTOR_STORE_SNAPSHOTS:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                "API ingestion needs VECTOR_STORE_SNAPSHOTS=true; "
+                "rebuild the store offline (python -m src.rbi_nbfc_chatbot.utils.ingest) instead"
+            ),
+        )
+
+
+def _check_chain_settings(request: Any) -> None:
+    """Reject out-of-range per-request model settings with a 400."""
+    if request.k is not None and not 1 <= request.k <= MAX_REQUEST_K:
+        raise HTTPException(status_code=400, detail=f"k must be between 1 and {MAX_REQUEST_K}")
+    if request.temperature is not None and not 0 <= request.temperature <= MAX_TEMPERATURE:
+        raise HTTPException(status_code=400, detail=f"temperature must be between 0 and {MAX_TEMPERATURE}")
+    if request.model is not None and not request.model.strip():
+        raise HTTPException(status_code=400, detail="model must not be empty")
+    if request.max_context_tokens is not None and request.max_context_tokens < 0:
+        raise HTTPException(status_code=400, detail="max_context_tokens must not be negative")
+
+
+def get_chain(model: Optional[str] = None, temperature: Optional[float] = None) -> RAGChain:
+    """
+    Get the chain for per-request model settings.
+    
+    Requests without settings use the global chain; others get a pooled
+    chain sharing its index and clients.
+    """
+    global _chain_pool
+
+    rag_chain = get_rag_chain()
+    if model is None and temperature is None:
+        return rag_chain
+    if _chain_pool is None or _chain_pool.base is not rag_chain:
+        _chain_pool = ChainPool(rag_chain)
+    return _chain_pool.get(model_name=model and model.strip(), temperature=temperature)
+
+
+def _retrieval_k(request: Any, rag_chain: RAGChain) -> Optional[int]:
+    """
+    Retrieval depth for a request.
+    
+    An explicit `k` wins. Otherwise a `max_sources` below the chain's k is
+    used as the depth, so the model does not read chunks the client would
+    not be shown; a larger `max_sources` never deepens retrieval.
+    """
+    if request.k is not None:
+        return request.k
+    if request.max_sources and 0 < request.max_sources < rag_chain.retrieval_k:
+        return request.max_sources
+    return None
+
+
+def _format_sources(sources: List[Dict[str, Any]], max_sources: Optional[int]) -> List[Dict[str, Any]]:
+    """Limit and truncate chain sources for API responses."""
+    return [
+        {
+            "chunk_id": i + 1,
+            "content": src["content"][:300] + "..." if len(src["content"]) > 300 else src["content"],
+            "page": src["page"],
+            "source": src.get("source", "RBI Master Direction")
+        }
+        for i, src in enumerate(sources[:max_sources])
+    ]
+
+
+def _sse(event: str, data: Any) -> str:
+    """Encode a single Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -104,6 +483,15 @@ async def root():
             "/": "API information (this page)",
             "/health": "Health check",
             "/ask": "Ask a question (POST)",
+            "/ask/stream": "Ask a question, streaming sources and answer tokens as Server-Sent Events (POST)",
+            "/ask/batch": f"Ask up to {MAX_BATCH_QUESTIONS} questions at once (POST)",
+            "/cache/stats": "Answer cache hit/miss counters",
+            "/metrics": "Per-stage latency and token histograms in Prometheus text format",
+            "/admin/snapshots": "Vector store snapshots and the one being served",
+            "/admin/reload": "Load a vector store snapshot without dropping requests (POST)",
+            "/ingest": "Ingest PDFs under the documents directory in the background (POST); list jobs (GET)",
+            "/ingest/upload": "Upload a PDF and ingest it in the background (POST, body: the PDF)",
+            "/ingest/{job_id}": "Ingestion job status and progress",
             "/docs": "Interactive API documentation",
             "/redoc": "Alternative API documentation"
         },
@@ -127,9 +515,171 @@ async def health_check():
         "chatbot_initialized": _rag_chain is not None,
         "model": GEMINI_MODEL,
         "provider": "google",
+        "request_coalescing": {"enabled": REQUEST_COALESCING_ENABLED, **_single_flight.stats()},
+        "chain_pool": _chain_pool.stats() if _chain_pool is not None else {"chains": 0},
+        "faq_answers": _rag_chain.faq.stats() if _rag_chain is not None and _rag_chain.faq is not None else None,
+        "index": dict(_index_status),
+        "ingest_jobs": _ingest_queue.stats() if _ingest_queue is not None else None,
+    }
+
+
+@app.get("/admin/snapshots")
+async def admin_snapshots(x_admin_token: Optional[str] = Header(None)):
+    """Vector store snapshots (oldest first) and the index being served."""
+    _check_admin_token(x_admin_token)
+    return {
+        "serving": _index_status["index_path"],
+        "snapshots": await asyncio.to_thread(list_snapshots),
     }
 
 
+@app.post("/admin/reload")
+async def admin_reload(request: ReloadRequest, x_admin_token: Optional[str] = Header(None)):
+    """
+    Swap a vector store snapshot into the running server.
+    
+    With `snapshot`, that snapshot is published first (also a rollback:
+    publish an older one); other servers watching the snapshot directory
+    follow within SNAPSHOT_WATCH_INTERVAL seconds. The new index is loaded
+    in the background while the current one keeps serving; requests in
+    flight are never dropped. Responds 202 immediately unless `wait` is set.
+    """
+    _check_admin_token(x_admin_token)
+    if request.snapshot is not None:
+        try:
+            publish_snapshot(request.snapshot)
+        except (ValueError, FileNotFoundError) as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        index_path = snapshot_path(request.snapshot)
+    else:
+        index_path = resolve_index_path()
+
+    if request.wait:
+        try:
+            await reload_rag_chain(index_path)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Reload failed, still serving the previous index: {e}") from e
+        return {"status": "reloaded", **_index_status}
+
+    async def reload():
+        try:
+            await reload_rag_chain(index_path)
+        except Exception as e:
+            print(f"⚠️  Reload of {index_path} failed: {e}")
+
+    task = asyncio.create_task(reload())
+    _reload_tasks.add(task)
+    task.add_done_callback(_reload_tasks.discard)
+    return JSONResponse(status_code=202, content={"status": "reloading", "index_path": index_path})
+
+
+@app.post("/ingest")
+async def ingest(request: IngestRequest, x_admin_token: Optional[str] = Header(None)):
+    """
+    Ingest PDFs already on the server in the background.
+    
+    Paths (files, directories or globs) are relative to the documents
+    directory. With mode "add" the PDFs join the corpus of the current
+    vector store; only their chunks are embedded. The new snapshot is
+    published and served when the job succeeds. Responds 202 with the job;
+    poll `GET /ingest/{job_id}` for progress.
+    
+    Example request:
+    ```json
+    {"paths": ["circulars/2024-25/*.pdf"], "mode": "add"}
+    ```
+    """
+    _check_admin_token(x_admin_token)
+    _check_ingestion_enabled()
+    return _submit_ingest_job([_ingest_path(path) for path in request.paths], request.mode)
+
+
+@app.post("/ingest/upload")
+async def ingest_upload(
+    request: Request,
+    filename: str,
+    mode: str = "add",
+    x_admin_token: Optional[str] = Header(None)
+):
+    """
+    Upload a PDF into the upload directory and ingest it in the background.
+    
+    The request body is the PDF itself (no multipart encoding); a file with
+    the same name replaces the earlier upload.
+    
+    Example:
+    ```
+    curl -X POST "http://localhost:8000/ingest/upload?filename=circular.pdf" \\
+         -H "X-Admin-Token: $ADMIN_TOKEN" -H "Content-Type: application/pdf" \\
+         --data-binary @circular.pdf
+    ```
+    """
+    _check_admin_token(x_admin_token)
+    _check_ingestion_enabled()
+    if not _UPLOAD_NAME_RE.match(filename):
+        raise HTTPException(status_code=400, detail="filename must be a plain file name ending in .pdf")
+
+    os.makedirs(INGEST_UPLOAD_DIR, exist_ok=True)
+    path = os.path.join(INGEST_UPLOAD_DIR, filename)
+    tmp_path = path + ".upload"
+    max_bytes = int(INGEST_MAX_UPLOAD_MB * 1024 * 1024)
+    size = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(status_code=413, detail=f"Upload exceeds {INGEST_MAX_UPLOAD_MB:g} MB")
+                f.write(chunk)
+        with open(tmp_path, "rb") as f:
+            if f.read(5) != b"%PDF-":
+                raise HTTPException(status_code=400, detail="Upload is not a PDF")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return _submit_ingest_job([path], mode)
+
+
+@app.get("/ingest")
+async def ingest_jobs(x_admin_token: Optional[str] = Header(None)):
+    """Most recent ingestion jobs, newest first."""
+    _check_admin_token(x_admin_token)
+    return {"jobs": get_ingest_queue().list_jobs()}
+
+
+@app.get("/ingest/{job_id}")
+async def ingest_job(job_id: str, x_admin_token: Optional[str] = Header(None)):
+    """
+    Status and progress of an ingestion job.
+    
+    `progress` reports the stage (queued, parsing, waiting, building,
+    embedding, indexing, done), files and pages parsed, chunks embedded of
+    those to embed, and `eta_seconds` for the current stage.
+    """
+    _check_admin_token(x_admin_token)
+    job = get_ingest_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Ingestion job '{job_id}' not found")
+    return job
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Answer cache counters, for tuning the semantic similarity threshold."""
+    cache = _rag_chain.cache if _rag_chain is not None else None
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Per-stage latency and LLM token histograms, in Prometheus text format."""
+    return PlainTextResponse(PIPELINE_METRICS.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/ask", response_model=QuestionResponse)
 async def ask_question(request: QuestionRequest):
     """
@@ -140,6 +690,23 @@ async def ask_question(request: QuestionRequest):
     2. Generate accurate answers using Google Gemini
     3. Provide source attribution
     
+    Concurrent requests for the same question (after normalization) share
+    one retrieval and Gemini call; responses served this way have
+    `coalesced` set.
+    
+    Questions matching a curated RBI FAQ question return its answer and
+    supporting chunks without a Gemini call; `faq_match` then names the
+    matched FAQ question and its similarity.
+    
+    Set `include_timings` to get milliseconds per pipeline stage (embed,
+    search, context, llm_first_token, llm_total, ...) and LLM token counts
+    in `timings`.
+    
+    `model`, `temperature`, `k` and `max_context_tokens` override the server
+    defaults for this request, against one loaded index. Without `k`, a
+    `max_sources` below the default k is used as the retrieval depth, so
+    fewer chunks are sent to Gemini.
+    
     Example request:
     ```json
     {
@@ -161,27 +728,36 @@ async def ask_question(request: QuestionRequest):
     ```
     """
     start_time = time.time()
+    _check_chain_settings(request)
 
     try:
         # Get RAG chain
-        rag_chain = get_rag_chain()
-
-        # Process question
-        response = rag_chain.ask_question(request.question, return_sources=True)
-
-        # Limit sources to requested amount
-        sources = response.get("sources", [])[:request.max_sources]
-
-        # Format sources for API response
-        formatted_sources = [
-            {
-                "chunk_id": i + 1,
-                "content": src["content"][:300] + "..." if len(src["content"]) > 300 else src["content"],
-                "page": src["page"],
-                "source": src.get("source", "RBI Master Direction")
-            }
-            for i, src in enumerate(sources)
-        ]
+        rag_chain = get_chain(request.model, request.temperature)
+        k = _retrieval_k(request, rag_chain)
+
+        def ask():
+            return rag_chain.aask_question(
+                request.question,
+                return_sources=True,
+                return_timings=True,
+                k=k,
+                max_context_tokens=request.max_context_tokens,
+            )
+
+        # Process question without blocking the event loop, sharing the
+        # run with any identical question (and settings) already in flight
+        coalesced = False
+        if REQUEST_COALESCING_ENABLED:
+            settings = (
+                f"{rag_chain.index_path}|{rag_chain.model_name}|{rag_chain.temperature}"
+                f"|{k}|{request.max_context_tokens}"
+            )
+            response, coalesced = await _single_flight.do(f"{settings}|{normalize_question(request.question)}", ask)
+        else:
+            response = await ask()
+
+        # Limit and format sources for API response
+        formatted_sources = _format_sources(response.get("sources", []), request.max_sources)
 
         # Calculate processing time
         processing_time = (time.time() - start_time) * 1000
@@ -192,7 +768,11 @@ async def ask_question(request: QuestionRequest):
             sources=formatted_sources,
             timestamp=datetime.now().isoformat(),
             model=response["model"],
-            processing_time_ms=round(processing_time, 2)
+            processing_time_ms=round(processing_time, 2),
+            cached=response.get("cached", False),
+            coalesced=coalesced,
+            faq_match=response.get("faq_match"),
+            timings=response.get("timings") if request.include_timings else None
         )
 
     except FileNotFoundError as e:
@@ -207,6 +787,135 @@ async def ask_question(request: QuestionRequest):
         )
 
 
+@app.post("/ask/stream")
+async def ask_question_stream(request: QuestionRequest):
+    """
+    Ask a question and stream the answer as Server-Sent Events.
+    
+    Events are emitted in this order:
+    - `sources`: the retrieved source excerpts (same shape as `/ask`)
+    - `token`: one event per answer fragment, as generated
+    - `done`: the full answer, model and processing time
+    - `error`: sent instead of the remaining events if generation fails
+    
+    Example:
+    ```
+    curl -N -X POST http://localhost:8000/ask/stream \\
+         -H "Content-Type: application/json" \\
+         -d '{"question": "What is the minimum Net Owned Fund?"}'
+    ```
+    """
+    start_time = time.time()
+    _check_chain_settings(request)
+
+    try:
+        rag_chain = get_chain(request.model, request.temperature)
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Vector store not found. Please run document ingestion first. Error: {str(e)}"
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing question: {str(e)}"
+        ) from e
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            events = rag_chain.astream_question(
+                request.question, k=_retrieval_k(request, rag_chain), max_context_tokens=request.max_context_tokens
+            )
+            async for event in events:
+                data = event["data"]
+                if event["event"] == "sources":
+                    data = _format_sources(data, request.max_sources)
+                elif event["event"] == "done":
+                    data = {
+                        **data,
+                        "timestamp": datetime.now().isoformat(),
+                        "processing_time_ms": round((time.time() - start_time) * 1000, 2),
+                    }
+                yield _sse(event["event"], data)
+        except Exception as e:
+            yield _sse("error", {"detail": f"Error processing question: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/ask/batch", response_model=BatchQuestionResponse)
+async def ask_batch(request: BatchQuestionRequest):
+    """
+    Answer several questions in one request.
+    
+    Query embeddings for all questions are requested in one batched call and
+    answers are generated concurrently (at most `concurrency` at a time).
+    A question whose generation fails gets an `error` message instead of
+    failing the whole batch.
+    
+    Example request:
+    ```json
+    {
+        "questions": [
+            "What is the minimum Net Owned Fund for an NBFC?",
+            "Can NBFCs accept demand deposits?"
+        ],
+        "max_sources": 2
+    }
+    ```
+    """
+    if not request.questions:
+        raise HTTPException(status_code=400, detail="questions must not be empty")
+    if len(request.questions) > MAX_BATCH_QUESTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_QUESTIONS} questions per request; use scripts/ask_batch.py for larger batches"
+        )
+
+    start_time = time.time()
+    _check_chain_settings(request)
+
+    try:
+        rag_chain = get_chain(request.model, request.temperature)
+        responses = await rag_chain.aask_batch(
+            request.questions,
+            concurrency=request.concurrency,
+            k=_retrieval_k(request, rag_chain),
+            max_context_tokens=request.max_context_tokens,
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Vector store not found. Please run document ingestion first. Error: {str(e)}"
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing questions: {str(e)}"
+        ) from e
+
+    return BatchQuestionResponse(
+        results=[
+            BatchAnswer(
+                question=response["question"],
+                answer=response["answer"],
+                sources=_format_sources(response.get("sources", []), request.max_sources),
+                model=response["model"],
+                cached=response.get("cached", False),
+                faq_match=response.get("faq_match"),
+                error=response.get("error"),
+            )
+            for response in responses
+        ],
+        timestamp=datetime.now().isoformat(),
+        processing_time_ms=round((time.time() - start_time) * 1000, 2),
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
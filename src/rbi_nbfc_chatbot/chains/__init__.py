@@ -1,6 +1,7 @@
 """RAG chains package for RBI NBFC Chatbot."""
 
+from .pool import ChainPool
 from .rag_chain import RAGChain, build_rag_chain
-from .retriever import create_retriever
+from .retriever import DocumentRetriever, create_retriever
 
-__all__ = ["build_rag_chain", "RAGChain", "create_retriever"]
+__all__ = ["build_rag_chain", "ChainPool", "RAGChain", "create_retriever", "DocumentRetriever"]
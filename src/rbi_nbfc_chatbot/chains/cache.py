@@ -0,0 +1,325 @@
+"""Answer cache for the RBI NBFC RAG chain.
+
+Compliance users ask the same questions repeatedly. This cache returns a
+stored answer when a question matches a previous one exactly (after
+normalization) or, optionally, when its embedding is within a cosine
+similarity threshold of a cached question. Entries expire by TTL, the cache
+is bounded with LRU eviction, and everything is dropped when the vector store
+changes on disk.
+"""
+
+import copy
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ..config import (
+    ANSWER_CACHE_ENABLED,
+    ANSWER_CACHE_MAX_ENTRIES,
+    ANSWER_CACHE_SIMILARITY_THRESHOLD,
+    ANSWER_CACHE_TTL_SECONDS,
+)
+from ..utils.manifest import MANIFEST_FILENAME
+from ..utils.snapshots import resolve_index_path
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for exact-match lookups.
+
+    Lowercases, collapses whitespace and strips surrounding punctuation so
+    "What is an NBFC?" and "what is an nbfc" share a key.
+    """
+    return _WHITESPACE_RE.sub(" ", question.lower()).strip(" ?.!")
+
+
+@lru_cache(maxsize=16)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    # Keyed by stat, so an unchanged file is hashed once
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def index_version(index_path: Optional[str] = None) -> str:
+    """
+    Return a fingerprint of the vector store on disk.
+
+    Every build writes `manifest.json` after the index, chunk store and BM25
+    files, so a hash of it (with the store's path, which names the snapshot)
+    identifies the whole store. Stores built before manifests fall back to
+    the size and mtime of every file in the directory.
+    """
+    index_path = resolve_index_path(index_path)
+    manifest_path = os.path.join(index_path, MANIFEST_FILENAME)
+    try:
+        stat = os.stat(manifest_path)
+        return f"{index_path}|manifest:{_file_digest(manifest_path, stat.st_size, stat.st_mtime_ns)}"
+    except OSError:
+        pass
+
+    parts = [index_path]
+    try:
+        names = sorted(os.listdir(index_path))
+    except OSError:
+        names = []
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(index_path, name))
+            parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            continue
+    return "|".join(parts)
+
+
+@dataclass
+class _Entry:
+    response: Dict[str, Any]
+    embedding: Optional[np.ndarray]
+    created_at: float
+
+
+class AnswerCache:
+    """
+    Bounded LRU/TTL cache of chain responses keyed by normalized question.
+
+    Thread-safe; the only work done outside the lock is embedding the query
+    for semantic lookups.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 86400.0,
+        similarity_threshold: Optional[float] = None,
+        embeddings: Optional[Embeddings] = None,
+        version: Optional[Callable[[], str]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached answers (least recently used are evicted)
+            ttl_seconds: Seconds before an entry expires (None disables expiry)
+            similarity_threshold: Cosine similarity needed for a semantic hit (None disables)
+            embeddings: Embedding model used for semantic lookups
+            version: Callable returning the current vector-store version; a change clears the cache
+        """
+        if similarity_threshold is not None and embeddings is None:
+            raise ValueError("Semantic caching requires an embeddings model")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.embeddings = embeddings
+        self._version_fn = version
+        self._version = version() if version else None
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def semantic(self) -> bool:
+        return self.similarity_threshold is not None
+
+    def get(self, question: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response for `question`, or None on a miss."""
+        key = normalize_question(question)
+        with self._lock:
+            hit = self._lookup_exact(key)
+        if hit is not None or not self.semantic:
+            return self._finish(question, key, hit, None)
+        embedding = self._normalize(self.embeddings.embed_query(question))
+        return self._finish(question, key, None, embedding)
+
+    async def aget(self, question: str) -> Optional[Dict[str, Any]]:
+        """Async variant of `get` (embeds the query without blocking)."""
+        key = normalize_question(question)
+        with self._lock:
+            hit = self._lookup_exact(key)
+        if hit is not None or not self.semantic:
+            return self._finish(question, key, hit, None)
+        embedding = self._normalize(await self.embeddings.aembed_query(question))
+        return self._finish(question, key, None, embedding)
+
+    def put(self, question: str, response: Dict[str, Any]) -> None:
+        """Store a chain response for `question`."""
+        key = normalize_question(question)
+        with self._lock:
+            embedding = self._pending.pop(key, None)
+        if self.semantic and embedding is None:
+            embedding = self._normalize(self.embeddings.embed_query(question))
+        with self._lock:
+            self._check_version()
+            self._store(key, response, embedding)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and configuration for tuning."""
+        with self._lock:
+            lookups = self.hits + self.semantic_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "similarity_threshold": self.similarity_threshold,
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.semantic_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "version": self._version,
+            }
+
+    # -- internals ---------------------------------------------------------------
+
+    def _finish(
+        self,
+        question: str,
+        key: str,
+        hit: Optional[_Entry],
+        embedding: Optional[np.ndarray]
+    ) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if hit is None and embedding is not None:
+                hit = self._lookup_semantic(embedding)
+                if hit is not None:
+                    self.semantic_hits += 1
+                else:
+                    self._pending[key] = embedding
+                    while len(self._pending) > 64:
+                        self._pending.popitem(last=False)
+            elif hit is not None:
+                self.hits += 1
+            if hit is None:
+                self.misses += 1
+                return None
+            response = copy.deepcopy(hit.response)
+        response["question"] = question
+        return response
+
+    def _lookup_exact(self, key: str) -> Optional[_Entry]:
+        self._check_version()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _lookup_semantic(self, embedding: np.ndarray) -> Optional[_Entry]:
+        if not self._entries:
+            return None
+        if self._matrix is None:
+            self._matrix_keys = [k for k, e in self._entries.items() if e.embedding is not None]
+            if not self._matrix_keys:
+                return None
+            self._matrix = np.stack([self._entries[k].embedding for k in self._matrix_keys])
+        scores = self._matrix @ embedding
+        keys = self._matrix_keys
+        found = None
+        expired = []
+        # Best match first; expired entries are evicted and the next one tried
+        for row in np.argsort(-scores):
+            if float(scores[row]) < self.similarity_threshold:
+                break
+            entry = self._entries[keys[row]]
+            if self._expired(entry):
+                expired.append(keys[row])
+                continue
+            found = keys[row]
+            break
+        for key in expired:
+            self._remove(key)
+        if found is None:
+            return None
+        self._entries.move_to_end(found)
+        return self._entries[found]
+
+    def _store(self, key: str, response: Dict[str, Any], embedding: Optional[np.ndarray]) -> None:
+        self._entries[key] = _Entry(copy.deepcopy(response), embedding, time.monotonic())
+        self._entries.move_to_end(key)
+        self._matrix = None
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._matrix = None
+
+    def _expired(self, entry: _Entry) -> bool:
+        return self.ttl_seconds is not None and time.monotonic() - entry.created_at > self.ttl_seconds
+
+    def _check_version(self) -> None:
+        if self._version_fn is None:
+            return
+        current = self._version_fn()
+        if current != self._version:
+            self._version = current
+            if self._entries:
+                self.invalidations += 1
+            self._clear()
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+        self._matrix = None
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+
+def create_answer_cache(
+    embeddings: Optional[Embeddings] = None,
+    index_path: Optional[str] = None
+) -> Optional[AnswerCache]:
+    """
+    Build an answer cache from config, or return None if caching is disabled.
+
+    Args:
+        embeddings: Embedding model for semantic lookups (semantic matching is
+            skipped if None or no threshold is configured)
+        index_path: FAISS index directory whose version invalidates the cache
+
+    Returns:
+        AnswerCache or None
+    """
+    if not ANSWER_CACHE_ENABLED:
+        return None
+    threshold = ANSWER_CACHE_SIMILARITY_THRESHOLD if embeddings is not None else None
+    return AnswerCache(
+        max_entries=ANSWER_CACHE_MAX_ENTRIES,
+        ttl_seconds=ANSWER_CACHE_TTL_SECONDS,
+        similarity_threshold=threshold,
+        embeddings=embeddings,
+        version=lambda: index_version(index_path),
+    )
@@ -0,0 +1,253 @@
+"""Context assembly with a token budget for the RBI NBFC RAG chain.
+
+The "stuff" approach pastes every retrieved chunk into the prompt in full.
+Chunks are split with a 200-character overlap, so neighbouring chunks repeat
+text, and most sentences of a 1000-character regulatory chunk are unrelated
+to the question. `ContextCompressor` assembles the context in three steps:
+
+1. Overlap removal: text a chunk shares with an already-included chunk
+   (the splitter's overlap, or a chunk contained in another) is dropped.
+2. Sentence selection: sentences are scored against the question with BM25;
+   optionally only sentences sharing a term with the question are kept.
+3. Token budget: if the context is still over `max_tokens`, the
+   highest-scoring sentences are kept until the budget is spent.
+
+Kept sentences stay in retrieval order, so the context reads like the
+original chunks with unrelated sentences removed.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence
+
+from langchain.schema import Document
+
+from ..config import (
+    CONTEXT_COMPRESSION_ENABLED,
+    CONTEXT_MAX_TOKENS,
+    CONTEXT_SENTENCE_FILTER,
+    CONTEXT_TOKEN_ENCODING,
+)
+from ..utils.bm25 import tokenize
+
+# PDF text is hard-wrapped, so sentences are split after whitespace is
+# collapsed: after . ? ! ; followed by a capital, digit or opening bracket
+_SENTENCE_RE = re.compile(r"(?<=[.?!;])\s+(?=[A-Z0-9(\[])")
+# Abbreviations that end with a period but not a sentence ("Rs. 2 crore")
+_ABBREVIATIONS = ("rs.", "no.", "nos.", "viz.", "i.e.", "e.g.", "etc.", "sec.", "para.", "cr.", "vol.", "ltd.", "dt.")
+# Bare paragraph/clause numbers ("39.", "(ii)") belong to the sentence after them
+_NUMBERING_RE = re.compile(r"^\(?(?:\d+(?:\.\d+)*|[ivxlc]+|[a-z])[.)]$", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Shortest shared run of characters treated as chunk overlap
+MIN_OVERLAP_CHARS = 30
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(encoding: Optional[str] = None) -> Callable[[str], int]:
+    """
+    Return a function counting the tokens of a text.
+
+    Uses the tiktoken encoding when it is available locally. tiktoken
+    downloads encodings on first use, so offline machines without a cached
+    copy fall back to an estimate of one token per four characters (close
+    to Gemini's own ratio for English text).
+
+    Args:
+        encoding: tiktoken encoding name (default: from config)
+    """
+    encoding = encoding or CONTEXT_TOKEN_ENCODING
+    try:
+        import tiktoken
+
+        tokenizer = tiktoken.get_encoding(encoding)
+    except Exception as e:
+        print(f"⚠️  tiktoken encoding '{encoding}' unavailable ({type(e).__name__}); estimating tokens from length")
+        return lambda text: (len(text) + 3) // 4
+    return lambda text: len(tokenizer.encode(text, disallowed_special=()))
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split hard-wrapped regulatory text into sentences."""
+    sentences: List[str] = []
+    numbering = ""
+    for piece in _SENTENCE_RE.split(_WHITESPACE_RE.sub(" ", text).strip()):
+        if not piece:
+            continue
+        if _NUMBERING_RE.match(piece):
+            numbering = f"{numbering}{piece} "
+        elif sentences and not numbering and sentences[-1].lower().endswith(_ABBREVIATIONS):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(numbering + piece)
+            numbering = ""
+    return sentences
+
+
+def score_sentences(question: str, sentences: Sequence[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """
+    BM25 score of each sentence for `question`, with sentences as the corpus.
+
+    Only the question's terms are scored, which for a few dozen sentences is
+    much cheaper than building a `BM25Index`.
+    """
+    query = set(tokenize(question))
+    tokenized = [tokenize(sentence) for sentence in sentences]
+    counts = [Counter(token for token in tokens if token in query) for tokens in tokenized]
+    lengths = [len(tokens) for tokens in tokenized]
+    avg_length = (sum(lengths) / len(lengths)) or 1.0
+    n = len(sentences)
+    idf = {
+        term: math.log1p((n - df + 0.5) / (df + 0.5))
+        for term in query
+        for df in [sum(1 for count in counts if term in count)]
+    }
+    scores = []
+    for count, length in zip(counts, lengths):
+        norm = k1 * (1 - b + b * length / avg_length)
+        scores.append(sum(idf[term] * tf * (k1 + 1) / (tf + norm) for term, tf in count.items()))
+    return scores
+
+
+def overlap_length(left: str, right: str) -> int:
+    """Length of the longest suffix of `left` that is a prefix of `right`."""
+    head = right[:MIN_OVERLAP_CHARS]
+    if len(head) < MIN_OVERLAP_CHARS:
+        return 0
+    # Earliest match of right's head in left gives the longest overlap
+    start = left.find(head)
+    while start != -1:
+        if right.startswith(left[start:]):
+            return len(left) - start
+        start = left.find(head, start + 1)
+    return 0
+
+
+def remove_overlaps(texts: Sequence[str]) -> List[str]:
+    """
+    Drop text each chunk shares with chunks before it.
+
+    A chunk contained in an earlier chunk becomes empty; a prefix that
+    repeats the end of an earlier chunk, or a suffix that repeats the start
+    of one, is trimmed.
+    """
+    kept: List[str] = []
+    for text in texts:
+        for previous in kept:
+            if not text:
+                break
+            if text in previous:
+                text = ""
+                break
+            text = text[overlap_length(previous, text):]
+            size = overlap_length(text, previous)
+            if size:
+                text = text[:-size]
+        kept.append(text.strip())
+    return kept
+
+
+@dataclass
+class CompressedContext:
+    """Assembled context and its size before and after compression."""
+    text: str
+    original_tokens: int
+    tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+class ContextCompressor:
+    """Assemble prompt context from retrieved chunks within a token budget."""
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        sentence_filter: Optional[bool] = None,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
+        """
+        Initialize the compressor.
+
+        Args:
+            max_tokens: Context token budget; 0 disables it (default: from config)
+            sentence_filter: Keep only sentences sharing a term with the
+                question, even under budget (default: from config)
+            token_counter: Function counting tokens (default: tiktoken, see `get_token_counter`)
+        """
+        self.max_tokens = max_tokens if max_tokens is not None else CONTEXT_MAX_TOKENS
+        self.sentence_filter = sentence_filter if sentence_filter is not None else CONTEXT_SENTENCE_FILTER
+        self.count_tokens = token_counter or get_token_counter()
+
+    def compress(
+        self,
+        question: str,
+        docs: Sequence[Document],
+        max_tokens: Optional[int] = None
+    ) -> CompressedContext:
+        """
+        Build the context for `question` from `docs` (in retrieval order).
+
+        Args:
+            question: The user's question
+            docs: Retrieved chunks, most relevant first
+            max_tokens: Token budget for this call; 0 disables it (default: self.max_tokens)
+
+        Returns:
+            CompressedContext with the text and token counts
+        """
+        original = "\n\n".join(doc.page_content for doc in docs)
+        original_tokens = self.count_tokens(original)
+
+        # Chunk of each sentence, so kept sentences can be regrouped per chunk
+        owners: List[int] = []
+        sentences: List[str] = []
+        seen = set()
+        for chunk, text in enumerate(remove_overlaps([doc.page_content for doc in docs])):
+            for sentence in split_sentences(text):
+                key = sentence.lower()
+                if key not in seen:
+                    seen.add(key)
+                    owners.append(chunk)
+                    sentences.append(sentence)
+
+        keep = self._select(question, sentences, self.max_tokens if max_tokens is None else max_tokens)
+        chunks: List[List[str]] = [[] for _ in docs]
+        for i in keep:
+            chunks[owners[i]].append(sentences[i])
+        text = "\n\n".join(" ".join(chunk) for chunk in chunks if chunk)
+        return CompressedContext(text=text, original_tokens=original_tokens, tokens=self.count_tokens(text))
+
+    def _select(self, question: str, sentences: List[str], max_tokens: int) -> List[int]:
+        """Indexes of the sentences to keep, in their original order."""
+        if not sentences:
+            return []
+        scores = score_sentences(question, sentences)
+        candidates = list(range(len(sentences)))
+        if self.sentence_filter and any(scores):
+            candidates = [i for i in candidates if scores[i] > 0]
+
+        sizes = [self.count_tokens(sentence) for sentence in sentences]
+        if not max_tokens or sum(sizes[i] for i in candidates) <= max_tokens:
+            return candidates
+
+        # Over budget: best-scoring sentences first (earlier chunks win ties)
+        keep, used = [], 0
+        for i in sorted(candidates, key=lambda i: (-scores[i], i)):
+            if used + sizes[i] <= max_tokens:
+                keep.append(i)
+                used += sizes[i]
+        return sorted(keep)
+
+
+def create_context_compressor() -> Optional[ContextCompressor]:
+    """Build the context compressor from config, or None when it is disabled."""
+    if not CONTEXT_COMPRESSION_ENABLED:
+        return None
+    return ContextCompressor()
+
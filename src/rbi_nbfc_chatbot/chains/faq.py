@@ -0,0 +1,335 @@
+"""Curated FAQ answers served without generation.
+
+The RBI FAQ questions in `RBI_FAQ_SAMPLES` have authoritative answers. The
+FAQ index embeds those questions once (as queries, like the questions they
+are matched against) and, for each, retrieves its supporting chunks with
+the chain's retriever. Both are cached in `FAQ_INDEX_CACHE_DIR`, keyed by
+the vector store's version, the embedding model and the FAQ set, so a
+changed store or FAQ set gets a new index and the vector store directory
+itself is never written. A question that matches an FAQ question
+exactly (after normalization) or by cosine similarity above
+`FAQ_SIMILARITY_THRESHOLD` is answered with the curated answer and the
+stored chunks: no retrieval and no Gemini call. Exact matches need no
+embedding at all; semantic matches reuse the (cached) query embedding that
+retrieval would compute anyway.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import zipfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain.schema.retriever import BaseRetriever
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai._common import GoogleGenerativeAIError
+
+from ..config import FAQ_ANSWERS_ENABLED, FAQ_INDEX_CACHE_DIR, FAQ_SIMILARITY_THRESHOLD, GOOGLE_EMBEDDING_MODEL
+from ..faq_samples import RBI_FAQ_SAMPLES
+from ..utils.embedding_cache import embed_queries
+from ..utils.snapshots import resolve_index_path
+from .cache import index_version, normalize_question
+
+# Reported as the response "model" of curated answers
+FAQ_MODEL_NAME = "rbi-faq"
+
+
+@dataclass
+class FAQMatch:
+    """A curated answer matched to a question."""
+    question: str
+    answer: str
+    sources: List[Dict[str, Any]]
+    score: float
+
+
+class FAQIndex:
+    """Curated FAQ questions, their answers, embeddings and supporting sources."""
+
+    def __init__(
+        self,
+        questions: Sequence[str],
+        answers: Sequence[str],
+        vectors: np.ndarray,
+        sources: Sequence[List[Dict[str, Any]]],
+        embeddings: Optional[Embeddings] = None,
+        threshold: Optional[float] = None,
+        embedding_model: str = ""
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            questions: FAQ questions
+            answers: Curated answer of each question
+            vectors: Embedding of each question (rows are L2-normalized here)
+            sources: Supporting source dictionaries of each question, best first
+            embeddings: Embedding model for semantic matches (None: exact matches only)
+            threshold: Cosine similarity needed for a semantic match (default: from config)
+            embedding_model: Name of the model the vectors were made with
+        """
+        self.questions = list(questions)
+        self.answers = list(answers)
+        self.sources = [list(s) for s in sources]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(self.questions), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        self.vectors = vectors / np.where(norms > 0, norms, 1.0)
+        self.embeddings = embeddings
+        self.threshold = threshold if threshold is not None else FAQ_SIMILARITY_THRESHOLD
+        self.embedding_model = embedding_model
+        self._keys = {normalize_question(q): i for i, q in enumerate(self.questions)}
+
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @classmethod
+    def build(
+        cls,
+        samples: Sequence[Dict[str, str]],
+        embeddings: Embeddings,
+        retriever: BaseRetriever,
+        threshold: Optional[float] = None,
+        embedding_model: str = ""
+    ) -> "FAQIndex":
+        """
+        Embed FAQ questions and retrieve their supporting chunks.
+
+        Args:
+            samples: Dictionaries with "question" and "answer"
+            embeddings: Embedding model (questions are embedded as queries, batched)
+            retriever: Retriever whose results are stored as sources
+            threshold: Cosine similarity needed for a semantic match (default: from config)
+            embedding_model: Name of the embedding model, recorded for freshness checks
+
+        Returns:
+            FAQIndex over the samples
+        """
+        questions = [sample["question"] for sample in samples]
+        vectors = np.asarray(embed_queries(embeddings, questions), dtype=np.float32)
+        retrieve_batch = getattr(retriever, "retrieve_batch", None)
+        docs = retrieve_batch(questions) if retrieve_batch is not None else retriever.batch(questions)
+        sources = [
+            [
+                {
+                    "content": doc.page_content,
+                    "page": doc.metadata.get("page", "Unknown"),
+                    "source": doc.metadata.get("source", "Unknown")
+                }
+                for doc in question_docs
+            ]
+            for question_docs in docs
+        ]
+        return cls(
+            questions,
+            [sample["answer"] for sample in samples],
+            vectors,
+            sources,
+            embeddings=embeddings,
+            threshold=threshold,
+            embedding_model=embedding_model,
+        )
+
+    def save(self, path: str) -> None:
+        payload = {
+            "questions": self.questions,
+            "answers": self.answers,
+            "sources": self.sources,
+            "embedding_model": self.embedding_model,
+        }
+        np.savez(path, vectors=self.vectors, payload=np.array(json.dumps(payload)))
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        embeddings: Optional[Embeddings] = None,
+        threshold: Optional[float] = None
+    ) -> "FAQIndex":
+        with np.load(path, allow_pickle=False) as data:
+            payload = json.loads(str(data["payload"]))
+            vectors = data["vectors"]
+        return cls(
+            payload["questions"],
+            payload["answers"],
+            vectors,
+            payload["sources"],
+            embeddings=embeddings,
+            threshold=threshold,
+            embedding_model=payload.get("embedding_model", ""),
+        )
+
+    def match(self, question: str) -> Optional[FAQMatch]:
+        """Return the curated answer for `question`, or None if no FAQ matches."""
+        i = self._keys.get(normalize_question(question))
+        if i is not None or self.embeddings is None:
+            return self._finish(i, 1.0, semantic=False)
+        return self._match_vector(self.embeddings.embed_query(question))
+
+    async def amatch(self, question: str) -> Optional[FAQMatch]:
+        """Async variant of `match` (embeds the query without blocking)."""
+        i = self._keys.get(normalize_question(question))
+        if i is not None or self.embeddings is None:
+            return self._finish(i, 1.0, semantic=False)
+        return self._match_vector(await self.embeddings.aembed_query(question))
+
+    def match_batch(
+        self,
+        questions: Sequence[str],
+        min_sources: int = 0
+    ) -> Tuple[List[Optional[FAQMatch]], Dict[str, List[float]]]:
+        """
+        Match many questions, embedding all inexact ones in one batched call.
+
+        Args:
+            questions: Questions to match
+            min_sources: Exact hits with fewer stored sources are embedded too,
+                so that the caller can retrieve more sources for them
+
+        Returns:
+            (the FAQ match or None for each question, in input order;
+            the query vector of each embedded question, for reuse in retrieval)
+        """
+        exact = [self._keys.get(normalize_question(question)) for question in questions]
+        vectors: Dict[str, List[float]] = {}
+        misses = list(dict.fromkeys(
+            q for q, i in zip(questions, exact) if i is None or len(self.sources[i]) < min_sources
+        ))
+        if misses and self.embeddings is not None:
+            vectors = dict(zip(misses, embed_queries(self.embeddings, misses)))
+        matches = [
+            self._match_vector(vectors[question]) if question in vectors and i is None
+            else self._finish(i, 1.0, semantic=False)
+            for question, i in zip(questions, exact)
+        ]
+        return matches, vectors
+
+    def stats(self) -> Dict[str, Any]:
+        """FAQ count, threshold and hit counters."""
+        return {
+            "questions": len(self),
+            "similarity_threshold": self.threshold,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+    def _match_vector(self, vector: List[float]) -> Optional[FAQMatch]:
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        scores = self.vectors @ (query / norm if norm else query)
+        best = int(np.argmax(scores)) if len(scores) else None
+        if best is None or float(scores[best]) < self.threshold:
+            return self._finish(None, 0.0, semantic=True)
+        return self._finish(best, float(scores[best]), semantic=True)
+
+    def _finish(self, i: Optional[int], score: float, semantic: bool) -> Optional[FAQMatch]:
+        # Counters are advisory; unsynchronized increments are fine
+        if i is None:
+            self.misses += 1
+            return None
+        if semantic:
+            self.semantic_hits += 1
+        else:
+            self.exact_hits += 1
+        return FAQMatch(
+            question=self.questions[i],
+            answer=self.answers[i],
+            sources=[dict(source) for source in self.sources[i]],
+            score=round(score, 4),
+        )
+
+
+def load_faq_index(
+    retriever: BaseRetriever,
+    embeddings: Embeddings,
+    samples: Optional[Sequence[Dict[str, str]]] = None,
+    index_path: Optional[str] = None,
+    embedding_model: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> FAQIndex:
+    """
+    Load the cached FAQ index for a vector store, building it if needed.
+
+    The cache file is keyed by the store's version (`index_version`), the
+    embedding model and the FAQ set, so a rebuilt store or another model or
+    FAQ set gets a new index; older indexes of the same store are removed
+    when a new one is saved. Nothing is written to `index_path`, which may
+    be a read-only snapshot or the bundled store.
+
+    Args:
+        retriever: Retriever used for the supporting chunks when building
+        embeddings: Embedding model for FAQ questions and semantic matches
+        samples: FAQ questions and answers (default: `RBI_FAQ_SAMPLES`)
+        index_path: Vector store directory (None: build in memory only)
+        embedding_model: Embedding model name (default: from config)
+        cache_dir: Directory FAQ indexes are cached in (default: from config)
+
+    Returns:
+        FAQIndex
+
+    Raises:
+        ValueError: If there are no FAQ samples
+    """
+    samples = RBI_FAQ_SAMPLES if samples is None else samples
+    if not samples:
+        raise ValueError("No FAQ samples to build the FAQ index from")
+    embedding_model = embedding_model or GOOGLE_EMBEDDING_MODEL
+    if index_path is None:
+        return FAQIndex.build(samples, embeddings, retriever, embedding_model=embedding_model)
+
+    cache_dir = cache_dir or FAQ_INDEX_CACHE_DIR
+    prefix = _digest(os.path.abspath(index_path))
+    key = _digest([index_version(index_path), embedding_model, [[s["question"], s["answer"]] for s in samples]])
+    faq_path = os.path.join(cache_dir, f"{prefix}-{key}.npz")
+    if os.path.exists(faq_path):
+        try:
+            return FAQIndex.load(faq_path, embeddings=embeddings)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass  # Unreadable cache file: rebuild it
+
+    faq = FAQIndex.build(samples, embeddings, retriever, embedding_model=embedding_model)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = os.path.join(cache_dir, f"{prefix}-{key}.{os.getpid()}.tmp.npz")
+        faq.save(tmp_path)
+        os.replace(tmp_path, faq_path)
+        for stale in glob.glob(os.path.join(cache_dir, f"{prefix}-*.npz")):
+            if stale != faq_path and not stale.endswith(".tmp.npz"):
+                os.remove(stale)
+    except OSError as e:
+        print(f"⚠️  Could not cache the FAQ index in {cache_dir}: {e}")
+    return faq
+
+
+def create_faq_index(retriever: BaseRetriever, index_path: Optional[str] = None) -> Optional[FAQIndex]:
+    """
+    Build the FAQ fast path from config, or return None when it is disabled.
+
+    Args:
+        retriever: The chain's retriever (must expose a FAISS `vectorstore`)
+        index_path: Vector store directory (default: the current snapshot)
+
+    Returns:
+        FAQIndex, or None if disabled, the retriever has no embeddings, or
+        the index cannot be built (no samples, I/O or embedding API errors)
+    """
+    vectorstore = getattr(retriever, "vectorstore", None)
+    if not FAQ_ANSWERS_ENABLED or vectorstore is None:
+        return None
+    try:
+        return load_faq_index(retriever, vectorstore.embeddings, index_path=resolve_index_path(index_path))
+    except (ValueError, OSError, GoogleGenerativeAIError) as e:
+        # The fast path is an optimization; answer everything by generation instead
+        print(f"⚠️  FAQ answer index unavailable ({type(e).__name__}: {e}); answering FAQs by generation")
+        return None
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,138 @@
+"""Pool of RAG chains that share one loaded index.
+
+Building a `RAGChain` loads the FAISS index and BM25 postings and creates
+embedding and Gemini clients. Callers that vary the model or temperature
+per request (API clients, the Streamlit sliders) should not pay that each
+time. `ChainPool` derives chains from one base chain: every pooled chain
+reuses the base chain's retriever (vector store, BM25 index, embedding
+client, reranker), context compressor, FAQ answers and metrics, and only
+gets its own Gemini handle and its own answer cache (answers depend on the
+model, so they are not shared). Retrieval depth is not part of the key: pass `k` to
+`RAGChain.ask_question` per call. Pooled chains are kept in a bounded LRU.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from ..config import CHAIN_POOL_SIZE
+from .cache import create_answer_cache
+from .rag_chain import RAGChain
+
+ChainKey = Tuple[str, float]
+
+
+class ChainPool:
+    """Bounded LRU of `RAGChain`s keyed by (model, temperature)."""
+
+    def __init__(
+        self,
+        base: RAGChain,
+        max_chains: Optional[int] = None,
+        llm_factory: Optional[Callable[[str, float], BaseChatModel]] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            base: Chain whose index, clients and settings pooled chains share;
+                returned as is for its own (model, temperature)
+            max_chains: Pooled chains kept besides the base chain (default: from config)
+            llm_factory: Builds the chat model for a (model, temperature)
+                (default: a Gemini client with the base chain's API key)
+        """
+        self.base = base
+        self.max_chains = max_chains if max_chains is not None else CHAIN_POOL_SIZE
+        self._llm_factory = llm_factory or self._gemini
+        self._chains: "OrderedDict[ChainKey, RAGChain]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> RAGChain:
+        """
+        Return the chain for these settings, building it on first use.
+
+        Args:
+            model_name: Gemini model name (default: the base chain's)
+            temperature: Model temperature (default: the base chain's)
+
+        Returns:
+            RAGChain sharing the base chain's index and clients
+        """
+        key = (
+            model_name or self.base.model_name,
+            float(temperature if temperature is not None else self.base.temperature),
+        )
+        if key == self._key(self.base):
+            return self.base
+
+        with self._lock:
+            chain = self._chains.get(key)
+            if chain is not None:
+                self._chains.move_to_end(key)
+                self.hits += 1
+                return chain
+            self.misses += 1
+            chain = self._build(*key)
+            self._chains[key] = chain
+            while len(self._chains) > self.max_chains:
+                self._chains.popitem(last=False)
+                self.evictions += 1
+            return chain
+
+    def clear(self) -> None:
+        """Drop every pooled chain (the base chain is kept)."""
+        with self._lock:
+            self._chains.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and hit/miss counters."""
+        with self._lock:
+            return {
+                "chains": len(self._chains),
+                "max_chains": self.max_chains,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "keys": [{"model": m, "temperature": t} for m, t in self._chains],
+            }
+
+    # -- internals ---------------------------------------------------------------
+
+    @staticmethod
+    def _key(chain: RAGChain) -> ChainKey:
+        return chain.model_name, float(chain.temperature)
+
+    def _gemini(self, model_name: str, temperature: float) -> BaseChatModel:
+        return ChatGoogleGenerativeAI(model=model_name, google_api_key=self.base.api_key, temperature=temperature)
+
+    def _build(self, model_name: str, temperature: float) -> RAGChain:
+        base = self.base
+        cache = None
+        if base.cache is not None:
+            cache = create_answer_cache(embeddings=base.cache.embeddings, index_path=base.index_path)
+
+        return RAGChain(
+            model_name=model_name,
+            temperature=temperature,
+            k=base.k,
+            api_key=base.api_key,
+            prompt_template=base.prompt.template,
+            llm=self._llm_factory(model_name, temperature),
+            retriever=base.retriever,
+            cache=cache,
+            metrics=base.metrics,
+            compressor=base.compressor,
+            faq=base.faq,
+            index_path=base.index_path,
+        )
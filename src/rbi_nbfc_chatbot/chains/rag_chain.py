@@ -4,13 +4,32 @@ This module provides the complete Retrieval-Augmented Generation pipeline
 for answering questions about RBI NBFC regulations.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from langchain.chains import RetrievalQA
 from langchain.prompts import PromptTemplate
+from langchain.schema import Document
+from langchain.schema.retriever import BaseRetriever
+from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
 
-from ..config import GEMINI_MODEL, GOOGLE_API_KEY, RETRIEVAL_K, TEMPERATURE
+from ..config import (
+    ANSWER_CACHE_ENABLED,
+    BATCH_CONCURRENCY,
+    GEMINI_MODEL,
+    GOOGLE_API_KEY,
+    RETRIEVAL_K,
+    TEMPERATURE,
+)
+from ..utils.metrics import PIPELINE_METRICS, PipelineMetrics, PipelineTimings
+from ..utils.snapshots import resolve_index_path
+from .cache import AnswerCache, create_answer_cache
+from .context import ContextCompressor, create_context_compressor
+from .faq import FAQ_MODEL_NAME, FAQIndex, FAQMatch, create_faq_index
 from .retriever import create_retriever
 
 # Default prompt template for RBI NBFC questions
@@ -47,7 +66,14 @@ class RAGChain:
         temperature: Optional[float] = None,
         k: Optional[int] = None,
         api_key: Optional[str] = None,
-        prompt_template: Optional[str] = None
+        prompt_template: Optional[str] = None,
+        llm: Optional[BaseChatModel] = None,
+        retriever: Optional[BaseRetriever] = None,
+        cache: Optional[AnswerCache] = None,
+        metrics: Optional[PipelineMetrics] = None,
+        compressor: Optional[ContextCompressor] = None,
+        faq: Optional[FAQIndex] = None,
+        index_path: Optional[str] = None
     ):
         """
         Initialize the RAG chain.
@@ -58,23 +84,38 @@ class RAGChain:
             k: Number of documents to retrieve (default: from config)
             api_key: Google API key (default: from config)
             prompt_template: Custom prompt template (default: built-in)
+            llm: Pre-built chat model to use instead of Gemini (optional)
+            retriever: Pre-built retriever to use instead of the FAISS index (optional)
+            cache: Answer cache consulted before retrieval and generation (optional)
+            metrics: Histograms that per-stage timings are added to (default: process-wide)
+            compressor: Context assembly with overlap removal and a token
+                budget (optional; without it chunks are pasted in full)
+            faq: Curated FAQ answers served without generation when a
+                question matches one (optional)
+            index_path: Vector store directory the retriever is built from
+                (default: the current snapshot)
         """
         self.model_name = model_name or GEMINI_MODEL
         self.temperature = temperature if temperature is not None else TEMPERATURE
         self.k = k or RETRIEVAL_K
 
-        # Google Gemini
+        # Google Gemini (only needed for components we build ourselves)
         self.api_key = api_key or GOOGLE_API_KEY
-        if not self.api_key:
+        if not self.api_key and (llm is None or retriever is None):
             raise ValueError("Google API key is required. Set GOOGLE_API_KEY in .env file")
-        self.llm = ChatGoogleGenerativeAI(
+        self.llm = llm or ChatGoogleGenerativeAI(
             model=self.model_name,
             google_api_key=self.api_key,
             temperature=self.temperature,
         )
 
         # Create retriever
-        self.retriever = create_retriever(k=self.k, api_key=self.api_key)
+        self.index_path = index_path
+        self.retriever = retriever or create_retriever(index_path=index_path, k=self.k, api_key=self.api_key)
+        self.cache = cache
+        self.metrics = metrics if metrics is not None else PIPELINE_METRICS
+        self.compressor = compressor
+        self.faq = faq
 
         # Create prompt
         template = prompt_template or DEFAULT_PROMPT_TEMPLATE
@@ -83,7 +124,8 @@ class RAGChain:
             input_variables=["context", "question"]
         )
 
-        # Create QA chain
+        # LangChain QA chain over the same components, for callers composing it
+        # directly; the ask methods run its stages themselves so each is timed
         self.qa_chain = RetrievalQA.from_chain_type(
             llm=self.llm,
             chain_type="stuff",
@@ -92,13 +134,29 @@ class RAGChain:
             return_source_documents=True
         )
 
-    def ask_question(self, question: str, return_sources: bool = True) -> Dict[str, Any]:
+    def ask_question(
+        self,
+        question: str,
+        return_sources: bool = True,
+        return_timings: bool = False,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Ask a question about RBI NBFC regulations.
         
+        `k` and `max_context_tokens` apply to this call only, against the
+        same loaded index: a smaller k retrieves fewer chunks, so fewer
+        tokens reach the model. Answers produced with overrides bypass the
+        answer cache, whose entries were generated with the chain's defaults.
+        
         Args:
             question: The question to ask
             return_sources: Whether to include source documents in response
+            return_timings: Whether to include per-stage timings in response
+            k: Number of documents to retrieve (default: the chain's)
+            max_context_tokens: Context token budget (default: the compressor's,
+                or no budget without a compressor)
         
         Returns:
             Dictionary containing:
@@ -106,32 +164,659 @@ class RAGChain:
                 - sources: List of source documents (if return_sources=True)
                 - model: Model name used
                 - question: The original question
+                - cached: Whether the answer was served from the answer cache
+                - faq_match: Matched FAQ question and similarity, when a
+                  curated FAQ answer was returned without generation
+                - timings: Milliseconds per pipeline stage and LLM token
+                  counts (if return_timings=True)
+        """
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        timings = PipelineTimings()
+        if self.faq is not None:
+            with timings.stage("faq"):
+                match = self.faq.match(question)
+            if match is not None:
+                return self._timed(self._faq_response(question, match, return_sources, k), timings, return_timings)
+        if use_cache:
+            with timings.stage("cache"):
+                cached = self.cache.get(question)
+            if cached is not None:
+                return self._timed(self._cached_response(cached, return_sources), timings, return_timings)
+
+        with timings.activate(), timings.stage("retrieval"):
+            docs = self._retrieve(question, k)
+        with timings.stage("context"):
+            prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+
+        start = time.perf_counter()
+        parts: List[str] = []
+        for chunk in self.llm.stream(prompt):
+            self._record_chunk(timings, chunk, start)
+            parts.append(chunk.content)
+        timings.since("llm_total", start)
+
+        response = self._format_response(
+            question, {"result": "".join(parts), "source_documents": docs}, return_sources, cache_answer=use_cache
+        )
+        return self._timed(response, timings, return_timings)
+
+    async def aask_question(
+        self,
+        question: str,
+        return_sources: bool = True,
+        return_timings: bool = False,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronously ask a question about RBI NBFC regulations.
+        
+        Retrieval and generation are awaited rather than run inline, so many
+        questions can be in flight on a single event loop.
+        
+        Args:
+            question: The question to ask
+            return_sources: Whether to include source documents in response
+            return_timings: Whether to include per-stage timings in response
+            k: Number of documents to retrieve (default: the chain's)
+            max_context_tokens: Context token budget (default: the compressor's)
+        
+        Returns:
+            Same dictionary as `ask_question`.
+        """
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        timings = PipelineTimings()
+        if self.faq is not None:
+            with timings.stage("faq"):
+                match = await self.faq.amatch(question)
+            if match is not None:
+                return self._timed(self._faq_response(question, match, return_sources, k), timings, return_timings)
+        if use_cache:
+            with timings.stage("cache"):
+                cached = await self.cache.aget(question)
+            if cached is not None:
+                return self._timed(self._cached_response(cached, return_sources), timings, return_timings)
+
+        with timings.activate(), timings.stage("retrieval"):
+            docs = await self._aretrieve(question, k)
+        with timings.stage("context"):
+            prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+
+        start = time.perf_counter()
+        parts: List[str] = []
+        async for chunk in self.llm.astream(prompt):
+            self._record_chunk(timings, chunk, start)
+            parts.append(chunk.content)
+        timings.since("llm_total", start)
+
+        response = self._format_response(
+            question, {"result": "".join(parts), "source_documents": docs}, return_sources, cache_answer=use_cache
+        )
+        return self._timed(response, timings, return_timings)
+
+    @property
+    def retrieval_k(self) -> int:
+        """Chunks retrieved per question by default (a pre-built retriever's own k)."""
+        return getattr(self.retriever, "k", self.k)
+
+    def _call_settings(
+        self,
+        k: Optional[int],
+        max_context_tokens: Optional[int]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Per-call overrides, with values equal to the chain's defaults dropped."""
+        if k == self.retrieval_k:
+            k = None
+        if self.compressor is not None and max_context_tokens == self.compressor.max_tokens:
+            max_context_tokens = None
+        return k, max_context_tokens
+
+    def _use_cache(self, k: Optional[int], max_context_tokens: Optional[int]) -> bool:
+        """Whether a call may read and fill the answer cache (only with default settings)."""
+        return self.cache is not None and k is None and max_context_tokens is None
+
+    def _retrieve(self, question: str, k: Optional[int] = None) -> List[Document]:
+        """Retrieve for one question, at depth k when given."""
+        if k is None:
+            return self.retriever.invoke(question)
+        retrieve = getattr(self.retriever, "retrieve", None)
+        if retrieve is not None:
+            return retrieve(question, k=k)
+        # Retrievers with a fixed depth: keep their top k
+        return self.retriever.invoke(question)[:k]
+
+    async def _aretrieve(self, question: str, k: Optional[int] = None) -> List[Document]:
+        """Async `_retrieve`."""
+        if k is None:
+            return await self.retriever.ainvoke(question)
+        aretrieve = getattr(self.retriever, "aretrieve", None)
+        if aretrieve is not None:
+            return await aretrieve(question, k=k)
+        return (await self.retriever.ainvoke(question))[:k]
+
+    @staticmethod
+    def _record_chunk(timings: PipelineTimings, chunk: Any, start: float) -> None:
+        """Record time to first token and token usage from a streamed chunk."""
+        if "llm_first_token" not in timings.stages:
+            timings.since("llm_first_token", start)
+        timings.record_usage(getattr(chunk, "usage_metadata", None))
+
+    def _timed(
+        self,
+        response: Dict[str, Any],
+        timings: PipelineTimings,
+        return_timings: bool,
+        endpoint: str = "ask"
+    ) -> Dict[str, Any]:
+        """Add finished timings to the metrics and, if requested, the response."""
+        timings.finish()
+        self.metrics.observe(timings, endpoint=endpoint, cached=response.get("cached", False))
+        if return_timings:
+            response["timings"] = timings.as_dict()
+        return response
+
+    def ask_batch(
+        self,
+        questions: Sequence[str],
+        concurrency: Optional[int] = None,
+        return_sources: bool = True,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Answer many questions with batched retrieval and bounded parallelism.
+        
+        FAQ and cached answers are returned directly and duplicate questions
+        are answered once. The FAQ is matched with one batched query-embedding
+        call, whose vectors are reused to retrieve the remaining questions
+        together, then these are answered on up to `concurrency` concurrent
+        LLM calls. FAQ hits whose stored sources are fewer than `k` join that
+        batched retrieval. A failed generation does not fail the batch: its
+        response carries an "error" message and an empty answer.
+        
+        Each question's timings are added to the metrics under the "batch"
+        endpoint; the shared retrieval time counts towards every question
+        retrieved in it.
+        
+        Args:
+            questions: Questions to answer
+            concurrency: Maximum concurrent LLM calls (default: from config)
+            return_sources: Whether to include source documents in responses
+            k: Number of documents to retrieve per question (default: the chain's)
+            max_context_tokens: Context token budget (default: the compressor's)
+        
+        Returns:
+            One response per question, in input order, shaped like `ask_question`
+        """
+        concurrency = concurrency or BATCH_CONCURRENCY
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        responses, pending, timings, faq_hits, vectors = self._batch_cache_lookup(questions, use_cache, k)
+        docs = self._retrieve_pending(pending, faq_hits, k, timings, vectors, responses)
+        if pending:
+            answer = partial(self._answer_with_docs, max_context_tokens=max_context_tokens, cache_answer=use_cache)
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                answered = list(pool.map(answer, pending, docs, [timings[q] for q in pending]))
+            responses.update(zip(pending, answered))
+        return self._batch_results(questions, responses, return_sources)
+
+    async def aask_batch(
+        self,
+        questions: Sequence[str],
+        concurrency: Optional[int] = None,
+        return_sources: bool = True,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Asynchronously answer many questions; see `ask_batch`.
+        
+        Args:
+            questions: Questions to answer
+            concurrency: Maximum concurrent LLM calls (default: from config)
+            return_sources: Whether to include source documents in responses
+            k: Number of documents to retrieve per question (default: the chain's)
+            max_context_tokens: Context token budget (default: the compressor's)
+        
+        Returns:
+            One response per question, in input order
+        """
+        concurrency = concurrency or BATCH_CONCURRENCY
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        # FAQ and cache lookups may embed (semantic matching) and retrieval makes
+        # a blocking batched embedding request; keep both off the event loop
+        responses, pending, timings, faq_hits, vectors = await asyncio.to_thread(
+            self._batch_cache_lookup, questions, use_cache, k
+        )
+        docs = await asyncio.to_thread(self._retrieve_pending, pending, faq_hits, k, timings, vectors, responses)
+        if pending:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def answer(question: str, question_docs: List[Document]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._aanswer_with_docs(
+                        question,
+                        question_docs,
+                        timings[question],
+                        max_context_tokens=max_context_tokens,
+                        cache_answer=use_cache,
+                    )
+
+            answered = await asyncio.gather(*(answer(q, d) for q, d in zip(pending, docs)))
+            responses.update(zip(pending, answered))
+        return self._batch_results(questions, responses, return_sources)
+
+    def _batch_cache_lookup(self, questions: Sequence[str], use_cache: bool = True, k: Optional[int] = None):
+        """
+        Split unique questions into FAQ/cached responses and questions still to answer.
+        
+        All questions are matched against the FAQ with one batched embedding
+        call; the shared FAQ time counts towards every question.
+        
+        Returns:
+            (responses by question, pending questions, timings by pending
+            question or FAQ hit, FAQ hits whose stored sources are fewer than
+            k, query vectors reusable for retrieval); finished FAQ and cached
+            responses are already added to the metrics
         """
-        # Query the chain
-        # `Chain.__call__` is deprecated; prefer `invoke`.
-        result = self.qa_chain.invoke({"query": question})
+        unique = list(dict.fromkeys(questions))
+        responses: Dict[str, Dict[str, Any]] = {}
+        pending: List[str] = []
+        timings: Dict[str, PipelineTimings] = {}
+        faq_hits: Dict[str, FAQMatch] = {}
+        matches: List[Optional[FAQMatch]] = [None] * len(unique)
+        vectors: Dict[str, List[float]] = {}
+        faq_timings = PipelineTimings()
+        if self.faq is not None:
+            # Vectors are reusable for retrieval only if the store embeds with the same model
+            shared = self.faq.embeddings is getattr(getattr(self.retriever, "vectorstore", None), "embeddings", None)
+            with faq_timings.stage("faq"):
+                matches, vectors = self.faq.match_batch(unique, min_sources=(k or self.retrieval_k) if shared else 0)
+            if not shared:
+                vectors = {}
+        for question, match in zip(unique, matches):
+            question_timings = PipelineTimings()
+            for name, seconds in faq_timings.stages.items():
+                question_timings.add(name, seconds)
+            if match is not None:
+                if len(match.sources) < (k or self.retrieval_k):
+                    faq_hits[question] = match
+                    timings[question] = question_timings
+                    continue
+                response = self._faq_response(question, match, return_sources=True, k=k)
+                responses[question] = self._timed(response, question_timings, False, endpoint="batch")
+                continue
+            with question_timings.stage("cache"):
+                cached = self.cache.get(question) if use_cache and self.cache is not None else None
+            if cached is not None:
+                response = self._cached_response(cached, return_sources=True)
+                responses[question] = self._timed(response, question_timings, False, endpoint="batch")
+            else:
+                pending.append(question)
+                timings[question] = question_timings
+        return responses, pending, timings, faq_hits, vectors
 
-        # Format response
+    def _retrieve_pending(
+        self,
+        pending: List[str],
+        faq_hits: Dict[str, FAQMatch],
+        k: Optional[int],
+        timings: Dict[str, PipelineTimings],
+        vectors: Dict[str, List[float]],
+        responses: Dict[str, Dict[str, Any]]
+    ) -> List[List[Document]]:
+        """
+        Retrieve pending questions and short FAQ hits in one batched call.
+        
+        FAQ hits get their responses (with the retrieved sources) added to
+        `responses` and the metrics.
+        
+        Returns:
+            The retrieved documents of each pending question, in order
+        """
+        questions = pending + list(faq_hits)
+        if not questions:
+            return []
+        docs = self._retrieve_batch(questions, k, [timings[q] for q in questions], vectors)
+        for question, question_docs in zip(questions[len(pending):], docs[len(pending):]):
+            response = self._faq_response(question, faq_hits[question], return_sources=False)
+            response["sources"] = self._format_sources(question_docs)
+            responses[question] = self._timed(response, timings[question], False, endpoint="batch")
+        return docs[:len(pending)]
+
+    @staticmethod
+    def _batch_results(
+        questions: Sequence[str],
+        responses: Dict[str, Dict[str, Any]],
+        return_sources: bool
+    ) -> List[Dict[str, Any]]:
+        """Expand per-question responses back to input order (copies for duplicates)."""
+        results = []
+        for question in questions:
+            response = dict(responses[question])
+            if not return_sources:
+                response.pop("sources", None)
+            results.append(response)
+        return results
+
+    def _retrieve_batch(
+        self,
+        questions: List[str],
+        k: Optional[int] = None,
+        timings: Sequence[PipelineTimings] = (),
+        vectors: Optional[Dict[str, List[float]]] = None
+    ) -> List[List[Document]]:
+        """Retrieve for many questions, batching query embeddings if the retriever can.
+        
+        The batch's retrieval stages are added to each of `timings`; `vectors`
+        are query vectors already computed with the store's embeddings.
+        """
+        batch_timings = PipelineTimings()
+        with batch_timings.activate(), batch_timings.stage("retrieval"):
+            retrieve_batch = getattr(self.retriever, "retrieve_batch", None)
+            if retrieve_batch is not None:
+                docs = retrieve_batch(questions, k=k, vectors=vectors)
+            else:
+                docs = [question_docs[:k] for question_docs in self.retriever.batch(questions)]
+        for question_timings in timings:
+            for name, seconds in batch_timings.stages.items():
+                question_timings.add(name, seconds)
+        return docs
+
+    def _answer_with_docs(
+        self,
+        question: str,
+        docs: List[Document],
+        timings: PipelineTimings,
+        max_context_tokens: Optional[int] = None,
+        cache_answer: bool = True
+    ) -> Dict[str, Any]:
+        """Generate and cache an answer for already-retrieved documents, recording its timings."""
+        try:
+            with timings.stage("context"):
+                prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+            start = time.perf_counter()
+            message = self.llm.invoke(prompt)
+            timings.since("llm_total", start)
+            timings.record_usage(getattr(message, "usage_metadata", None))
+        except Exception as e:
+            return self._timed(self._error_response(question, e), timings, False, endpoint="batch")
+        result = {"result": message.content, "source_documents": docs}
+        response = self._format_response(question, result, return_sources=True, cache_answer=cache_answer)
+        return self._timed(response, timings, False, endpoint="batch")
+
+    async def _aanswer_with_docs(
+        self,
+        question: str,
+        docs: List[Document],
+        timings: PipelineTimings,
+        max_context_tokens: Optional[int] = None,
+        cache_answer: bool = True
+    ) -> Dict[str, Any]:
+        """Async `_answer_with_docs`."""
+        try:
+            with timings.stage("context"):
+                prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+            start = time.perf_counter()
+            message = await self.llm.ainvoke(prompt)
+            timings.since("llm_total", start)
+            timings.record_usage(getattr(message, "usage_metadata", None))
+        except Exception as e:
+            return self._timed(self._error_response(question, e), timings, False, endpoint="batch")
+        result = {"result": message.content, "source_documents": docs}
+        response = self._format_response(question, result, return_sources=True, cache_answer=cache_answer)
+        return self._timed(response, timings, False, endpoint="batch")
+
+    def _error_response(self, question: str, error: Exception) -> Dict[str, Any]:
+        """Response recorded for a question whose generation failed."""
+        return {
+            "question": question,
+            "answer": "",
+            "model": self.model_name,
+            "cached": False,
+            "sources": [],
+            "error": str(error),
+        }
+
+    def _format_response(
+        self,
+        question: str,
+        result: Dict[str, Any],
+        return_sources: bool,
+        cache_answer: bool = True
+    ) -> Dict[str, Any]:
+        """Convert a raw chain result into the public response dictionary."""
         response = {
             "question": question,
             "answer": result.get("result", ""),
-            "model": self.model_name
+            "model": self.model_name,
+            "cached": False
         }
+        response["sources"] = self._format_sources(result.get("source_documents", []))
+
+        # Cache the full response (with sources) so later callers can request them
+        if self.cache is not None and cache_answer:
+            self.cache.put(question, response)
 
         # Add sources if requested
-        if return_sources:
-            source_docs = result.get("source_documents", [])
-            response["sources"] = [
-                {
-                    "content": doc.page_content,
-                    "page": doc.metadata.get("page", "Unknown"),
-                    "source": doc.metadata.get("source", "Unknown")
-                }
-                for doc in source_docs
-            ]
+        if not return_sources:
+            del response["sources"]
 
         return response
 
+    @staticmethod
+    def _faq_response(
+        question: str,
+        match: FAQMatch,
+        return_sources: bool,
+        k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Response carrying a curated FAQ answer and its stored sources (up to k)."""
+        response = {
+            "question": question,
+            "answer": match.answer,
+            "model": FAQ_MODEL_NAME,
+            "cached": False,
+            "faq_match": {"question": match.question, "score": match.score},
+        }
+        if return_sources:
+            response["sources"] = match.sources[:k]
+        return response
+
+    @staticmethod
+    def _cached_response(cached: Dict[str, Any], return_sources: bool) -> Dict[str, Any]:
+        """Mark a cache hit and drop sources if they were not requested."""
+        cached["cached"] = True
+        if not return_sources:
+            cached.pop("sources", None)
+        return cached
+
+    @staticmethod
+    def _format_sources(docs: List[Document]) -> List[Dict[str, Any]]:
+        """Convert retrieved documents into source dictionaries."""
+        return [
+            {
+                "content": doc.page_content,
+                "page": doc.metadata.get("page", "Unknown"),
+                "source": doc.metadata.get("source", "Unknown")
+            }
+            for doc in docs
+        ]
+
+    def _build_prompt(
+        self,
+        question: str,
+        docs: List[Document],
+        timings: Optional[PipelineTimings] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> str:
+        """Render the prompt, compressing the context if a compressor is set.
+        
+        Without a compressor (and no `max_context_tokens`) this matches the
+        "stuff" chain exactly. With one, context token counts before and
+        after are added to `timings`.
+        """
+        compressor = self.compressor
+        if compressor is None and max_context_tokens is not None:
+            # A budget without a configured compressor only trims to the budget
+            compressor = ContextCompressor(max_tokens=max_context_tokens, sentence_filter=False)
+        if compressor is None:
+            context = "\n\n".join(doc.page_content for doc in docs)
+        else:
+            compressed = compressor.compress(question, docs, max_tokens=max_context_tokens)
+            context = compressed.text
+            if timings is not None:
+                timings.record_context(compressed.tokens, compressed.tokens_saved)
+        return self.prompt.format(context=context, question=question)
+
+    def stream_question(
+        self,
+        question: str,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Answer a question incrementally.
+        
+        Sources are emitted as soon as retrieval finishes, followed by answer
+        tokens as the model produces them, so callers can render output long
+        before generation completes.
+        
+        Args:
+            question: The question to ask
+            k: Number of documents to retrieve (default: the chain's)
+            max_context_tokens: Context token budget (default: the compressor's)
+        
+        Yields:
+            Event dictionaries with an "event" name and its "data":
+                - sources: list of source dictionaries
+                - token: the next piece of answer text
+                - done: final dictionary with question, answer, model and cached flag
+        """
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        timings = PipelineTimings()
+        if self.faq is not None:
+            with timings.stage("faq"):
+                match = self.faq.match(question)
+            if match is not None:
+                response = self._faq_response(question, match, return_sources=True, k=k)
+                self._timed(response, timings, return_timings=False, endpoint="stream")
+                yield from self._replay(response)
+                return
+        if use_cache:
+            with timings.stage("cache"):
+                cached = self.cache.get(question)
+            if cached is not None:
+                response = self._cached_response(cached, return_sources=True)
+                self._timed(response, timings, return_timings=False, endpoint="stream")
+                yield from self._replay(response)
+                return
+
+        with timings.activate(), timings.stage("retrieval"):
+            docs = self._retrieve(question, k)
+        sources = self._format_sources(docs)
+        yield {"event": "sources", "data": sources}
+
+        with timings.stage("context"):
+            prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+        start = time.perf_counter()
+        parts: List[str] = []
+        for chunk in self.llm.stream(prompt):
+            self._record_chunk(timings, chunk, start)
+            if chunk.content:
+                parts.append(chunk.content)
+                yield {"event": "token", "data": chunk.content}
+        timings.since("llm_total", start)
+
+        done = self._finish_stream(question, "".join(parts), sources, cache_answer=use_cache)
+        self._timed(done["data"], timings, return_timings=False, endpoint="stream")
+        yield done
+
+    async def astream_question(
+        self,
+        question: str,
+        k: Optional[int] = None,
+        max_context_tokens: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously answer a question incrementally.
+        
+        Emits the same events as `stream_question`.
+        """
+        k, max_context_tokens = self._call_settings(k, max_context_tokens)
+        use_cache = self._use_cache(k, max_context_tokens)
+        timings = PipelineTimings()
+        if self.faq is not None:
+            with timings.stage("faq"):
+                match = await self.faq.amatch(question)
+            if match is not None:
+                response = self._faq_response(question, match, return_sources=True, k=k)
+                self._timed(response, timings, return_timings=False, endpoint="stream")
+                for event in self._replay(response):
+                    yield event
+                return
+        if use_cache:
+            with timings.stage("cache"):
+                cached = await self.cache.aget(question)
+            if cached is not None:
+                response = self._cached_response(cached, return_sources=True)
+                self._timed(response, timings, return_timings=False, endpoint="stream")
+                for event in self._replay(response):
+                    yield event
+                return
+
+        with timings.activate(), timings.stage("retrieval"):
+            docs = await self._aretrieve(question, k)
+        sources = self._format_sources(docs)
+        yield {"event": "sources", "data": sources}
+
+        with timings.stage("context"):
+            prompt = self._build_prompt(question, docs, timings, max_context_tokens)
+        start = time.perf_counter()
+        parts: List[str] = []
+        async for chunk in self.llm.astream(prompt):
+            self._record_chunk(timings, chunk, start)
+            if chunk.content:
+                parts.append(chunk.content)
+                yield {"event": "token", "data": chunk.content}
+        timings.since("llm_total", start)
+
+        done = self._finish_stream(question, "".join(parts), sources, cache_answer=use_cache)
+        self._timed(done["data"], timings, return_timings=False, endpoint="stream")
+        yield done
+
+    def _finish_stream(
+        self,
+        question: str,
+        answer: str,
+        sources: List[Dict[str, Any]],
+        cache_answer: bool = True
+    ) -> Dict[str, Any]:
+        """Cache a completed streamed answer and build its "done" event."""
+        if self.cache is not None and cache_answer:
+            self.cache.put(
+                question,
+                {"question": question, "answer": answer, "model": self.model_name, "cached": False, "sources": sources},
+            )
+        return {
+            "event": "done",
+            "data": {"question": question, "answer": answer, "model": self.model_name, "cached": False},
+        }
+
+    @staticmethod
+    def _replay(response: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Emit a cached response as stream events."""
+        yield {"event": "sources", "data": response.get("sources", [])}
+        yield {"event": "token", "data": response["answer"]}
+        yield {
+            "event": "done",
+            "data": {key: response[key] for key in ("question", "answer", "model", "cached")},
+        }
+
     def ask(self, question: str) -> str:
         """
         Ask a question and return just the answer text.
@@ -151,7 +836,9 @@ def build_rag_chain(
     temperature: Optional[float] = None,
     k: Optional[int] = None,
     api_key: Optional[str] = None,
-    prompt_template: Optional[str] = None
+    prompt_template: Optional[str] = None,
+    cache: Optional[AnswerCache] = None,
+    index_path: Optional[str] = None
 ) -> RAGChain:
     """
     Build and return a RAG chain instance.
@@ -165,6 +852,9 @@ def build_rag_chain(
         k: Number of documents to retrieve (default: from config)
         api_key: Google API key (default: from config)
         prompt_template: Custom prompt template (default: built-in)
+        cache: Answer cache (default: built from config when ANSWER_CACHE_ENABLED)
+        index_path: Vector store directory (default: the current snapshot,
+            else VECTOR_STORE_PATH)
     
     Returns:
         RAGChain: Configured RAG chain instance
@@ -175,10 +865,21 @@ def build_rag_chain(
         >>> response = rag.ask_question("What is an NBFC?")
         >>> print(response["answer"])
     """
-    return RAGChain(
+    # Pin the snapshot once, so every component is built from the same one
+    index_path = resolve_index_path(index_path)
+    chain = RAGChain(
         model_name=model_name,
         temperature=temperature,
         k=k,
         api_key=api_key,
-        prompt_template=prompt_template
+        prompt_template=prompt_template,
+        cache=cache,
+        compressor=create_context_compressor(),
+        index_path=index_path
     )
+    if cache is None and ANSWER_CACHE_ENABLED:
+        # Semantic matching reuses the retriever's query embeddings.
+        vectorstore = getattr(chain.retriever, "vectorstore", None)
+        chain.cache = create_answer_cache(embeddings=getattr(vectorstore, "embeddings", None), index_path=index_path)
+    chain.faq = create_faq_index(chain.retriever, index_path=index_path)
+    return chain
@@ -0,0 +1,172 @@
+"""Second-stage reranking of retrieved candidates.
+
+The first stage (FAISS, BM25 or both) ranks thousands of chunks cheaply;
+a reranker rescores only its top `RERANK_CANDIDATES` against the question,
+so fewer but better chunks reach the prompt. Each reranker scores all
+candidate pairs of a question in one pass:
+
+- ``lexical``: numpy-vectorized BM25 over the candidates plus how much of
+  the question they cover (share of its terms, weighted by IDF) and how many
+  of its two-word phrases they contain verbatim. CPU-only and no model:
+  about 1 ms for 30 candidates once their tokens are cached.
+- ``cross-encoder``: a sentence-transformers cross-encoder (default
+  ms-marco-MiniLM-L-6-v2, 22M parameters, CPU-friendly), scoring every
+  (question, chunk) pair in one batched forward pass. Requires the optional
+  `sentence-transformers` package.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import RERANK_MODEL, RERANKER
+from ..utils.bm25 import BM25Index, tokenize
+
+RERANKERS = ("lexical", "cross-encoder")
+
+
+@lru_cache(maxsize=8192)
+def _chunk_tokens(text: str) -> Tuple[str, ...]:
+    """Tokens of a chunk; the same chunks are candidates for many questions."""
+    return tuple(tokenize(text))
+
+
+class LexicalReranker:
+    """Score candidates by BM25, query coverage and phrase matches."""
+
+    def __init__(
+        self,
+        bm25: Optional[BM25Index] = None,
+        coverage_weight: float = 1.0,
+        phrase_weight: float = 0.5,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        Initialize the reranker.
+
+        Args:
+            bm25: Corpus index to take term IDF from; without it IDF is
+                computed over the candidates alone
+            coverage_weight: Weight of the share of query terms a candidate contains
+            phrase_weight: Weight of the share of query bigrams it contains verbatim
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.bm25 = bm25
+        self.coverage_weight = coverage_weight
+        self.phrase_weight = phrase_weight
+        self.k1 = k1
+        self.b = b
+
+    def _idf(self, terms: List[str], doc_freqs: np.ndarray, n: int) -> np.ndarray:
+        if self.bm25 is None:
+            return np.log1p((n - doc_freqs + 0.5) / (doc_freqs + 0.5))
+        # Terms missing from the corpus index are as rare as a term can be
+        rare = np.log1p((len(self.bm25) - 0.5) / 1.5)
+        return np.array([self.bm25.idf[self.bm25.vocab[t]] if t in self.bm25.vocab else rare for t in terms])
+
+    def score(self, question: str, texts: Sequence[str]) -> np.ndarray:
+        """
+        Relevance score of each text for `question` (higher is better).
+
+        Args:
+            question: The user's question
+            texts: Candidate chunk texts
+
+        Returns:
+            Array of scores, one per text
+        """
+        query_tokens = tokenize(question)
+        terms = list(dict.fromkeys(query_tokens))
+        if not terms or not texts:
+            return np.zeros(len(texts))
+        term_ids = {term: i for i, term in enumerate(terms)}
+
+        # Term-frequency matrix (candidates x query terms) from one bincount
+        tokenized = [_chunk_tokens(text) for text in texts]
+        lengths = np.array([len(tokens) for tokens in tokenized], dtype=np.float64)
+        cells = [row * len(terms) + term_ids[token]
+                 for row, tokens in enumerate(tokenized) for token in tokens if token in term_ids]
+        tf = np.bincount(np.asarray(cells, dtype=np.int64), minlength=len(texts) * len(terms))
+        tf = tf.reshape(len(texts), len(terms)).astype(np.float64)
+
+        present = tf > 0
+        idf = self._idf(terms, present.sum(axis=0), len(texts))
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(lengths.mean(), 1.0))
+        bm25 = (idf * tf * (self.k1 + 1) / (tf + norm[:, None])).sum(axis=1)
+        scores = bm25 / bm25.max() if bm25.max() > 0 else bm25
+        scores += self.coverage_weight * (present @ idf) / max(idf.sum(), 1e-9)
+
+        # Two-word phrases of the question found verbatim (on normalized token text)
+        pairs = list(dict.fromkeys((a, b) for a, b in zip(query_tokens, query_tokens[1:]) if a != b))
+        if pairs and self.phrase_weight:
+            joined = [f" {' '.join(tokens)} " for tokens in tokenized]
+            weights = np.array([idf[term_ids[a]] + idf[term_ids[b]] for a, b in pairs])
+            found = np.array([[f" {a} {b} " in text for a, b in pairs] for text in joined], dtype=np.float64)
+            scores += self.phrase_weight * (found @ weights) / weights.sum()
+        return scores
+
+
+class CrossEncoderReranker:
+    """Score (question, chunk) pairs with a sentence-transformers cross-encoder."""
+
+    def __init__(self, model_name: Optional[str] = None, batch_size: int = 64):
+        """
+        Load the cross-encoder.
+
+        Args:
+            model_name: Hugging Face model id (default: RERANK_MODEL from config)
+            batch_size: Pairs per forward pass (the default covers
+                RERANK_CANDIDATES in one pass)
+
+        Raises:
+            ImportError: If sentence-transformers is not installed
+        """
+        try:
+            from sentence_transformers import CrossEncoder
+        except ImportError as e:
+            raise ImportError(
+                "The cross-encoder reranker requires `sentence-transformers`. "
+                "Install it with: pip install sentence-transformers"
+            ) from e
+        self.model_name = model_name or RERANK_MODEL
+        self.batch_size = batch_size
+        self.model = CrossEncoder(self.model_name, device="cpu")
+
+    def score(self, question: str, texts: Sequence[str]) -> np.ndarray:
+        """Relevance score of each text for `question` (higher is better)."""
+        if not texts:
+            return np.zeros(0)
+        pairs = [(question, text) for text in texts]
+        return np.asarray(self.model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False))
+
+
+def rerank_order(scores: np.ndarray) -> List[int]:
+    """Candidate indexes by descending score; ties keep first-stage order."""
+    return [int(i) for i in np.argsort(-np.asarray(scores), kind="stable")]
+
+
+def create_reranker(name: Optional[str] = None, bm25: Optional[BM25Index] = None):
+    """
+    Build a reranker by name.
+
+    Args:
+        name: "lexical", "cross-encoder" or "none" (default: RERANKER from config)
+        bm25: Corpus index for the lexical reranker's IDF
+
+    Returns:
+        The reranker, or None when reranking is disabled
+
+    Raises:
+        ValueError: If the reranker name is unknown
+    """
+    name = (name or RERANKER).lower()
+    if name in ("", "none"):
+        return None
+    if name == "lexical":
+        return LexicalReranker(bm25=bm25)
+    if name == "cross-encoder":
+        return CrossEncoderReranker()
+    raise ValueError(f"Unknown reranker '{name}'. Choose one of: none, {', '.join(RERANKERS)}")
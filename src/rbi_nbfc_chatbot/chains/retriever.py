@@ -1,59 +1,378 @@
 """Document retriever for RBI NBFC Chatbot.
 
 This module creates and manages the FAISS retriever for document search.
+Besides dense (embedding) search, the retriever can rank chunks with a BM25
+lexical index over the same chunks, either alone or fused with the dense
+ranking via reciprocal rank fusion.
 """
 
+import asyncio
 import os
-from typing import Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 import faiss
+import numpy as np
+from langchain.schema import Document
 from langchain.schema.retriever import BaseRetriever
 from langchain_community.vectorstores import FAISS
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun, CallbackManagerForRetrieverRun
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from ..config import (
+    EMBEDDING_CACHE_ENABLED,
     GOOGLE_API_KEY,
     GOOGLE_EMBEDDING_MODEL,
+    RERANK_CANDIDATES,
+    RERANKER,
+    RETRIEVAL_FETCH_K,
     RETRIEVAL_K,
-    VECTOR_STORE_PATH,
+    RETRIEVAL_MERGE_ADJACENT,
+    RETRIEVAL_MODE,
+    RETRIEVAL_RRF_K,
 )
+from ..utils.bm25 import BM25_FILENAME, BM25Index
+from ..utils.embedding_cache import CachedEmbeddings, EmbeddingCache, embed_queries
+from ..utils.faiss_index import configure_search, load_vector_store, read_faiss_dimension
+from ..utils.metrics import stage
+from ..utils.snapshots import resolve_index_path
+from .context import overlap_length
+from .reranker import create_reranker, rerank_order
 
+RETRIEVAL_MODES = ("dense", "hybrid", "lexical")
 
-def _read_faiss_dimension(index_path: str) -> Optional[int]:
-    """Read the dimension (d) from a FAISS index on disk, if present."""
-    try:
-        candidate = os.path.join(index_path, "index.faiss")
-        if os.path.exists(candidate):
-            idx = faiss.read_index(candidate)
-            return int(getattr(idx, "d", 0)) or None
-    except Exception:
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[int]], k: int = 60) -> List[int]:
+    """
+    Fuse several rankings of FAISS rows with reciprocal rank fusion.
+    
+    Each row scores sum(1 / (k + rank)) over the rankings it appears in
+    (ranks start at 1). Ties keep first-seen order, so earlier rankings win.
+    
+    Args:
+        rankings: Row ids per ranker, best first
+        k: RRF rank constant; larger values flatten the rank weighting
+    
+    Returns:
+        Row ids ordered by fused score
+    """
+    scores: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, row in enumerate(ranking, start=1):
+            scores[row] = scores.get(row, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=scores.__getitem__, reverse=True)
+
+
+def _merge_pair(passage: Document, doc: Document) -> Optional[Document]:
+    """Merge two chunks of the same page if they overlap or touch, else None."""
+    first, second = passage.metadata, doc.metadata
+    if (first.get("source"), first.get("page")) != (second.get("source"), second.get("page")):
         return None
-    return None
+    count = first.get("merged_chunks", 1) + second.get("merged_chunks", 1)
+
+    if first.get("start_index") is not None and second.get("start_index") is not None:
+        # Character offsets within the page: merge overlapping or touching ranges
+        if second["start_index"] < first["start_index"]:
+            passage, doc = doc, passage
+        start, other = passage.metadata["start_index"], doc.metadata["start_index"]
+        end = start + len(passage.page_content)
+        if other > end:
+            return None
+        text = passage.page_content + doc.page_content[end - other:]
+    else:
+        # Chunks without offsets: merge on shared text
+        left, right = passage.page_content, doc.page_content
+        if right in left:
+            text = left
+        elif left in right:
+            passage, text = doc, right
+        elif overlap_length(left, right):
+            text = left + right[overlap_length(left, right):]
+        elif overlap_length(right, left):
+            passage, text = doc, right + left[overlap_length(right, left):]
+        else:
+            return None
+
+    # Metadata of the chunk the passage starts with
+    return Document(page_content=text, metadata={**passage.metadata, "merged_chunks": count})
+
+
+def merge_adjacent_chunks(docs: Iterable[Document], k: int) -> List[Document]:
+    """
+    Merge overlapping or adjacent chunks of the same page into passages.
+    
+    Chunks are taken in rank order. A chunk that overlaps or touches an
+    already-selected passage (by "start_index" offsets when both have them,
+    otherwise by shared text) is merged into it and does not use up a slot;
+    other chunks start a new passage until `k` passages are selected. A
+    chunk bridging two passages joins them. Each passage keeps the position
+    of its best-ranked chunk.
+    
+    Args:
+        docs: Candidate chunks, best first (may be a lazy iterable)
+        k: Number of passages to return
+    
+    Returns:
+        Up to k passages; merged ones carry a "merged_chunks" count
+    """
+    passages: List[Document] = []
+    for doc in docs:
+        for i, passage in enumerate(passages):
+            merged = _merge_pair(passage, doc)
+            if merged is None:
+                continue
+            # The chunk may bridge this passage and a later one
+            for j in range(len(passages) - 1, i, -1):
+                bridged = _merge_pair(merged, passages[j])
+                if bridged is not None:
+                    merged = bridged
+                    del passages[j]
+            passages[i] = merged
+            break
+        else:
+            if len(passages) == k:
+                break
+            passages.append(doc)
+    return passages
+
+
+def load_bm25_index(vectorstore: FAISS, index_path: Optional[str] = None) -> BM25Index:
+    """
+    Load the BM25 index saved next to a FAISS index, building it if needed.
+    
+    `build_vector_store` saves the index with the store. When it is missing,
+    older than `index.faiss`, or has a different number of rows (stores
+    built before BM25 existed), it is rebuilt from the docstore in memory
+    only: a served store, such as a published snapshot, is never written to.
+    
+    Args:
+        vectorstore: Loaded FAISS vector store
+        index_path: Vector store directory (None: build in memory)
+    
+    Returns:
+        BM25Index whose row i is FAISS row i
+    """
+    ntotal = vectorstore.index.ntotal
+    bm25_path = os.path.join(index_path, BM25_FILENAME) if index_path else None
+    faiss_path = os.path.join(index_path, "index.faiss") if index_path else None
+
+    if bm25_path and os.path.exists(bm25_path):
+        fresh = not os.path.exists(faiss_path) or os.path.getmtime(bm25_path) >= os.path.getmtime(faiss_path)
+        if fresh:
+            bm25 = BM25Index.load(bm25_path)
+            if len(bm25) == ntotal:
+                return bm25
+
+    texts = [
+        vectorstore.docstore.search(vectorstore.index_to_docstore_id[i]).page_content
+        for i in range(ntotal)
+    ]
+    if bm25_path:
+        print(f"⚠️  No current {BM25_FILENAME} in {index_path}; building the lexical index in memory "
+              "(rebuild the vector store to save it)")
+    return BM25Index.build(texts)
+
+
+class DocumentRetriever(BaseRetriever):
+    """
+    Retriever over a FAISS vector store with optional BM25 lexical ranking.
+    
+    Modes:
+        dense: embedding similarity search (the original behavior)
+        hybrid: dense and BM25 candidates fused with reciprocal rank fusion
+        lexical: BM25 only, skipping the remote embedding call; falls back to
+            dense search when no chunk shares a term with the query
+    
+    With `merge_adjacent`, overlapping chunks of the same page among the
+    top `fetch_k` candidates are merged into one passage (see
+    `merge_adjacent_chunks`), so the k results are k different passages.
+    
+    With a `reranker` (see `reranker.create_reranker`), the top
+    `rerank_candidates` first-stage results are rescored against the
+    question and reordered before merging and taking the top k.
+    """
+
+    vectorstore: FAISS
+    bm25: Optional[BM25Index] = None
+    mode: str = "dense"
+    k: int = 4
+    fetch_k: int = 20
+    rrf_k: int = 60
+    merge_adjacent: bool = False
+    reranker: Optional[Any] = None
+    rerank_candidates: int = 30
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def _document(self, row: int) -> Document:
+        return self.vectorstore.docstore.search(self.vectorstore.index_to_docstore_id[row])
+
+    def _embed(self, question: str) -> List[float]:
+        with stage("embed"):
+            return self.vectorstore.embeddings.embed_query(question)
+
+    async def _aembed(self, question: str) -> List[float]:
+        with stage("embed"):
+            return await self.vectorstore.embeddings.aembed_query(question)
+
+    def _dense_rows(self, vector: List[float], n: int) -> List[int]:
+        return self._dense_rows_batch([vector], n)[0]
+
+    def _dense_rows_batch(self, vectors: List[List[float]], n: int) -> List[List[int]]:
+        with stage("search"):
+            query = np.asarray(vectors, dtype=np.float32)
+            if self.vectorstore._normalize_L2:
+                faiss.normalize_L2(query)
+            _, rows = self.vectorstore.index.search(query, n)
+            return [[int(row) for row in found if row != -1] for found in rows]
+
+    def _lexical_rows(self, question: str, n: int) -> List[int]:
+        with stage("search"):
+            return [row for row, _ in self.bm25.search(question, n)]
+
+    def _candidates(self, k: int) -> int:
+        """Rows to fetch from each ranker for k results."""
+        n = max(k, self.fetch_k) if self.mode == "hybrid" or self.merge_adjacent else k
+        return max(n, self.rerank_candidates) if self.reranker is not None else n
+
+    def _rank(self, question: str, dense: List[int], lexical: List[int], k: int) -> List[Document]:
+        with stage("search"):
+            rows = reciprocal_rank_fusion([dense, lexical], self.rrf_k) if dense and lexical else dense or lexical
+            if self.reranker is None:
+                docs: Iterable[Document] = (self._document(row) for row in rows)
+            else:
+                docs = [self._document(row) for row in rows[:max(k, self.rerank_candidates)]]
+        if self.reranker is not None:
+            with stage("rerank"):
+                scores = self.reranker.score(question, [doc.page_content for doc in docs])
+                docs = [docs[i] for i in rerank_order(scores)]
+        with stage("search"):
+            if self.merge_adjacent:
+                return merge_adjacent_chunks(docs, k)
+            return list(islice(docs, k))
+
+    def retrieve(self, question: str, k: Optional[int] = None) -> List[Document]:
+        """Return the top-k chunks for `question` (default k: self.k)."""
+        k = k or self.k
+        if self.mode == "dense":
+            return self._rank(question, self._dense_rows(self._embed(question), self._candidates(k)), [], k)
+
+        n = self._candidates(k)
+        lexical = self._lexical_rows(question, n)
+        if self.mode == "lexical" and lexical:
+            return self._rank(question, [], lexical, k)
+        dense = self._dense_rows(self._embed(question), n)
+        return self._rank(question, dense, lexical, k)
+
+    def retrieve_batch(
+        self,
+        questions: Sequence[str],
+        k: Optional[int] = None,
+        vectors: Optional[Dict[str, List[float]]] = None
+    ) -> List[List[Document]]:
+        """
+        Retrieve for many questions at once.
+        
+        All query embeddings are requested in one batched call and searched
+        in one FAISS call; in lexical mode only questions without BM25 hits
+        are embedded.
+        
+        Args:
+            questions: Questions to retrieve for
+            k: Chunks per question (default: self.k)
+            vectors: Query vectors already computed with the store's
+                embeddings, by question (these questions are not re-embedded)
+        
+        Returns:
+            The top-k chunks for each question, in input order
+        """
+        k = k or self.k
+        n = self._candidates(k)
+        lexical = [self._lexical_rows(q, n) if self.mode != "dense" else [] for q in questions]
+        need_dense = [i for i, rows in enumerate(lexical) if self.mode != "lexical" or not rows]
+
+        dense: Dict[int, List[int]] = {}
+        if need_dense:
+            vectors = dict(vectors or {})
+            missing = list(dict.fromkeys(questions[i] for i in need_dense if questions[i] not in vectors))
+            if missing:
+                with stage("embed"):
+                    vectors.update(zip(missing, embed_queries(self.vectorstore.embeddings, missing)))
+            rows = self._dense_rows_batch([vectors[questions[i]] for i in need_dense], n)
+            dense = dict(zip(need_dense, rows))
+
+        return [
+            self._rank(question, dense.get(i, []), lexical[i], k)
+            for i, question in enumerate(questions)
+        ]
+
+    async def aretrieve(self, question: str, k: Optional[int] = None) -> List[Document]:
+        """Async `retrieve`: BM25 scoring overlaps the query-embedding request."""
+        k = k or self.k
+        n = self._candidates(k)
+        if self.mode == "dense":
+            vector = await self._aembed(question)
+            return self._rank(question, self._dense_rows(vector, n), [], k)
+
+        if self.mode == "lexical":
+            lexical = self._lexical_rows(question, n)
+            if lexical:
+                return self._rank(question, [], lexical, k)
+            vector = await self._aembed(question)
+        else:
+            embedding = asyncio.ensure_future(self._aembed(question))
+            lexical = self._lexical_rows(question, n)
+            vector = await embedding
+        return self._rank(question, self._dense_rows(vector, n), lexical, k)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self.retrieve(query)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return await self.aretrieve(query)
 
 
 def create_retriever(
     index_path: Optional[str] = None,
     k: Optional[int] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    mode: Optional[str] = None,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    reranker: Optional[str] = None
 ) -> BaseRetriever:
     """
     Create a FAISS retriever for document search.
     
     Args:
-        index_path: Path to FAISS index directory (default: from config)
+        index_path: Path to FAISS index directory (default: the current
+            snapshot, else VECTOR_STORE_PATH)
         k: Number of documents to retrieve (default: from config)
         api_key: Google API key (default: from config)
+        mode: "dense", "hybrid" or "lexical" (default: RETRIEVAL_MODE from config)
+        nprobe: IVF lists scanned per query, for IVF indexes (default: from config)
+        ef_search: HNSW search breadth, for HNSW indexes (default: from config)
+        reranker: "none", "lexical" or "cross-encoder" (default: RERANKER from config)
     
     Returns:
         BaseRetriever: Configured FAISS retriever
     
     Raises:
         FileNotFoundError: If FAISS index doesn't exist
-        ValueError: If API key is missing
+        ValueError: If API key is missing, or the mode or reranker is unknown
+        ImportError: If the cross-encoder reranker's dependency is missing
     """
     # Use defaults from config
-    index_path = index_path or VECTOR_STORE_PATH
+    index_path = resolve_index_path(index_path)
     k = k or RETRIEVAL_K
+    mode = (mode or RETRIEVAL_MODE).lower()
+    if mode not in RETRIEVAL_MODES:
+        raise ValueError(f"Unknown retrieval mode '{mode}'. Choose one of: {', '.join(RETRIEVAL_MODES)}")
 
     api_key = api_key or GOOGLE_API_KEY
     if not api_key:
@@ -66,7 +385,7 @@ def create_retriever(
         )
 
     # Sanity check: bundled index is created with Gemini embeddings (768-d).
-    index_dim = _read_faiss_dimension(index_path)
+    index_dim = read_faiss_dimension(index_path)
     if index_dim is not None and index_dim != 768:
         raise ValueError(
             f"The FAISS index on disk is {index_dim}-dimensional, but this project is configured "
@@ -78,17 +397,30 @@ def create_retriever(
         model=GOOGLE_EMBEDDING_MODEL,
         google_api_key=api_key,
     )
+    if EMBEDDING_CACHE_ENABLED:
+        # Repeated questions skip the embedding round-trip
+        embeddings = CachedEmbeddings(embeddings, EmbeddingCache(), model_name=GOOGLE_EMBEDDING_MODEL)
 
-    # Load vector store
-    vectorstore = FAISS.load_local(
-        index_path,
-        embeddings,
-        allow_dangerous_deserialization=True
-    )
+    # Load vector store (memory-mapped where the index type allows it)
+    vectorstore = load_vector_store(index_path, embeddings)
+    # Approximate indexes: trade recall for latency at query time
+    configure_search(vectorstore.index, nprobe=nprobe, ef_search=ef_search)
+
+    # BM25 for lexical/hybrid search; the lexical reranker also takes its IDF from it
+    reranker_name = (reranker or RERANKER).lower()
+    bm25 = load_bm25_index(vectorstore, index_path) if mode != "dense" or reranker_name == "lexical" else None
 
     # Create and return retriever
-    retriever = vectorstore.as_retriever(
-        search_kwargs={"k": k}
+    retriever = DocumentRetriever(
+        vectorstore=vectorstore,
+        bm25=bm25 if mode != "dense" else None,
+        mode=mode,
+        k=k,
+        fetch_k=RETRIEVAL_FETCH_K,
+        rrf_k=RETRIEVAL_RRF_K,
+        merge_adjacent=RETRIEVAL_MERGE_ADJACENT,
+        reranker=create_reranker(reranker_name, bm25=bm25),
+        rerank_candidates=RERANK_CANDIDATES,
     )
 
     return retriever
@@ -55,9 +55,33 @@ RETRIEVAL_K = int(os.getenv("RETRIEVAL_K", "4"))
 # Path strings (for compatibility)
 VECTOR_STORE_PATH = str(FAISS_INDEX_PATH)
 
+# Versioned snapshots: ingestion builds each vector store in a new directory
+# under the snapshot root and then atomically points its CURRENT file at it
+# (VECTOR_STORE_PATH is served until a snapshot is published)
+VECTOR_STORE_SNAPSHOTS = os.getenv("VECTOR_STORE_SNAPSHOTS", "true").lower() in ("1", "true", "yes")
+VECTOR_STORE_SNAPSHOTS_DIR = os.getenv("VECTOR_STORE_SNAPSHOTS_DIR", str(VECTOR_STORE_DIR / "snapshots"))
+# Snapshots kept on disk, including the current one (older ones are deleted)
+SNAPSHOTS_KEEP = int(os.getenv("SNAPSHOTS_KEEP", "3"))
+# Seconds between API checks of CURRENT for a new snapshot to hot-swap (0 disables)
+SNAPSHOT_WATCH_INTERVAL = float(os.getenv("SNAPSHOT_WATCH_INTERVAL", "10"))
+# Token required in the X-Admin-Token header of /admin and /ingest endpoints
+# (unset: those endpoints are disabled)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# Background ingestion jobs (POST /ingest)
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+INGEST_JOBS_DIR = os.getenv("INGEST_JOBS_DIR", str(DATA_DIR / "ingest_jobs"))
+# Uploaded PDFs are stored here and stay part of the corpus
+INGEST_UPLOAD_DIR = os.getenv("INGEST_UPLOAD_DIR", str(DOCUMENTS_DIR / "uploads"))
+INGEST_MAX_UPLOAD_MB = float(os.getenv("INGEST_MAX_UPLOAD_MB", "50"))
+
 # Chunking configuration
 CHUNK_SIZE = 1000
 CHUNK_OVERLAP = 200
+# Chunking strategy: "recursive" (plain character splitter, which the bundled
+# index was built with) or "regulatory" (splits at chapters, sections and
+# numbered paragraphs; opt in and re-ingest)
+CHUNK_STRATEGY = os.getenv("CHUNK_STRATEGY", "recursive").lower()
 
 # API configuration
 API_HOST = "0.0.0.0"
@@ -65,3 +89,84 @@ API_PORT = 8000
 
 # LangSmith configuration
 LANGSMITH_PROJECT_NAME = "rbi-nbfc-chatbot"
+
+# Answer cache configuration
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "1024"))
+ANSWER_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+# Cosine similarity for semantic cache hits (unset disables semantic matching)
+ANSWER_CACHE_SIMILARITY_THRESHOLD = (
+    float(os.environ["ANSWER_CACHE_SIMILARITY_THRESHOLD"])
+    if os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD")
+    else None
+)
+
+# Curated RBI FAQ answers served without generation when a question matches
+# an FAQ question exactly or with cosine similarity >= threshold
+FAQ_ANSWERS_ENABLED = os.getenv("FAQ_ANSWERS_ENABLED", "true").lower() in ("1", "true", "yes")
+FAQ_SIMILARITY_THRESHOLD = float(os.getenv("FAQ_SIMILARITY_THRESHOLD", "0.93"))
+# Built FAQ indexes are cached here (not in the vector store, which may be read-only)
+FAQ_INDEX_CACHE_DIR = os.getenv("FAQ_INDEX_CACHE_DIR", str(DATA_DIR / "cache" / "faq"))
+
+# Query-embedding cache (SQLite file shared by the API, Streamlit and evals)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", str(DATA_DIR / "cache" / "embeddings.sqlite3"))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "100000"))
+
+# Embedding pipeline (ingestion)
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "100"))
+EMBEDDING_MAX_WORKERS = int(os.getenv("EMBEDDING_MAX_WORKERS", "4"))
+EMBEDDING_REQUESTS_PER_SECOND = float(os.getenv("EMBEDDING_REQUESTS_PER_SECOND", "10"))
+EMBEDDING_MAX_RETRIES = int(os.getenv("EMBEDDING_MAX_RETRIES", "6"))
+
+# PDF parsing processes for multi-document ingestion (0 = one per CPU core)
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", "0"))
+
+# PDF text extraction backend: "pypdf" (matches the bundled index), "pymupdf" or "pymupdf-layout"
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pypdf")
+
+# Retrieval mode: "dense" (FAISS only), "hybrid" (FAISS + BM25 fused with
+# reciprocal rank fusion) or "lexical" (BM25 only, no embedding call)
+RETRIEVAL_MODE = os.getenv("RETRIEVAL_MODE", "dense").lower()
+# Candidates taken from each ranker before fusion, and the RRF rank constant
+RETRIEVAL_FETCH_K = int(os.getenv("RETRIEVAL_FETCH_K", "20"))
+RETRIEVAL_RRF_K = int(os.getenv("RETRIEVAL_RRF_K", "60"))
+# Merge overlapping/adjacent chunks of the same page into one passage, so
+# each of the k results is a different passage
+RETRIEVAL_MERGE_ADJACENT = os.getenv("RETRIEVAL_MERGE_ADJACENT", "true").lower() in ("1", "true", "yes")
+# Second-stage reranker: "none", "lexical" (vectorized BM25 + query coverage,
+# no model) or "cross-encoder" (needs sentence-transformers); candidates
+# reranked per question and the cross-encoder model
+RERANKER = os.getenv("RERANKER", "none").lower()
+RERANK_CANDIDATES = int(os.getenv("RERANK_CANDIDATES", "30"))
+RERANK_MODEL = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+
+# FAISS index type: "flat" (exact), "ivf-flat", "hnsw" or "ivf-pq" (approximate)
+FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "flat").lower()
+# IVF inverted lists (0 = about 4 * sqrt(num_chunks)) and lists probed per query
+FAISS_NLIST = int(os.getenv("FAISS_NLIST", "0"))
+FAISS_NPROBE = int(os.getenv("FAISS_NPROBE", "16"))
+# HNSW graph degree and search breadth
+FAISS_HNSW_M = int(os.getenv("FAISS_HNSW_M", "32"))
+FAISS_EF_SEARCH = int(os.getenv("FAISS_EF_SEARCH", "128"))
+# IVF-PQ sub-quantizers (must divide the embedding dimension, 768)
+FAISS_PQ_M = int(os.getenv("FAISS_PQ_M", "96"))
+
+# Memory-map FAISS indexes on load so worker processes share the page cache
+FAISS_MMAP = os.getenv("FAISS_MMAP", "true").lower() in ("1", "true", "yes")
+
+# Batch question answering: concurrent LLM generations per batch
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+# Share one pipeline run between concurrent /ask requests for the same question
+REQUEST_COALESCING_ENABLED = os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Chains kept for per-request model/temperature/k (all share one loaded index)
+CHAIN_POOL_SIZE = int(os.getenv("CHAIN_POOL_SIZE", "8"))
+
+# Context assembly: drop chunk overlap and keep the prompt context within a token budget
+CONTEXT_COMPRESSION_ENABLED = os.getenv("CONTEXT_COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes")
+CONTEXT_MAX_TOKENS = int(os.getenv("CONTEXT_MAX_TOKENS", "1200"))
+# Keep only sentences sharing a term with the question, even under budget
+CONTEXT_SENTENCE_FILTER = os.getenv("CONTEXT_SENTENCE_FILTER", "false").lower() in ("1", "true", "yes")
+CONTEXT_TOKEN_ENCODING = os.getenv("CONTEXT_TOKEN_ENCODING", "cl100k_base")
@@ -1,10 +1,12 @@
 """Utilities package for RBI NBFC Chatbot."""
 
-from .document_loader import load_pdf, split_documents
+from .document_loader import find_pdfs, load_documents, load_pdf, split_documents
 from .ingest import build_vector_store, ingest_documents
 
 __all__ = [
     "load_pdf",
+    "load_documents",
+    "find_pdfs",
     "split_documents",
     "ingest_documents",
     "build_vector_store"
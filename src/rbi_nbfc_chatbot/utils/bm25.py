@@ -0,0 +1,147 @@
+"""Okapi BM25 lexical index over the vector-store chunks.
+
+Dense embeddings blur exact regulatory tokens such as "Section 45-IA",
+"NBFC-ND-SI" or "Rs.2 crore". This index keeps those tokens intact (compound
+tokens are indexed both whole and split into parts) and scores queries with
+vectorized numpy operations over a term-major postings layout. Row `i` of the
+index is chunk `i` of the FAISS index it is saved next to (`bm25.npz`).
+"""
+
+import re
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+BM25_FILENAME = "bm25.npz"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-/][a-z0-9]+)*")
+_PART_RE = re.compile(r"[.\-/]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, keeping compounds like "45-ia" plus their parts."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        tokens.append(token)
+        if _PART_RE.search(token):
+            tokens.extend(part for part in _PART_RE.split(token) if part)
+    return tokens
+
+
+class BM25Index:
+    """
+    Immutable BM25 index stored as term-major postings arrays.
+
+    `indptr[t]:indptr[t + 1]` slices `doc_ids` / `term_freqs` to the postings
+    of term id `t`.
+    """
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        indptr: np.ndarray,
+        doc_ids: np.ndarray,
+        term_freqs: np.ndarray,
+        doc_lengths: np.ndarray,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        self.vocab: Dict[str, int] = {term: i for i, term in enumerate(terms)}
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.term_freqs = term_freqs
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+
+        n = len(doc_lengths)
+        doc_freqs = np.diff(indptr).astype(np.float32)
+        self.idf = np.log1p((n - doc_freqs + 0.5) / (doc_freqs + 0.5)).astype(np.float32)
+        avg_length = float(doc_lengths.mean()) if n else 1.0
+        # Per-document length normalization term of the BM25 denominator
+        self._norm = (k1 * (1 - b + b * doc_lengths / max(avg_length, 1e-9))).astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    @classmethod
+    def build(cls, texts: Sequence[str], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        """Index `texts`; row i of the index is texts[i]."""
+        vocab: Dict[str, int] = {}
+        rows: List[np.ndarray] = []
+        cols: List[np.ndarray] = []
+        counts: List[np.ndarray] = []
+        doc_lengths = np.zeros(len(texts), dtype=np.float32)
+
+        for doc_id, text in enumerate(texts):
+            tokens = tokenize(text)
+            doc_lengths[doc_id] = len(tokens)
+            if not tokens:
+                continue
+            ids = np.fromiter((vocab.setdefault(t, len(vocab)) for t in tokens), dtype=np.int64, count=len(tokens))
+            unique, tf = np.unique(ids, return_counts=True)
+            rows.append(unique)
+            cols.append(np.full(len(unique), doc_id, dtype=np.int32))
+            counts.append(tf.astype(np.float32))
+
+        term_ids = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        doc_ids = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int32)
+        term_freqs = np.concatenate(counts) if counts else np.zeros(0, dtype=np.float32)
+
+        order = np.argsort(term_ids, kind="stable")
+        indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(term_ids, minlength=len(vocab)), out=indptr[1:])
+
+        terms = [""] * len(vocab)
+        for term, i in vocab.items():
+            terms[i] = term
+        return cls(terms, indptr, doc_ids[order], term_freqs[order], doc_lengths, k1=k1, b=b)
+
+    def scores(self, query: str) -> np.ndarray:
+        """BM25 score of every document for `query`."""
+        scores = np.zeros(len(self), dtype=np.float32)
+        term_ids = {self.vocab[t] for t in tokenize(query) if t in self.vocab}
+        for t in term_ids:
+            start, end = self.indptr[t], self.indptr[t + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.term_freqs[start:end]
+            scores[docs] += self.idf[t] * tf * (self.k1 + 1) / (tf + self._norm[docs])
+        return scores
+
+    def search(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """Return the top-k (row, score) pairs with a positive score."""
+        scores = self.scores(query)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top if scores[i] > 0]
+
+    def save(self, path: str) -> None:
+        terms = [""] * len(self.vocab)
+        for term, i in self.vocab.items():
+            terms[i] = term
+        np.savez(
+            path,
+            terms=np.array(terms, dtype=str),
+            indptr=self.indptr,
+            doc_ids=self.doc_ids,
+            term_freqs=self.term_freqs,
+            doc_lengths=self.doc_lengths,
+            params=np.array([self.k1, self.b], dtype=np.float32),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        with np.load(path, allow_pickle=False) as data:
+            k1, b = (float(x) for x in data["params"])
+            return cls(
+                data["terms"].tolist(),
+                data["indptr"],
+                data["doc_ids"],
+                data["term_freqs"],
+                data["doc_lengths"],
+                k1=k1,
+                b=b,
+            )
@@ -0,0 +1,144 @@
+"""Compact on-disk chunk store, used in place of the pickled docstore.
+
+`FAISS.save_local` pickles every chunk's text and metadata into `index.pkl`,
+and loading it rebuilds one Python object per chunk at startup. The chunk
+store keeps the same data in three files next to `index.faiss`:
+
+- ``chunks.bin``: all chunk texts, UTF-8, concatenated in FAISS row order
+- ``chunks.offsets.npy``: int64 byte offsets; row i is bin[offsets[i]:offsets[i + 1]]
+- ``chunks.meta.npz``: one dictionary-encoded column per metadata key
+
+Text and offsets are memory-mapped, so opening the store costs almost
+nothing and a Document is materialized only for the rows a query returns.
+`ChunkStore` implements LangChain's `Docstore` interface with FAISS row
+numbers as ids (see `RowIds`), so it plugs straight into the FAISS vector
+store.
+"""
+
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterator, Mapping, Sequence, Union
+
+import numpy as np
+from langchain.schema import Document
+from langchain_community.docstore.base import Docstore
+
+CHUNK_TEXT_FILENAME = "chunks.bin"
+CHUNK_OFFSETS_FILENAME = "chunks.offsets.npy"
+CHUNK_METADATA_FILENAME = "chunks.meta.npz"
+
+
+def _replace_atomically(path: str, write) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def write_chunk_store(index_path: str, documents: Sequence[Document]) -> None:
+    """
+    Write the chunk store for `documents` (in FAISS row order) to `index_path`.
+
+    Args:
+        index_path: Vector store directory
+        documents: Chunk Documents; row i of the store is documents[i]
+    """
+    encoded = [doc.page_content.encode("utf-8") for doc in documents]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(text) for text in encoded], out=offsets[1:])
+
+    # Columnar metadata: codes[i] indexes the JSON-encoded value of row i (-1: key absent)
+    columns: Dict[str, Dict[str, int]] = {}
+    codes: Dict[str, np.ndarray] = {}
+    for row, doc in enumerate(documents):
+        for key, value in doc.metadata.items():
+            if key not in columns:
+                columns[key] = {}
+                codes[key] = np.full(len(documents), -1, dtype=np.int32)
+            values = columns[key]
+            encoded_value = json.dumps(value, sort_keys=True, default=str)
+            codes[key][row] = values.setdefault(encoded_value, len(values))
+
+    arrays = {"columns": np.array(list(columns), dtype=str)}
+    for i, (key, values) in enumerate(columns.items()):
+        arrays[f"codes_{i}"] = codes[key]
+        arrays[f"values_{i}"] = np.array(list(values), dtype=str)
+
+    # Offsets last: has_chunk_store checks them against the index row count
+    _replace_atomically(os.path.join(index_path, CHUNK_TEXT_FILENAME), lambda f: f.write(b"".join(encoded)))
+    _replace_atomically(os.path.join(index_path, CHUNK_METADATA_FILENAME), lambda f: np.savez(f, **arrays))
+    _replace_atomically(os.path.join(index_path, CHUNK_OFFSETS_FILENAME), lambda f: np.save(f, offsets))
+
+
+def has_chunk_store(index_path: str, num_rows: int) -> bool:
+    """
+    True if `index_path` has a chunk store with `num_rows` rows.
+
+    Ingestion rewrites the chunk store with every index; an index saved some
+    other way (a bare `FAISS.save_local`) needs `scripts/convert_docstore.py`.
+    """
+    paths = [os.path.join(index_path, name) for name in (
+        CHUNK_TEXT_FILENAME, CHUNK_OFFSETS_FILENAME, CHUNK_METADATA_FILENAME
+    )]
+    if not all(os.path.exists(path) for path in paths):
+        return False
+    return len(np.load(paths[1], mmap_mode="r")) == num_rows + 1
+
+
+class RowIds(Mapping):
+    """Identity mapping row -> row, standing in for `index_to_docstore_id`."""
+
+    def __init__(self, num_rows: int):
+        self._num_rows = num_rows
+
+    def __getitem__(self, row: int) -> int:
+        if 0 <= row < self._num_rows:
+            return row
+        raise KeyError(row)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._num_rows))
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+
+class ChunkStore(Docstore):
+    """Read-only, memory-mapped chunk store; ids are FAISS row numbers."""
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self._offsets = np.load(os.path.join(index_path, CHUNK_OFFSETS_FILENAME), mmap_mode="r")
+        with open(os.path.join(index_path, CHUNK_TEXT_FILENAME), "rb") as f:
+            # mmap cannot map an empty file
+            self._text = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self._offsets[-1] else b""
+        with np.load(os.path.join(index_path, CHUNK_METADATA_FILENAME), allow_pickle=False) as data:
+            self._columns = [
+                (str(name), data[f"codes_{i}"], data[f"values_{i}"].tolist())
+                for i, name in enumerate(data["columns"].tolist())
+            ]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def row_ids(self) -> RowIds:
+        return RowIds(len(self))
+
+    def text(self, row: int) -> str:
+        start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+        return self._text[start:end].decode("utf-8")
+
+    def metadata(self, row: int) -> Dict[str, Any]:
+        metadata = {}
+        for name, codes, values in self._columns:
+            code = codes[row]
+            if code >= 0:
+                metadata[name] = json.loads(values[code])
+        return metadata
+
+    def search(self, search: Union[int, str]) -> Union[str, Document]:
+        row = int(search)
+        if not 0 <= row < len(self):
+            return f"ID {search} not found."
+        return Document(page_content=self.text(row), metadata=self.metadata(row))
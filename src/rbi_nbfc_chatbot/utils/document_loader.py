@@ -1,63 +1,233 @@
 """Document loading utilities for PDF processing."""
 
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.document_loaders import PyPDFLoader
 
-from ..config import CHUNK_OVERLAP, CHUNK_SIZE, PDF_PATH
+from ..config import CHUNK_OVERLAP, CHUNK_SIZE, CHUNK_STRATEGY, PDF_PARSE_WORKERS, PDF_PATH
+from .pdf_backends import get_pdf_backend
+from .regulatory_splitter import RegulatoryTextSplitter
 
+CHUNK_STRATEGIES = ("recursive", "regulatory")
 
-def load_pdf(pdf_path: str = None) -> List[Document]:
+# Front-matter patterns found on RBI circulars and Master Directions
+_CIRCULAR_NUMBER_RE = re.compile(r"\bRBI/(?:[A-Za-z]+/)*\d{4}-\d{2}/\d+")
+_REFERENCE_NUMBER_RE = re.compile(r"\b[A-Z][A-Za-z]*(?:\.[A-Za-z]+)*\.No\.\s?[\w.]+(?:/[\w.\-]+)*")
+_DATE_RE = re.compile(
+    r"\b(January|February|March|April|May|June|July|August|September|October|November|December)"
+    r"\s+(\d{1,2}),\s+(\d{4})"
+)
+# pypdf often splits number groups ("RBI/DoR/202 3-24/ 106"); rejoin them before matching
+_NUMBER_GAP_RE = re.compile(r"(?<=[\d/.\-]) +(?=[\d/.\-])")
+_DEPARTMENT_RE = re.compile(r"\bDepartment of ([A-Za-z][A-Za-z &,]+?)\s*(?:\n|$|,)", re.IGNORECASE)
+
+
+def load_pdf(pdf_path: str = None, backend: Optional[str] = None) -> List[Document]:
     """
     Load a PDF file and extract its content.
     
     Args:
         pdf_path: Path to PDF file (default: from config)
+        backend: Extraction backend name, see `pdf_backends` (default: from config)
     
     Returns:
         List of Document objects
     
     Raises:
         FileNotFoundError: If PDF file doesn't exist
+        ValueError: If the backend name is unknown
     """
     pdf_path = pdf_path or str(PDF_PATH)
 
     if not Path(pdf_path).exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    loader = PyPDFLoader(pdf_path)
-    documents = loader.load()
+    documents = get_pdf_backend(backend)(pdf_path)
 
     return documents
 
 
+def find_pdfs(path: Union[str, Path]) -> List[str]:
+    """
+    Resolve a PDF file, a directory, or a glob pattern into PDF paths.
+    
+    Directories are searched recursively.
+    
+    Args:
+        path: File path, directory, or glob pattern (e.g. "data/documents/*.pdf")
+    
+    Returns:
+        Sorted list of PDF file paths
+    
+    Raises:
+        FileNotFoundError: If no PDF files match
+    """
+    path = str(path)
+    if os.path.isfile(path):
+        matches = [path]
+    elif os.path.isdir(path):
+        matches = [str(p) for p in Path(path).rglob("*") if p.suffix.lower() == ".pdf"]
+    else:
+        matches = [p for p in glob.glob(path, recursive=True) if p.lower().endswith(".pdf")]
+
+    if not matches:
+        raise FileNotFoundError(f"No PDF files found at: {path}")
+    return sorted(matches)
+
+
+def extract_document_metadata(text: str) -> Dict[str, Any]:
+    """
+    Extract circular number, reference, date and department from front matter.
+    
+    Args:
+        text: Text of the document's first page
+    
+    Returns:
+        Dictionary with circular_number, reference_number, circular_date
+        (ISO format) and department; values are None when not found
+    """
+    metadata: Dict[str, Any] = {
+        "circular_number": None,
+        "reference_number": None,
+        "circular_date": None,
+        "department": None,
+    }
+
+    compact = _NUMBER_GAP_RE.sub("", text)
+    match = _CIRCULAR_NUMBER_RE.search(compact)
+    if match:
+        metadata["circular_number"] = match.group(0)
+
+    match = _REFERENCE_NUMBER_RE.search(compact)
+    if match:
+        metadata["reference_number"] = match.group(0)
+
+    match = _DATE_RE.search(text)
+    if match:
+        parsed = datetime.strptime(" ".join(match.groups()), "%B %d %Y")
+        metadata["circular_date"] = parsed.date().isoformat()
+
+    match = _DEPARTMENT_RE.search(text)
+    if match:
+        metadata["department"] = "Department of " + match.group(1).strip().title().replace(" Of ", " of ")
+
+    return metadata
+
+
+def _load_pdf_with_metadata(pdf_path: str, backend: Optional[str] = None) -> List[Document]:
+    """Load one PDF and tag every page with its document-level metadata.
+
+    Module-level so it can run in a worker process.
+    """
+    pages = load_pdf(pdf_path, backend=backend)
+    doc_metadata = extract_document_metadata(pages[0].page_content if pages else "")
+    doc_metadata["document"] = Path(pdf_path).name
+    for page in pages:
+        page.metadata.update(doc_metadata)
+    return pages
+
+
+def iter_documents(
+    paths: Sequence[str],
+    max_workers: Optional[int] = None,
+    backend: Optional[str] = None
+) -> Iterator[List[Document]]:
+    """
+    Parse PDFs in a process pool, yielding each file's pages as it is ready.
+    
+    Files are yielded in input order, so callers can split and index pages
+    while later files are still being parsed.
+    
+    Args:
+        paths: PDF file paths
+        max_workers: Parser processes (default: from config, or CPU count)
+        backend: Extraction backend name (default: from config)
+    
+    Yields:
+        List of page Documents for one PDF
+    """
+    max_workers = max_workers or PDF_PARSE_WORKERS or os.cpu_count() or 1
+    load = partial(_load_pdf_with_metadata, backend=backend)
+    if len(paths) <= 1 or max_workers <= 1:
+        for path in paths:
+            yield load(path)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        yield from pool.map(load, paths)
+
+
+def load_documents(
+    path: Union[str, Path, None] = None,
+    max_workers: Optional[int] = None,
+    backend: Optional[str] = None
+) -> List[Document]:
+    """
+    Load every PDF under a file, directory or glob pattern.
+    
+    Args:
+        path: PDF file, directory, or glob pattern (default: PDF_PATH from config)
+        max_workers: Parser processes (default: from config, or CPU count)
+        backend: Extraction backend name (default: from config)
+    
+    Returns:
+        List of page Documents with per-document metadata attached
+    """
+    paths = find_pdfs(path or PDF_PATH)
+    return [page for pages in iter_documents(paths, max_workers=max_workers, backend=backend) for page in pages]
+
+
 def split_documents(
     documents: List[Document],
     chunk_size: int = None,
-    chunk_overlap: int = None
+    chunk_overlap: int = None,
+    strategy: Optional[str] = None
 ) -> List[Document]:
     """
     Split documents into chunks for embedding.
     
+    Each chunk records its character offset within its page as
+    "start_index", so retrieval can merge adjacent chunks. The "regulatory"
+    strategy splits at chapters, sections and numbered paragraphs and also
+    records "chapter", "section", "paragraph" and "paragraphs" (see
+    `RegulatoryTextSplitter`); "recursive" splits at blank lines, newlines
+    and spaces.
+    
     Args:
-        documents: List of documents to split
+        documents: List of documents to split (pages in reading order)
         chunk_size: Size of each chunk (default: from config)
         chunk_overlap: Overlap between chunks (default: from config)
+        strategy: "regulatory" or "recursive" (default: from config)
     
     Returns:
         List of chunked documents
+    
+    Raises:
+        ValueError: If the strategy is unknown
     """
     chunk_size = chunk_size or CHUNK_SIZE
     chunk_overlap = chunk_overlap or CHUNK_OVERLAP
+    strategy = (strategy or CHUNK_STRATEGY).lower()
+    if strategy not in CHUNK_STRATEGIES:
+        raise ValueError(f"Unknown chunk strategy '{strategy}'. Choose one of: {', '.join(CHUNK_STRATEGIES)}")
+
+    if strategy == "regulatory":
+        return RegulatoryTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap).split_documents(documents)
 
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=chunk_size,
         chunk_overlap=chunk_overlap,
         length_function=len,
-        separators=["\n\n", "\n", " ", ""]
+        separators=["\n\n", "\n", " ", ""],
+        add_start_index=True
     )
 
     chunks = text_splitter.split_documents(documents)
@@ -0,0 +1,171 @@
+"""Persistent query-embedding cache.
+
+Every question is embedded over the network before FAISS can search. This
+module stores query embeddings in a small SQLite database keyed by embedding
+model + normalized text, so identical questions skip the round-trip. The
+database file is shared by the API server, the Streamlit app and evaluation
+runs (SQLite handles concurrent processes), and is bounded by evicting the
+least recently used rows.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from ..config import EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_PATH
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+"""
+
+
+def _cache_key(model: str, text: str) -> str:
+    normalized = _WHITESPACE_RE.sub(" ", text).strip()
+    return hashlib.sha256(f"{model}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embedding vectors with LRU eviction.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (default: from config)
+            max_entries: Maximum number of stored vectors (default: from config)
+        """
+        self.path = str(path or EMBEDDING_CACHE_PATH)
+        self.max_entries = max_entries or EMBEDDING_CACHE_MAX_ENTRIES
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Return the cached vector for `text` under `model`, if present."""
+        key = _cache_key(model, text)
+        with self._lock:
+            row = self._conn.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE embeddings SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+    def put(self, model: str, text: str, vector: List[float]) -> None:
+        """Store `vector` for `text` under `model`, evicting old rows if needed."""
+        blob = np.asarray(vector, dtype=np.float32).tobytes()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) VALUES (?, ?, ?, ?)",
+                (_cache_key(model, text), model, blob, time.time()),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves repeated queries from an `EmbeddingCache`.
+
+    Only query embeddings are cached; document embeddings pass straight
+    through to the underlying model.
+    """
+
+    def __init__(self, underlying: Embeddings, cache: EmbeddingCache, model_name: str):
+        self.underlying = underlying
+        self.cache = cache
+        self.model_name = model_name
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.underlying.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = self.cache.get(self.model_name, text)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self.cache.put(self.model_name, text, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        vector = self.cache.get(self.model_name, text)
+        if vector is None:
+            vector = await self.underlying.aembed_query(text)
+            self.cache.put(self.model_name, text, vector)
+        return vector
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed many queries, sending only the cache misses in one batch."""
+        vectors = [self.cache.get(self.model_name, text) for text in texts]
+        misses = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if misses:
+            embedded = dict(zip(misses, embed_queries(self.underlying, misses)))
+            for text, vector in embedded.items():
+                self.cache.put(self.model_name, text, vector)
+            vectors = [embedded[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        return vectors
+
+
+def embed_queries(embeddings: Embeddings, texts: List[str]) -> List[List[float]]:
+    """
+    Embed many queries with as few embedding requests as the model allows.
+
+    Gemini embeds queries and documents differently (task type), so queries
+    cannot go through plain `embed_documents`; its batch API is called with
+    the query task type instead. Other models fall back to one
+    `embed_query` call per text.
+
+    Args:
+        embeddings: Embedding model
+        texts: Query texts
+
+    Returns:
+        One vector per text, in input order
+    """
+    if hasattr(embeddings, "embed_queries"):
+        return embeddings.embed_queries(texts)
+    if isinstance(embeddings, GoogleGenerativeAIEmbeddings):
+        return embeddings.embed_documents(texts, task_type=embeddings.task_type or "RETRIEVAL_QUERY")
+    return [embeddings.embed_query(text) for text in texts]
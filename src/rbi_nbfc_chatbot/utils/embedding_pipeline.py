@@ -0,0 +1,231 @@
+"""Batched, concurrent embedding with rate limiting and checkpointing.
+
+`embed_in_batches` splits texts into fixed-size batches and embeds them on a
+bounded pool of worker threads. Requests are paced by a shared token bucket
+that halves its rate whenever the API answers 429 and slowly recovers on
+success, while the failing batch retries with exponential backoff. Finished
+batches are appended to a checkpoint file so an interrupted rebuild resumes
+where it stopped.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+from ..config import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_RETRIES,
+    EMBEDDING_MAX_WORKERS,
+    EMBEDDING_REQUESTS_PER_SECOND,
+)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive (AIMD) rate.
+
+    `penalize` halves the refill rate after a rate-limit response; each
+    `reward` adds back a small fraction until the configured rate is reached.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def reward(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+
+_RATE_LIMIT_MARKERS = ("429", "resource exhausted", "resource_exhausted", "rate limit", "quota")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Return True if `error` looks like an HTTP 429 / quota exhaustion."""
+    for attr in ("code", "status_code", "status"):
+        if getattr(error, attr, None) == 429:
+            return True
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+class EmbeddingCheckpoint:
+    """Append-only JSONL file of `{"key": ..., "vector": [...]}` records."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, List[float]]:
+        vectors: Dict[str, List[float]] = {}
+        if not os.path.exists(self.path):
+            return vectors
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+                vectors[record["key"]] = record["vector"]
+        return vectors
+
+    def append(self, keys: Sequence[str], vectors: Sequence[List[float]]) -> None:
+        lines = "".join(json.dumps({"key": k, "vector": list(v)}) + "\n" for k, v in zip(keys, vectors))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class EmbeddingStats:
+    """Counters describing one `embed_in_batches` run."""
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.resumed = 0
+        self.retries = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(vars(self))
+
+
+def embed_in_batches(
+    texts: Sequence[str],
+    embeddings: Embeddings,
+    keys: Optional[Sequence[str]] = None,
+    batch_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    stats: Optional[EmbeddingStats] = None
+) -> List[List[float]]:
+    """
+    Embed `texts` in batches on a bounded worker pool.
+
+    Args:
+        texts: Texts to embed
+        embeddings: Embedding model
+        keys: Stable identifier per text, used for checkpointing (default: the text itself)
+        batch_size: Texts per embedding request (default: from config)
+        max_workers: Concurrent requests (default: from config)
+        requests_per_second: Request budget shared by all workers (default: from config)
+        max_retries: Retries per batch on rate-limit errors (default: from config)
+        checkpoint_path: JSONL file to resume from and append finished batches to
+        progress: Called with (texts_done, total) after each batch
+        stats: Optional counters object filled in during the run
+
+    Returns:
+        One vector per input text, in input order
+
+    Raises:
+        Exception: The last error if a batch keeps failing, or any non-rate-limit error
+    """
+    batch_size = batch_size or EMBEDDING_BATCH_SIZE
+    max_workers = max_workers or EMBEDDING_MAX_WORKERS
+    requests_per_second = requests_per_second or EMBEDDING_REQUESTS_PER_SECOND
+    max_retries = EMBEDDING_MAX_RETRIES if max_retries is None else max_retries
+    keys = list(keys) if keys is not None else list(texts)
+    stats = stats or EmbeddingStats()
+    start = time.perf_counter()
+
+    checkpoint = EmbeddingCheckpoint(checkpoint_path) if checkpoint_path else None
+    done: Dict[str, List[float]] = checkpoint.load() if checkpoint else {}
+    stats.resumed = sum(1 for key in set(keys) if key in done)
+
+    # Unique pending texts, batched in input order
+    pending: Dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key not in done and key not in pending:
+            pending[key] = text
+    pending_keys = list(pending)
+    batches = [pending_keys[i:i + batch_size] for i in range(0, len(pending_keys), batch_size)]
+
+    bucket = TokenBucket(requests_per_second)
+    key_counts = Counter(keys)
+    total = len(texts)
+    completed = total - sum(key_counts[key] for key in pending_keys)
+    stats_lock = threading.Lock()
+    if progress:
+        progress(completed, total)
+
+    def run_batch(batch_keys: List[str]) -> List[List[float]]:
+        batch_texts = [pending[key] for key in batch_keys]
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                vectors = embeddings.embed_documents(batch_texts)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= max_retries:
+                    raise
+                # Slow every worker down, then back off this batch with jitter
+                bucket.penalize()
+                with stats_lock:
+                    stats.retries += 1
+                time.sleep(min(30.0, 0.5 * 2 ** attempt) * (0.5 + random.random()))
+                attempt += 1
+                continue
+            bucket.reward()
+            return vectors
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(run_batch, batch): batch for batch in batches}
+        try:
+            for future in as_completed(futures):
+                batch_keys = futures[future]
+                vectors = future.result()
+                if checkpoint:
+                    checkpoint.append(batch_keys, vectors)
+                done.update(zip(batch_keys, vectors))
+                stats.batches += 1
+                completed += sum(key_counts[key] for key in batch_keys)
+                if progress:
+                    progress(completed, total)
+        except BaseException:
+            # Finished batches are already checkpointed; don't start new ones
+            for future in futures:
+                future.cancel()
+            raise
+
+    stats.seconds = time.perf_counter() - start
+    return [done[key] for key in keys]
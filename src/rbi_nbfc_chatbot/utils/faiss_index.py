@@ -0,0 +1,226 @@
+"""FAISS index construction and query-time tuning.
+
+`FAISS.from_embeddings` always builds an exact `IndexFlatL2`, which scans
+every vector per query. For large corpora `build_faiss_index` can instead
+build an approximate index over the same vectors (same L2 metric, same row
+order, so the LangChain docstore mapping stays valid):
+
+- ``flat``: exact search (the default)
+- ``ivf-flat``: k-means inverted lists; only `nprobe` lists are scanned
+- ``hnsw``: hierarchical navigable small-world graph; breadth set by `efSearch`
+- ``ivf-pq``: inverted lists with product-quantized vectors (lossy, smallest)
+
+Approximate indexes cannot give back the exact vectors they were built from,
+so the raw vectors are kept in `vectors.npy` next to them for incremental
+re-ingestion.
+
+`load_vector_store` reads an index with `IO_FLAG_MMAP`: the inverted lists of
+IVF indexes are then mapped from the page cache instead of copied into each
+process, so API workers and Streamlit share one copy. (FAISS 1.8 still reads
+flat and HNSW storage into the heap; use an IVF index type to share memory.)
+"""
+
+import math
+import os
+import pickle
+import struct
+from typing import Optional
+
+import faiss
+import numpy as np
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
+
+from ..config import FAISS_EF_SEARCH, FAISS_HNSW_M, FAISS_MMAP, FAISS_NLIST, FAISS_NPROBE, FAISS_PQ_M
+from .chunk_store import ChunkStore, has_chunk_store
+
+INDEX_TYPES = ("flat", "ivf-flat", "hnsw", "ivf-pq")
+VECTORS_FILENAME = "vectors.npy"
+
+# k-means wants roughly this many training points per centroid
+_MIN_POINTS_PER_CENTROID = 39
+
+
+def _default_nlist(num_vectors: int) -> int:
+    nlist = FAISS_NLIST or int(4 * math.sqrt(num_vectors))
+    return max(1, min(nlist, num_vectors // _MIN_POINTS_PER_CENTROID))
+
+
+def build_faiss_index(
+    vectors: np.ndarray,
+    index_type: str = "flat",
+    nlist: Optional[int] = None,
+    hnsw_m: Optional[int] = None,
+    pq_m: Optional[int] = None
+) -> faiss.Index:
+    """
+    Build (and train, where needed) a FAISS index over `vectors`.
+
+    Args:
+        vectors: float32 array of shape (n, d); row i becomes index row i
+        index_type: One of INDEX_TYPES
+        nlist: IVF inverted lists (default: from config, capped by corpus size)
+        hnsw_m: HNSW neighbours per node (default: from config)
+        pq_m: IVF-PQ sub-quantizers; must divide d (default: from config)
+
+    Returns:
+        A populated FAISS index using the L2 metric
+
+    Raises:
+        ValueError: If the index type is unknown or pq_m does not divide d
+    """
+    index_type = index_type.lower()
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown FAISS index type '{index_type}'. Choose one of: {', '.join(INDEX_TYPES)}")
+
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    n, d = vectors.shape
+
+    if index_type == "flat":
+        index = faiss.IndexFlatL2(d)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(d, hnsw_m or FAISS_HNSW_M)
+    else:
+        nlist = max(1, min(nlist or _default_nlist(n), n))
+        quantizer = faiss.IndexFlatL2(d)
+        if index_type == "ivf-flat":
+            index = faiss.IndexIVFFlat(quantizer, d, nlist)
+        else:
+            pq_m = pq_m or FAISS_PQ_M
+            if d % pq_m:
+                raise ValueError(f"FAISS_PQ_M={pq_m} must divide the embedding dimension {d}")
+            # 8-bit codes need 256 centroids per sub-quantizer; use fewer bits for small corpora
+            nbits = max(1, min(8, int(math.log2(max(2, n // _MIN_POINTS_PER_CENTROID)))))
+            index = faiss.IndexIVFPQ(quantizer, d, nlist, pq_m, nbits)
+        index.train(vectors)
+
+    index.add(vectors)
+    configure_search(index)
+    return index
+
+
+def configure_search(
+    index: faiss.Index,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None
+) -> faiss.Index:
+    """
+    Set query-time accuracy/speed knobs on an approximate index.
+
+    Flat indexes are returned unchanged.
+
+    Args:
+        index: FAISS index
+        nprobe: IVF lists scanned per query (default: from config)
+        ef_search: HNSW candidate list size per query (default: from config)
+
+    Returns:
+        The same index, for chaining
+    """
+    try:
+        ivf = faiss.extract_index_ivf(index)
+    except RuntimeError:
+        ivf = None
+    if ivf is not None:
+        ivf.nprobe = min(nprobe or FAISS_NPROBE, ivf.nlist)
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = ef_search or FAISS_EF_SEARCH
+    return index
+
+
+def index_type_of(index: faiss.Index) -> str:
+    """Name an index the way INDEX_TYPES does."""
+    if isinstance(index, faiss.IndexHNSW):
+        return "hnsw"
+    if isinstance(index, faiss.IndexIVFPQ):
+        return "ivf-pq"
+    if isinstance(index, faiss.IndexIVF):
+        return "ivf-flat"
+    return "flat"
+
+
+def load_raw_vectors(index_path: str, ntotal: int) -> Optional[np.ndarray]:
+    """Load the exact vectors saved next to an approximate index, if they match it."""
+    path = os.path.join(index_path, VECTORS_FILENAME)
+    if not os.path.exists(path):
+        return None
+    vectors = np.load(path)
+    return vectors if len(vectors) == ntotal else None
+
+
+def save_raw_vectors(index_path: str, vectors: Optional[np.ndarray]) -> None:
+    """Save (or, for None, remove) the exact vectors kept next to an index."""
+    path = os.path.join(index_path, VECTORS_FILENAME)
+    if vectors is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.asarray(vectors, dtype=np.float32))
+    os.replace(tmp_path, path)
+
+
+def read_faiss_dimension(index_path: str) -> Optional[int]:
+    """
+    Read the dimension (d) of the FAISS index in `index_path` from its header.
+
+    Every FAISS index file starts with a 4-byte type code followed by the
+    int32 dimension, so only the first 8 bytes are read.
+    """
+    try:
+        with open(os.path.join(index_path, "index.faiss"), "rb") as f:
+            header = f.read(8)
+    except OSError:
+        return None
+    if len(header) < 8:
+        return None
+    return struct.unpack("<i", header[4:])[0] or None
+
+
+def read_faiss_index(index_file: str, mmap: Optional[bool] = None) -> faiss.Index:
+    """
+    Read a FAISS index file, memory-mapping it where FAISS supports that.
+
+    Args:
+        index_file: Path to an `index.faiss` file
+        mmap: Map the index read-only instead of copying it (default: from config)
+
+    Returns:
+        The FAISS index
+    """
+    mmap = FAISS_MMAP if mmap is None else mmap
+    if mmap:
+        try:
+            return faiss.read_index(index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            # Index types or builds without mmap support
+            pass
+    return faiss.read_index(index_file)
+
+
+def load_vector_store(index_path: str, embeddings: Embeddings, mmap: Optional[bool] = None) -> FAISS:
+    """
+    Load a LangChain FAISS vector store saved with `save_local`.
+
+    Equivalent to `FAISS.load_local`, except that the index is read with
+    `read_faiss_index` so it can be memory-mapped, and chunks come from the
+    memory-mapped chunk store when one is present. Only stores without a
+    chunk store fall back to unpickling `index.pkl`.
+
+    Args:
+        index_path: Vector store directory
+        embeddings: Embedding model for queries
+        mmap: Memory-map the index (default: from config)
+
+    Returns:
+        FAISS vector store instance
+    """
+    index = read_faiss_index(os.path.join(index_path, "index.faiss"), mmap=mmap)
+    if has_chunk_store(index_path, index.ntotal):
+        docstore = ChunkStore(index_path)
+        return FAISS(embeddings, index, docstore, docstore.row_ids())
+
+    with open(os.path.join(index_path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
@@ -0,0 +1,99 @@
+"""Cross-process file locks.
+
+A `threading.Lock` only excludes threads of one process, but uvicorn
+workers, the Streamlit app and command-line ingestion are separate
+processes sharing the snapshot root and the ingestion job directory.
+`FileLock` holds an exclusive OS lock on a lock file (`fcntl.flock`, or
+`msvcrt.locking` on Windows). The OS drops the lock when its holder exits,
+so a crashed process never leaves a stale lock behind. Each `FileLock` opens
+its own file descriptor, so it also excludes threads of the same process.
+"""
+
+import os
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# How often a blocking acquire retries on Windows (msvcrt cannot wait indefinitely)
+_POLL_SECONDS = 0.05
+
+
+class FileLock:
+    """Exclusive lock on `path`, usable as a context manager."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Lock the file, creating it if needed.
+
+        Args:
+            blocking: Wait for the lock (else give up at once if it is held)
+
+        Returns:
+            True if the lock was acquired (always, when blocking)
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            else:
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+                        time.sleep(_POLL_SECONDS)
+        except OSError:
+            os.close(fd)
+            if blocking:
+                raise
+            return False
+        self._fd = fd
+        return True
+
+    def release(self, remove: bool = False) -> None:
+        """
+        Unlock the file (a no-op if it is not locked).
+
+        Args:
+            remove: Delete the lock file first, while it is still held (a
+                process waiting on it then holds a lock on a deleted file,
+                so it must re-check whatever the lock protected)
+        """
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        if remove:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
@@ -1,101 +1,350 @@
 """Document ingestion and vector store creation."""
 
 import os
+import pickle
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import faiss
+import numpy as np
 from langchain.schema import Document
 from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 from ..config import (
+    CHUNK_OVERLAP,
+    CHUNK_SIZE,
+    FAISS_INDEX_TYPE,
     GOOGLE_API_KEY,
     GOOGLE_EMBEDDING_MODEL,
     PDF_PATH,
     VECTOR_STORE_PATH,
+    VECTOR_STORE_SNAPSHOTS,
+    VECTOR_STORE_SNAPSHOTS_DIR,
+)
+from .bm25 import BM25_FILENAME, BM25Index
+from .chunk_store import write_chunk_store
+from .document_loader import find_pdfs, iter_documents, split_documents
+from .embedding_pipeline import EmbeddingStats, ProgressCallback, embed_in_batches
+from .faiss_index import (
+    INDEX_TYPES,
+    build_faiss_index,
+    index_type_of,
+    load_raw_vectors,
+    load_vector_store,
+    read_faiss_dimension,
+    read_faiss_index,
+    save_raw_vectors,
+)
+from .manifest import chunk_hash, load_manifest, save_manifest
+from .snapshots import (
+    claim_staging,
+    commit_snapshot,
+    current_snapshot,
+    new_snapshot_name,
+    prune_snapshots,
+    publish_snapshot,
+    resolve_index_path,
+    snapshot_path,
 )
-from .document_loader import load_pdf, split_documents
 
+CHECKPOINT_FILENAME = "embedding_checkpoint.jsonl"
 
-def _read_faiss_dimension(index_path: str) -> Optional[int]:
-    """Read the dimension (d) from a FAISS index on disk, if present."""
-    try:
-        candidate = os.path.join(index_path, "index.faiss")
-        if os.path.exists(candidate):
-            idx = faiss.read_index(candidate)
-            return int(getattr(idx, "d", 0)) or None
-    except Exception:
-        return None
-    return None
+
+def _stored_vectors(
+    index_path: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    embedding_model: str
+) -> Dict[str, np.ndarray]:
+    """Map chunk hash -> stored vector for an existing vector store."""
+    index_file = os.path.join(index_path, "index.faiss")
+    if not os.path.exists(index_file):
+        return {}
+
+    index = read_faiss_index(index_file)
+    manifest = load_manifest(index_path)
+    if manifest is not None:
+        hashes = manifest["chunks"]
+    else:
+        # Stores built before manifests existed: assume they used the current
+        # chunking parameters and embedding model, and hash the stored text.
+        with open(os.path.join(index_path, "index.pkl"), "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)
+        hashes = [
+            chunk_hash(
+                docstore.search(index_to_docstore_id[i]).page_content,
+                chunk_size,
+                chunk_overlap,
+                embedding_model,
+            )
+            for i in range(index.ntotal)
+        ]
+
+    if len(hashes) != index.ntotal:
+        print("⚠️  Manifest does not match the index on disk; re-embedding all chunks")
+        return {}
+
+    # Approximate indexes keep their exact vectors in a side file
+    vectors = load_raw_vectors(index_path, index.ntotal)
+    if vectors is None:
+        if index_type_of(index) != "flat":
+            print("⚠️  Raw vectors for the approximate index are missing; re-embedding all chunks")
+            return {}
+        vectors = index.reconstruct_n(0, index.ntotal)
+    return dict(zip(hashes, vectors))
 
 
 def build_vector_store(
     documents: List[Document],
     api_key: Optional[str] = None,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    embeddings: Optional[Embeddings] = None,
+    incremental: bool = True,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: Optional[int] = None,
+    index_type: Optional[str] = None,
+    reuse_path: Optional[str] = None,
+    manifest_extra: Optional[Dict[str, Any]] = None,
+    progress: Optional[ProgressCallback] = None
 ) -> FAISS:
     """
     Build a FAISS vector store from documents.
     
+    Each chunk is identified by a hash of its text, the chunking parameters
+    and the embedding model. When `incremental` is set and a vector store
+    already exists at `output_path` (or `reuse_path`), vectors for unchanged chunks are reused,
+    only new chunks are embedded, and chunks that no longer exist are dropped.
+    A `manifest.json` recording the hash of every row, a BM25 lexical index
+    (`bm25.npz`) and a memory-mapped chunk store (`chunks.*`) are saved
+    alongside the index.
+    
+    New chunks are embedded in batches on a rate-limited worker pool (see
+    `embed_in_batches`); finished batches are checkpointed so an interrupted
+    build resumes without re-embedding them.
+    
+    With an approximate `index_type` (IVF-Flat, HNSW or IVF-PQ) the index is
+    trained on the chunk vectors, and the exact vectors are saved next to it
+    (`vectors.npy`) so later incremental builds can still reuse them.
+    
     Args:
         documents: List of document chunks
         api_key: Google API key (default: from config)
         output_path: Path to save the vector store (default: from config)
+        embeddings: Embedding model (default: Gemini embeddings from config)
+        incremental: Reuse stored vectors for unchanged chunks
+        chunk_size: Chunk size the documents were split with (default: from config)
+        chunk_overlap: Chunk overlap the documents were split with (default: from config)
+        index_type: "flat", "ivf-flat", "hnsw" or "ivf-pq" (default: from config)
+        reuse_path: Existing vector store to reuse vectors from (default: output_path)
+        manifest_extra: Additional fields to record in the manifest
+        progress: Called with (chunks_embedded, chunks_to_embed) as batches finish
     
     Returns:
         FAISS vector store instance
+    
+    Raises:
+        ValueError: If API key is missing or the index type is unknown
     """
-    api_key = api_key or GOOGLE_API_KEY
-    if not api_key:
-        raise ValueError("Google API key is required. Set GOOGLE_API_KEY in .env file")
     output_path = output_path or VECTOR_STORE_PATH
+    chunk_size = chunk_size or CHUNK_SIZE
+    chunk_overlap = chunk_overlap or CHUNK_OVERLAP
+    index_type = (index_type or FAISS_INDEX_TYPE).lower()
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown FAISS index type '{index_type}'. Choose one of: {', '.join(INDEX_TYPES)}")
 
     # Initialize embeddings
-    embeddings = GoogleGenerativeAIEmbeddings(
-        model=GOOGLE_EMBEDDING_MODEL,
-        google_api_key=api_key,
-    )
+    if embeddings is None:
+        api_key = api_key or GOOGLE_API_KEY
+        if not api_key:
+            raise ValueError("Google API key is required. Set GOOGLE_API_KEY in .env file")
+        embeddings = GoogleGenerativeAIEmbeddings(
+            model=GOOGLE_EMBEDDING_MODEL,
+            google_api_key=api_key,
+        )
+    embedding_model = getattr(embeddings, "model", None) or GOOGLE_EMBEDDING_MODEL
+
+    # Work out which chunks actually need embedding
+    hashes = [chunk_hash(doc.page_content, chunk_size, chunk_overlap, embedding_model) for doc in documents]
+    reuse_path = reuse_path or output_path
+    vectors = _stored_vectors(reuse_path, chunk_size, chunk_overlap, embedding_model) if incremental else {}
+    removed = len(set(vectors) - set(hashes))
+
+    to_embed: Dict[str, str] = {}
+    for h, doc in zip(hashes, documents):
+        if h not in vectors and h not in to_embed:
+            to_embed[h] = doc.page_content
+    reused = sum(1 for h in hashes if h in vectors)
 
     # Create vector store
     print(f"Creating vector store from {len(documents)} document chunks...")
-    vectorstore = FAISS.from_documents(documents, embeddings)
+    print(f"   ♻️  Reused: {reused}  🆕 To embed: {len(to_embed)}  🗑️  Removed: {removed}")
+    Path(output_path).mkdir(parents=True, exist_ok=True)
+    checkpoint_path = os.path.join(output_path, CHECKPOINT_FILENAME)
+    if to_embed:
+        stats = EmbeddingStats()
+        new_vectors = embed_in_batches(
+            list(to_embed.values()),
+            embeddings,
+            keys=list(to_embed),
+            checkpoint_path=checkpoint_path,
+            stats=stats,
+            progress=progress,
+        )
+        vectors.update(zip(to_embed, np.asarray(new_vectors, dtype=np.float32)))
+        print(
+            f"   ⚡ Embedded in {stats.seconds:.1f}s ({stats.batches} batches, "
+            f"{stats.resumed} resumed from checkpoint, {stats.retries} rate-limit retries)"
+        )
+
+    vectorstore = FAISS.from_embeddings(
+        [(doc.page_content, vectors[h]) for h, doc in zip(hashes, documents)],
+        embeddings,
+        metadatas=[doc.metadata for doc in documents],
+    )
+    raw_vectors = None
+    if index_type != "flat":
+        # Same rows in the same order, so the docstore mapping stays valid
+        raw_vectors = np.vstack([vectors[h] for h in hashes]).astype(np.float32)
+        vectorstore.index = build_faiss_index(raw_vectors, index_type)
+        print(f"   🧭 Trained {index_type} index over {len(raw_vectors)} vectors")
 
     # Save vector store
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
     vectorstore.save_local(output_path)
+    save_raw_vectors(output_path, raw_vectors)
+    # Compact chunk store, read instead of index.pkl at query time
+    write_chunk_store(output_path, documents)
+    # Lexical index for hybrid retrieval, row-aligned with the FAISS index
+    BM25Index.build([doc.page_content for doc in documents]).save(os.path.join(output_path, BM25_FILENAME))
+    save_manifest(
+        output_path,
+        hashes,
+        embedding_model=embedding_model,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        index_type=index_type,
+        reused=reused,
+        embedded=len(to_embed),
+        removed=removed,
+        **(manifest_extra or {}),
+    )
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
     print(f"✅ Vector store saved to {output_path}")
 
     return vectorstore
 
 
+def build_snapshot(
+    documents: List[Document],
+    root: Optional[str] = None,
+    publish: bool = True,
+    manifest_extra: Optional[Dict[str, Any]] = None,
+    **build_kwargs: Any
+) -> Tuple[str, FAISS]:
+    """
+    Build documents into a new vector-store snapshot and publish it.
+    
+    The store is built in a staging directory of its own, reusing
+    vectors from the current snapshot (or the legacy vector store), renamed
+    to a new snapshot name once complete, and published by atomically
+    switching `CURRENT` to it. Old snapshots beyond `SNAPSHOTS_KEEP` are
+    deleted. Nothing a running server reads is modified, so it keeps serving
+    the previous snapshot until it reloads.
+    
+    Args:
+        documents: List of document chunks
+        root: Snapshot root directory (default: from config)
+        publish: Switch `CURRENT` to the new snapshot
+        manifest_extra: Additional fields to record in the manifest
+        **build_kwargs: Passed to `build_vector_store` (embeddings, incremental, ...)
+    
+    Returns:
+        (snapshot name, FAISS vector store)
+    """
+    root = root or VECTOR_STORE_SNAPSHOTS_DIR
+    name = new_snapshot_name()
+    parent = current_snapshot(root)
+    if parent is not None:
+        reuse_path = snapshot_path(parent, root)
+    else:
+        # The first snapshot under the default root starts from the legacy store
+        reuse_path = VECTOR_STORE_PATH if root == VECTOR_STORE_SNAPSHOTS_DIR else None
+
+    with claim_staging(root) as staging:
+        vectorstore = build_vector_store(
+            documents,
+            output_path=staging,
+            reuse_path=reuse_path,
+            manifest_extra={"snapshot": name, "parent": parent, **(manifest_extra or {})},
+            **build_kwargs,
+        )
+        path = commit_snapshot(staging, name, root)
+    print(f"📸 Snapshot {name} written to {path}")
+    if publish:
+        publish_snapshot(name, root)
+        print(f"   ➡️  CURRENT now points to {name}")
+        for pruned in prune_snapshots(root):
+            print(f"   🗑️  Pruned old snapshot {pruned}")
+    return name, vectorstore
+
+
+def corpus_manifest(pdf_files: List[str], num_pages: int) -> Dict[str, Any]:
+    """Manifest fields recording which PDFs a vector store was built from."""
+    return {
+        "sources": [os.path.basename(f) for f in pdf_files],
+        "pdf_files": [os.path.abspath(f) for f in pdf_files],
+        "pages": num_pages,
+    }
+
+
 def ingest_documents(
     pdf_path: Optional[str] = None,
     output_path: Optional[str] = None,
     api_key: Optional[str] = None,
-    force: bool = False
+    force: bool = False,
+    incremental: bool = True,
+    max_workers: Optional[int] = None,
+    pdf_backend: Optional[str] = None,
+    index_type: Optional[str] = None,
+    snapshot: Optional[bool] = None
 ) -> FAISS:
     """
     Complete document ingestion pipeline.
     
-    Loads PDF, splits into chunks, creates embeddings, and saves vector store.
+    Loads PDFs, splits into chunks, creates embeddings, and saves vector store.
+    PDFs are parsed in a process pool and each file's pages are split as soon
+    as it is parsed. Re-ingestion only embeds chunks whose content changed
+    (see `build_vector_store`).
+    
+    Without an explicit `output_path`, the store is written as a new
+    versioned snapshot (see `build_snapshot`) that running servers can
+    hot-swap to, instead of being rewritten in place.
     
     Args:
-        pdf_path: Path to PDF file (default: from config)
+        pdf_path: PDF file, directory of PDFs, or glob pattern (default: from config)
         output_path: Path to save vector store (default: from config)
         api_key: Google API key (default: from config)
         force: Force re-ingestion even if vector store exists
+        incremental: Reuse stored vectors for unchanged chunks when re-ingesting
+        max_workers: PDF parser processes (default: from config, or CPU count)
+        pdf_backend: PDF extraction backend, e.g. "pypdf" or "pymupdf" (default: from config)
+        index_type: FAISS index type, e.g. "flat" or "hnsw" (default: from config)
+        snapshot: Build a published snapshot rather than writing in place
+            (default: VECTOR_STORE_SNAPSHOTS from config; ignored with `output_path`)
     
     Returns:
         FAISS vector store instance
     
     Raises:
-        FileNotFoundError: If PDF file doesn't exist
+        FileNotFoundError: If no PDF files are found
     """
     pdf_path = pdf_path or str(PDF_PATH)
-    output_path = output_path or VECTOR_STORE_PATH
+    snapshot = (snapshot if snapshot is not None else VECTOR_STORE_SNAPSHOTS) and output_path is None
+    output_path = output_path or resolve_index_path()
 
     # Check if vector store already exists
     if not force and os.path.exists(output_path):
@@ -103,7 +352,7 @@ def ingest_documents(
         print("Use force=True to re-ingest")
 
         # Load existing vector store
-        index_dim = _read_faiss_dimension(output_path)
+        index_dim = read_faiss_dimension(output_path)
         if index_dim is not None and index_dim != 768:
             raise ValueError(
                 f"The FAISS index on disk is {index_dim}-dimensional, but this project is configured "
@@ -115,35 +364,52 @@ def ingest_documents(
             model=GOOGLE_EMBEDDING_MODEL,
             google_api_key=api_key,
         )
-        vectorstore = FAISS.load_local(
-            output_path,
-            embeddings,
-            allow_dangerous_deserialization=True
-        )
+        vectorstore = load_vector_store(output_path, embeddings)
         return vectorstore
 
     print("=" * 70)
     print("📚 DOCUMENT INGESTION PIPELINE")
     print("=" * 70)
 
-    # Step 1: Load PDF
-    print(f"\n1️⃣ Loading PDF: {pdf_path}")
-    documents = load_pdf(pdf_path)
-    print(f"   ✅ Loaded {len(documents)} pages")
+    # Step 1: Find PDFs
+    print(f"\n1️⃣ Finding PDFs: {pdf_path}")
+    pdf_files = find_pdfs(pdf_path)
+    print(f"   ✅ Found {len(pdf_files)} PDF file(s)")
 
-    # Step 2: Split into chunks
-    print("\n2️⃣ Splitting documents into chunks...")
-    chunks = split_documents(documents)
-    print(f"   ✅ Created {len(chunks)} chunks")
+    # Step 2: Parse in parallel, splitting each file as it arrives
+    print("\n2️⃣ Parsing and splitting documents...")
+    num_pages = 0
+    chunks: List[Document] = []
+    for pages in iter_documents(pdf_files, max_workers=max_workers, backend=pdf_backend):
+        num_pages += len(pages)
+        chunks.extend(split_documents(pages))
+    print(f"   ✅ Parsed {num_pages} pages into {len(chunks)} chunks")
 
     # Step 3: Build vector store
     print("\n3️⃣ Building vector store...")
-    vectorstore = build_vector_store(chunks, api_key=api_key, output_path=output_path)
+    if snapshot:
+        name, vectorstore = build_snapshot(
+            chunks,
+            api_key=api_key,
+            incremental=incremental,
+            index_type=index_type,
+            manifest_extra=corpus_manifest(pdf_files, num_pages),
+        )
+        output_path = snapshot_path(name)
+    else:
+        vectorstore = build_vector_store(
+            chunks,
+            api_key=api_key,
+            output_path=output_path,
+            incremental=incremental,
+            index_type=index_type,
+        )
 
     print("\n" + "=" * 70)
     print("✅ INGESTION COMPLETE!")
     print("=" * 70)
-    print(f"📄 Pages: {len(documents)}")
+    print(f"📚 Documents: {len(pdf_files)}")
+    print(f"📄 Pages: {num_pages}")
     print(f"📦 Chunks: {len(chunks)}")
     print(f"💾 Vector store: {output_path}")
     print("=" * 70)
@@ -156,7 +422,8 @@ if __name__ == "__main__":
     import sys
 
     try:
-        ingest_documents(force=True)
+        # Optional argument: PDF file, directory or glob (default: PDF_PATH)
+        ingest_documents(pdf_path=sys.argv[1] if len(sys.argv) > 1 else None, force=True)
         sys.exit(0)
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -0,0 +1,364 @@
+"""Background ingestion jobs.
+
+`IngestJobQueue` runs find -> parse/split -> embed -> index for a set of
+PDFs on a worker pool, so documents can be added through the API while it
+keeps serving. Each job's state and progress (files and pages parsed,
+chunks embedded, ETA of the current stage) is saved as JSON in
+`INGEST_JOBS_DIR`, so it survives restarts: jobs that were queued or running
+when the process stopped are run again, and an interrupted build resumes
+from its embedding checkpoint.
+
+Every API worker process has its own queue over the same directory. The
+process running a job holds a file lock on it (`<id>.lock`), so a job is
+run by exactly one process: a queue only resumes unfinished jobs whose lock
+it can take, and reads the state of other processes' jobs from disk.
+
+An "add" job (the default) ingests its PDFs together with the corpus the
+current vector store was built from (recorded in its manifest), so
+unchanged chunks reuse their vectors and only the new documents are
+embedded; a "replace" job ingests only its PDFs. Jobs parse their own PDFs
+in parallel, but vector-store builds run one at a time across processes
+(`build.lock`): each must start from the corpus the previous one published.
+Builds are always published as new snapshots; the store being served is
+never rewritten in place.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain.schema import Document
+
+from ..config import (
+    INGEST_JOBS_DIR,
+    INGEST_WORKERS,
+    PDF_PATH,
+    VECTOR_STORE_PATH,
+    VECTOR_STORE_SNAPSHOTS_DIR,
+)
+from .document_loader import find_pdfs, iter_documents, split_documents
+from .file_lock import FileLock
+from .ingest import build_snapshot, corpus_manifest
+from .manifest import load_manifest
+from .snapshots import current_snapshot, snapshot_path
+
+JOB_STATES = ("queued", "running", "succeeded", "failed")
+JOB_MODES = ("add", "replace")
+
+BUILD_LOCK_FILENAME = "build.lock"
+
+# Progress is saved at most this often while a stage runs (state changes are saved at once)
+_SAVE_INTERVAL_SECONDS = 1.0
+_JOB_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Jobs run inside the API server: log through uvicorn's logger, like its other messages
+logger = logging.getLogger("uvicorn.error")
+
+
+def corpus_files(root: Optional[str] = None) -> List[str]:
+    """
+    PDFs the current vector store was built from that still exist.
+
+    Args:
+        root: Snapshot root (default: from config; the legacy vector store
+            and PDF_PATH are only consulted for the default root)
+
+    Returns:
+        Absolute PDF paths
+    """
+    name = current_snapshot(root)
+    if name is not None:
+        manifest = load_manifest(snapshot_path(name, root)) or {}
+    elif root in (None, VECTOR_STORE_SNAPSHOTS_DIR):
+        manifest = load_manifest(VECTOR_STORE_PATH) or {}
+    else:
+        return []
+    files = manifest.get("pdf_files")
+    if files is None and root in (None, VECTOR_STORE_SNAPSHOTS_DIR):
+        # Stores built before the corpus was recorded came from PDF_PATH
+        try:
+            files = find_pdfs(PDF_PATH)
+        except FileNotFoundError:
+            files = []
+    return [os.path.abspath(f) for f in files or [] if os.path.isfile(f)]
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+class IngestJobQueue:
+    """Runs ingestion jobs on a worker pool and persists their state."""
+
+    def __init__(
+        self,
+        jobs_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        root: Optional[str] = None,
+        on_success: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **build_kwargs: Any
+    ):
+        """
+        Initialize the queue and resume unfinished jobs from `jobs_dir`.
+
+        Args:
+            jobs_dir: Directory job state is saved in (default: from config)
+            max_workers: Jobs run concurrently (default: from config)
+            root: Snapshot root to publish to (default: from config)
+            on_success: Called with a finished job (e.g. to reload the server's index)
+            **build_kwargs: Passed to `build_vector_store` (embeddings, incremental, index_type, ...)
+        """
+        self.jobs_dir = jobs_dir or INGEST_JOBS_DIR
+        self.root = root
+        self.on_success = on_success
+        self.build_kwargs = build_kwargs
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or INGEST_WORKERS, thread_name_prefix="ingest"
+        )
+        self._lock = threading.Lock()
+        # State of the jobs this process runs, and the locks that make them ours
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._owned: Dict[str, FileLock] = {}
+        self._saved_at: Dict[str, float] = {}
+
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._resume()
+
+    def submit(self, paths: Sequence[str], mode: str = "add") -> Dict[str, Any]:
+        """
+        Queue an ingestion job.
+
+        Args:
+            paths: PDF files, directories or glob patterns
+            mode: "add" to the current corpus, or "replace" it
+
+        Returns:
+            The job (id, status, progress, ...)
+
+        Raises:
+            ValueError: If no paths are given or the mode is unknown
+            FileNotFoundError: If a path matches no PDF files
+        """
+        if mode not in JOB_MODES:
+            raise ValueError(f"Unknown ingestion mode '{mode}'. Choose one of: {', '.join(JOB_MODES)}")
+        if not paths:
+            raise ValueError("At least one path is required")
+        files: List[str] = []
+        for path in paths:
+            files.extend(os.path.abspath(f) for f in find_pdfs(path))
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "status": "queued",
+            "mode": mode,
+            "paths": list(paths),
+            "files": sorted(set(files)),
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "progress": {"stage": "queued"},
+            "index_path": None,
+            "snapshot": None,
+            "error": None,
+        }
+        # A new id is never contended; the lock is taken before the job is visible to other processes
+        lock = FileLock(self._path(job["id"], ".lock"))
+        lock.acquire()
+        with self._lock:
+            self._jobs[job["id"]] = job
+            self._owned[job["id"]] = lock
+        self._save(job["id"], force=True)
+        self._executor.submit(self._run, job["id"])
+        return self.get(job["id"])
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A copy of the job (from any process), or None if there is no such job."""
+        with self._lock:
+            if job_id in self._owned:
+                return json.loads(json.dumps(self._jobs[job_id]))
+        return self._load(job_id)
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """The most recent jobs, newest first."""
+        jobs = sorted(self._load_all(), key=lambda j: j["created_at"], reverse=True)[:limit]
+        return [self.get(job["id"]) or job for job in jobs]
+
+    def stats(self) -> Dict[str, int]:
+        """Number of jobs in each state."""
+        counts = {state: 0 for state in JOB_STATES}
+        for job in self._load_all():
+            counts[(self.get(job["id"]) or job)["status"]] += 1
+        return counts
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the workers; unfinished jobs are resumed by the next queue."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        # Jobs that never started are left for another process to claim
+        with self._lock:
+            pending = [i for i in self._owned if self._jobs[i]["status"] == "queued"]
+            locks = [self._owned.pop(i) for i in pending]
+        for lock in locks:
+            lock.release()
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            if job_id not in self._owned:
+                return  # Released by shutdown()
+            self._jobs[job_id].update(status="running", started_at=_now(), error=None)
+        self._save(job_id, force=True)
+        job = self.get(job_id)
+        try:
+            # The job's own PDFs are parsed outside the build lock, in parallel with other jobs
+            files = job["files"]
+            chunks, pages = self._parse(job_id, files)
+
+            self._progress(job_id, stage="waiting")
+            with FileLock(os.path.join(self.jobs_dir, BUILD_LOCK_FILENAME)):
+                if job["mode"] == "add":
+                    # Read the corpus under the lock: an earlier job may just have extended it
+                    known = set(files)
+                    extra = [f for f in corpus_files(self.root) if f not in known]
+                    if extra:
+                        more_chunks, more_pages = self._parse(job_id, extra, offset=len(files))
+                        chunks, pages, files = chunks + more_chunks, pages + more_pages, files + extra
+                index_path, snapshot = self._build(job_id, chunks, files, pages)
+
+            self._progress(job_id, stage="done", eta_seconds=0)
+            self._update(
+                job_id, status="succeeded", finished_at=_now(), index_path=index_path, snapshot=snapshot
+            )
+        except Exception as e:
+            self._update(job_id, status="failed", finished_at=_now(), error=f"{type(e).__name__}: {e}")
+            self._release(job_id)
+            logger.error("Ingestion job %s failed: %s", job_id, e)
+            return
+
+        self._release(job_id)
+        logger.info("Ingestion job %s published %s", job_id, index_path)
+        if self.on_success is not None:
+            self.on_success(self.get(job_id))
+
+    def _parse(self, job_id: str, files: List[str], offset: int = 0):
+        """Parse and split PDFs, reporting files and pages parsed."""
+        total = offset + len(files)
+        progress = self.get(job_id)["progress"]
+        pages_parsed = progress.get("pages_parsed", 0) if offset else 0
+        num_chunks = progress.get("chunks", 0) if offset else 0
+        self._progress(job_id, stage="parsing", files=total, files_parsed=offset)
+
+        start = time.perf_counter()
+        chunks: List[Document] = []
+        num_pages = 0
+        for done, pages in enumerate(iter_documents(files), start=1):
+            num_pages += len(pages)
+            chunks.extend(split_documents(pages))
+            rate = done / (time.perf_counter() - start)
+            self._progress(
+                job_id,
+                files_parsed=offset + done,
+                pages_parsed=pages_parsed + num_pages,
+                chunks=num_chunks + len(chunks),
+                eta_seconds=round((len(files) - done) / rate, 1),
+            )
+        return chunks, num_pages
+
+    def _build(self, job_id: str, chunks: List[Document], files: List[str], pages: int):
+        """Build and publish the vector store, reporting chunks embedded."""
+        self._progress(job_id, stage="building", eta_seconds=None)
+        start: Dict[str, float] = {}
+
+        def on_embedded(done: int, total: int) -> None:
+            now = time.perf_counter()
+            # Batches resumed from a checkpoint are reported first; time the rest
+            start.setdefault("time", now)
+            start.setdefault("done", done)
+            embedded = done - start["done"]
+            eta = round((total - done) * (now - start["time"]) / embedded, 1) if embedded else None
+            self._progress(
+                job_id,
+                stage="embedding" if done < total else "indexing",
+                chunks_embedded=done,
+                chunks_to_embed=total,
+                eta_seconds=eta if done < total else None,
+            )
+
+        manifest_extra = corpus_manifest(files, pages)
+        name, _ = build_snapshot(
+            chunks, root=self.root, manifest_extra=manifest_extra, progress=on_embedded, **self.build_kwargs
+        )
+        return snapshot_path(name, self.root), name
+
+    def _progress(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            self._jobs[job_id]["progress"].update(fields)
+        self._save(job_id, force="stage" in fields)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            self._jobs[job_id].update(fields)
+        self._save(job_id, force=True)
+
+    def _save(self, job_id: str, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._saved_at.get(job_id, 0.0) < _SAVE_INTERVAL_SECONDS:
+                return
+            self._saved_at[job_id] = now
+            payload = json.dumps(self._jobs[job_id], indent=2)
+            path = self._path(job_id)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+    def _release(self, job_id: str) -> None:
+        """Give up ownership of a finished job."""
+        with self._lock:
+            lock = self._owned.pop(job_id, None)
+        if lock is not None:
+            lock.release(remove=True)
+
+    def _path(self, job_id: str, suffix: str = ".json") -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}{suffix}")
+
+    def _load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job as last saved by the process running it, or None."""
+        if not _JOB_ID_RE.match(job_id or ""):
+            return None
+        try:
+            with open(self._path(job_id), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_all(self) -> List[Dict[str, Any]]:
+        jobs = (self._load(f[:-len(".json")]) for f in os.listdir(self.jobs_dir) if f.endswith(".json"))
+        return [job for job in jobs if job is not None]
+
+    def _resume(self) -> None:
+        """Claim the saved jobs that never finished and no process is running, and run them again."""
+        unfinished = [job for job in self._load_all() if job["status"] in ("queued", "running")]
+        for job_id in [job["id"] for job in sorted(unfinished, key=lambda j: j["created_at"])]:
+            lock = FileLock(self._path(job_id, ".lock"))
+            if not lock.acquire(blocking=False):
+                continue  # Another process is running it
+            # Re-read under the lock: its owner may have finished it since it was listed
+            job = self._load(job_id)
+            if job is None or job["status"] not in ("queued", "running"):
+                lock.release(remove=True)
+                continue
+
+            logger.info("Resuming ingestion job %s", job_id)
+            job.update(status="queued", progress={"stage": "queued"})
+            with self._lock:
+                self._jobs[job_id] = job
+                self._owned[job_id] = lock
+            self._save(job_id, force=True)
+            self._executor.submit(self._run, job_id)
@@ -0,0 +1,70 @@
+"""Chunk hashing and the vector-store manifest.
+
+The manifest (`manifest.json`, saved next to `index.faiss`) records the
+content hash of the chunk stored in each FAISS row. A chunk hash covers the
+chunk text, the chunking parameters and the embedding model, so a vector can
+be reused whenever all three are unchanged.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def chunk_hash(text: str, chunk_size: int, chunk_overlap: int, embedding_model: str) -> str:
+    """Return the content hash identifying a chunk's embedding."""
+    payload = f"{embedding_model}\0{chunk_size}\0{chunk_overlap}\0{text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(index_path: str) -> Optional[Dict[str, Any]]:
+    """Load the manifest stored with a vector store, if any."""
+    path = os.path.join(index_path, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(
+    index_path: str,
+    chunk_hashes: List[str],
+    embedding_model: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    **extra: Any
+) -> Dict[str, Any]:
+    """
+    Write the manifest for a vector store.
+
+    Args:
+        index_path: Vector store directory
+        chunk_hashes: Chunk hash for each FAISS row, in row order
+        embedding_model: Embedding model name
+        chunk_size: Chunk size used when splitting
+        chunk_overlap: Chunk overlap used when splitting
+        **extra: Additional fields to record (e.g. ingestion statistics)
+
+    Returns:
+        The manifest dictionary that was written
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "embedding_model": embedding_model,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "num_chunks": len(chunk_hashes),
+        **extra,
+        "chunks": chunk_hashes,
+    }
+    tmp_path = os.path.join(index_path, MANIFEST_FILENAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(index_path, MANIFEST_FILENAME))
+    return manifest
@@ -0,0 +1,209 @@
+"""Per-stage latency instrumentation for the RAG pipeline.
+
+`PipelineTimings` records how long each stage of one question took (cache
+lookup, query embedding, vector search, reranking, context assembly, time to the first
+LLM token, full generation), how many tokens the LLM consumed and, with
+context compression, how many context tokens were kept and saved. The chain
+activates it around retrieval so the retriever can report its embedding and
+search stages through `stage()` without threading an argument through
+LangChain's retriever interface.
+
+`PipelineMetrics` aggregates completed timings into histograms and renders
+them in the Prometheus text exposition format for the API's `/metrics`
+endpoint.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+PIPELINE_STAGES = (
+    "faq",
+    "cache",
+    "retrieval",
+    "embed",
+    "search",
+    "rerank",
+    "context",
+    "llm_first_token",
+    "llm_total",
+    "total",
+)
+
+# Seconds; Gemini generation dominates, so the upper buckets are wide
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+_active_timings: ContextVar[Optional["PipelineTimings"]] = ContextVar("pipeline_timings", default=None)
+
+
+class PipelineTimings:
+    """Stage durations and token counts for one question."""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        # LLM usage ("input_tokens", "output_tokens")
+        self.tokens: Dict[str, int] = {}
+        # Context compression ("kept", "saved" tokens), not LLM usage
+        self.context_tokens: Dict[str, int] = {}
+        self._start = time.perf_counter()
+
+    def add(self, stage_name: str, seconds: float) -> None:
+        """Add `seconds` to a stage (stages entered repeatedly accumulate)."""
+        self.stages[stage_name] = self.stages.get(stage_name, 0.0) + seconds
+
+    def since(self, stage_name: str, start: float) -> None:
+        """Record a stage that began at `start` (a `time.perf_counter()` value)."""
+        self.add(stage_name, time.perf_counter() - start)
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.since(stage_name, start)
+
+    @contextmanager
+    def activate(self) -> Iterator["PipelineTimings"]:
+        """Make these timings the target of module-level `stage()` calls."""
+        token = _active_timings.set(self)
+        try:
+            yield self
+        finally:
+            _active_timings.reset(token)
+
+    def record_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """Keep the largest input/output token counts reported by the LLM.
+
+        Gemini reports cumulative usage on every streamed chunk, so the
+        maximum is the final count.
+        """
+        for key in ("input_tokens", "output_tokens"):
+            if usage and usage.get(key) is not None:
+                self.tokens[key] = max(self.tokens.get(key, 0), int(usage[key]))
+
+    def record_context(self, kept: int, saved: int) -> None:
+        """Record the context tokens sent to the LLM and removed by compression."""
+        self.context_tokens = {"kept": kept, "saved": saved}
+
+    def finish(self) -> "PipelineTimings":
+        """Record the end-to-end "total" stage."""
+        self.stages["total"] = time.perf_counter() - self._start
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Milliseconds per stage (e.g. "embed_ms") plus LLM and context token counts."""
+        result: Dict[str, Any] = {
+            f"{name}_ms": round(self.stages[name] * 1000, 2) for name in PIPELINE_STAGES if name in self.stages
+        }
+        result.update(self.tokens)
+        if self.context_tokens:
+            result["context_tokens"] = self.context_tokens["kept"]
+            result["context_tokens_saved"] = self.context_tokens["saved"]
+        return result
+
+
+@contextmanager
+def stage(stage_name: str) -> Iterator[None]:
+    """Time a block into the active `PipelineTimings`, if any."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _active_timings.get()
+        if timings is not None:
+            timings.since(stage_name, start)
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_format_number(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {_format_number(self.total)}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PipelineMetrics:
+    """Thread-safe histograms of stage latencies and token counts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, _Histogram] = {}
+        self._tokens: Dict[str, _Histogram] = {}
+        self._context: Dict[str, _Histogram] = {}
+        self._requests: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, timings: PipelineTimings, endpoint: str = "ask", cached: bool = False) -> None:
+        """Add one completed question's timings."""
+        with self._lock:
+            key = (endpoint, "true" if cached else "false")
+            self._requests[key] = self._requests.get(key, 0) + 1
+            for name, seconds in timings.stages.items():
+                self._stages.setdefault(name, _Histogram(LATENCY_BUCKETS)).observe(seconds)
+            for kind, count in timings.tokens.items():
+                self._tokens.setdefault(kind, _Histogram(TOKEN_BUCKETS)).observe(count)
+            for kind, count in timings.context_tokens.items():
+                self._context.setdefault(kind, _Histogram(TOKEN_BUCKETS)).observe(count)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            lines = [
+                "# HELP rag_requests_total Questions answered, by endpoint and answer-cache outcome.",
+                "# TYPE rag_requests_total counter",
+            ]
+            for (endpoint, cached), count in sorted(self._requests.items()):
+                lines.append(f'rag_requests_total{{endpoint="{endpoint}",cached="{cached}"}} {count}')
+
+            lines += [
+                "# HELP rag_stage_duration_seconds Time spent in each RAG pipeline stage.",
+                "# TYPE rag_stage_duration_seconds histogram",
+            ]
+            for name in PIPELINE_STAGES:
+                if name in self._stages:
+                    lines += self._stages[name].lines("rag_stage_duration_seconds", f'stage="{name}"')
+
+            lines += [
+                "# HELP rag_llm_tokens Tokens per LLM call, by direction.",
+                "# TYPE rag_llm_tokens histogram",
+            ]
+            for kind, histogram in sorted(self._tokens.items()):
+                lines += histogram.lines("rag_llm_tokens", f'kind="{kind.replace("_tokens", "")}"')
+
+            lines += [
+                "# HELP rag_context_tokens Context tokens per question kept in the prompt or saved by compression.",
+                "# TYPE rag_context_tokens histogram",
+            ]
+            for kind, histogram in sorted(self._context.items()):
+                lines += histogram.lines("rag_context_tokens", f'kind="{kind}"')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide metrics served by the API
+PIPELINE_METRICS = PipelineMetrics()
@@ -0,0 +1,292 @@
+"""Structure-aware splitting for RBI Master Directions and circulars.
+
+`RecursiveCharacterTextSplitter` cuts pages at blank lines, newlines and
+spaces with no regard for the document's numbering, so a paragraph number
+such as "45.2" often ends one chunk while its text starts the next, and
+tables are cut between rows. `RegulatoryTextSplitter` splits at the
+document's own structure instead:
+
+- Chapter, Section, Annex and Appendix headings and numbered paragraphs
+  ("33.", "2.4", "116.1.2") start a new block.
+- Consecutive blocks of the same top-level paragraph (33, 33.1, 33.2) are
+  packed into one chunk while they fit `chunk_size`.
+- A block over `chunk_size` is split between its list items ("(i)",
+  "(a)") and tables (runs of short lines), keeping each item and table
+  whole; only an item or table that alone exceeds `chunk_size` is split
+  with the recursive character splitter.
+
+Headings and paragraph numbers carry over page breaks, so a chunk continuing
+paragraph 45.2 at the top of the next page is still labelled 45.2. Every
+chunk is an exact slice of its page and records "start_index" together with
+"chapter", "section", "paragraph" (the paragraph the chunk starts in) and
+"paragraphs" (every paragraph id in the chunk).
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+# Whole-line headings: "Chapter IX", "Section VI", "Annex III", "Appendix III-D", "Annex-XII(1)"
+_HEADING_RE = re.compile(
+    r"^(Chapter|Section|Annex|Appendix)[\s\-]*([IVXLC]+(?:-[A-Z])?(?:\(\d+\))?)$",
+    re.IGNORECASE,
+)
+# Paragraph numbers at the start of a line: "33.", "2.4", "32C.", "116.1.2"; followed
+# by a capital, an opening bracket or the end of the line ("2 capital" is a wrapped line)
+_PARAGRAPH_RE = re.compile(r"^(\d{1,3}[A-Z]?(?:\.\d{1,3}){1,3}|\d{1,3}[A-Z]?\.)(?=\s+[A-Z(\"‘']|\s*$)")
+# List items: "(i)", "(a)", "(3)", "a)"
+_LIST_ITEM_RE = re.compile(r"^\(?(?:[ivxlc]{1,5}|[a-z]|\d{1,2})\)\s")
+# Page numbers printed as "-19-"
+_PAGE_NUMBER_RE = re.compile(r"^-\s*\d+\s*-$")
+
+# Lines this short, TABLE_MIN_LINES or more in a row, are table cells
+TABLE_LINE_CHARS = 40
+TABLE_MIN_LINES = 4
+# Paragraph numbers may skip deleted paragraphs, but not jump further ahead
+MAX_PARAGRAPH_GAP = 5
+
+
+def _major(paragraph: str) -> int:
+    """Top-level number of a paragraph id ("32C.1" -> 32)."""
+    return int(re.match(r"\d+", paragraph).group(0))
+
+
+@dataclass
+class _Block:
+    """A heading or numbered paragraph and the text up to the next one."""
+    start: int
+    end: int
+    chapter: Optional[str]
+    section: Optional[str]
+    paragraph: Optional[str]
+    # Offsets inside the block where the text may be cut: list items and table edges
+    cuts: List[int] = field(default_factory=list)
+    # Chapter/Section/Annex heading line, attached to the text after it
+    heading: bool = False
+
+
+class RegulatoryTextSplitter:
+    """Split regulatory PDF pages at chapters, sections and numbered paragraphs."""
+
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, min_chunk_chars: int = 100):
+        """
+        Initialize the splitter.
+
+        Args:
+            chunk_size: Maximum chunk size in characters
+            chunk_overlap: Overlap used only when a single list item or table
+                exceeds chunk_size and must be split by characters
+            min_chunk_chars: Chunks shorter than this (a heading at the foot
+                of a page) are appended to the previous chunk when it fits
+        """
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size})")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.min_chunk_chars = min_chunk_chars
+        self._fallback = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+            separators=["\n\n", "\n", " ", ""],
+        )
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split pages into chunks, carrying headings and paragraph numbers
+        from one page to the next.
+
+        Pages of different files ("source" metadata) do not share state.
+
+        Args:
+            documents: Page Documents in reading order
+
+        Returns:
+            List of chunk Documents with structure metadata
+        """
+        chunks: List[Document] = []
+        state: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None)
+        source = object()
+        for document in documents:
+            if document.metadata.get("source") != source:
+                source = document.metadata.get("source")
+                state = (None, None, None)
+            blocks, state = self._parse(document.page_content, state)
+            for start, end, labels in self._pack(document.page_content, blocks):
+                chunks.append(Document(
+                    page_content=document.page_content[start:end],
+                    metadata={**document.metadata, "start_index": start, **labels},
+                ))
+        return chunks
+
+    def _parse(
+        self,
+        text: str,
+        state: Tuple[Optional[str], Optional[str], Optional[str]]
+    ) -> Tuple[List[_Block], Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """Split a page into blocks; returns them with the state at the page end."""
+        chapter, section, paragraph = state
+        blocks: List[_Block] = []
+        table_lines: List[Tuple[int, int]] = []
+        offset = 0
+        for line in text.splitlines(keepends=True):
+            start, offset = offset, offset + len(line)
+            stripped = line.strip()
+            if not stripped or (not blocks and _PAGE_NUMBER_RE.match(stripped)):
+                continue
+
+            heading = _HEADING_RE.match(stripped)
+            number = None if heading else _PARAGRAPH_RE.match(stripped)
+            if number and paragraph is not None:
+                # Reject numbers that go backwards or jump ahead (amounts, table rows)
+                if not 0 <= _major(number.group(1)) - _major(paragraph) <= MAX_PARAGRAPH_GAP:
+                    number = None
+
+            if heading or number:
+                self._close_table(blocks, table_lines)
+                if heading:
+                    kind, label = heading.group(1).title(), heading.group(2).upper()
+                    if kind in ("Annex", "Appendix"):
+                        # Annexes number their paragraphs from 1 again
+                        chapter, section, paragraph = f"{kind} {label}", None, None
+                    elif kind == "Chapter":
+                        chapter = label
+                    else:
+                        # Master Directions group chapters into sections; annexes have sections of their own
+                        section = label
+                        if chapter and not chapter.startswith(("Annex", "Appendix")):
+                            chapter = None
+                    blocks.append(_Block(start, offset, chapter, section, None, heading=True))
+                else:
+                    paragraph = number.group(1).rstrip(".")
+                    blocks.append(_Block(start, offset, chapter, section, paragraph))
+                continue
+
+            if not blocks:
+                # Text continuing the previous page's paragraph
+                blocks.append(_Block(start, offset, chapter, section, paragraph))
+                continue
+
+            block = blocks[-1]
+            block.end = offset
+            if len(stripped) <= TABLE_LINE_CHARS:
+                table_lines.append((start, offset))
+                continue
+            self._close_table(blocks, table_lines)
+            if _LIST_ITEM_RE.match(stripped):
+                block.cuts.append(start)
+        self._close_table(blocks, table_lines)
+        return blocks, (chapter, section, paragraph)
+
+    @staticmethod
+    def _close_table(blocks: List[_Block], table_lines: List[Tuple[int, int]]) -> None:
+        """Record a finished run of short lines as a table, cut at both edges."""
+        if len(table_lines) >= TABLE_MIN_LINES:
+            blocks[-1].cuts += [table_lines[0][0], table_lines[-1][1]]
+        table_lines.clear()
+
+    @staticmethod
+    def _units(block: _Block) -> List[Tuple[int, int]]:
+        """Block split at its cut points into list items, tables and text."""
+        cuts = sorted({cut for cut in block.cuts if block.start < cut < block.end})
+        bounds = [block.start, *cuts, block.end]
+        return list(zip(bounds, bounds[1:]))
+
+    def _pack(self, text: str, blocks: List[_Block]) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """Group blocks into chunks no larger than chunk_size."""
+        pieces: List[Tuple[int, int, _Block]] = []
+        for block in blocks:
+            if block.end - block.start <= self.chunk_size:
+                pieces.append((block.start, block.end, block))
+                continue
+            for start, end in self._pack_units(text, self._units(block)):
+                pieces.append((start, end, block))
+
+        chunks: List[Tuple[int, int, List[_Block]]] = []
+        for start, end, block in pieces:
+            if chunks:
+                chunk_start, chunk_end, members = chunks[-1]
+                if end - chunk_start <= self.chunk_size and self._joins(members, block):
+                    chunks[-1] = (chunk_start, end, members + [block])
+                    continue
+            chunks.append((start, end, [block]))
+
+        # Append short chunks (usually a heading at the foot of the page) to the previous one
+        merged: List[Tuple[int, int, List[_Block]]] = []
+        for start, end, members in chunks:
+            size = len(text[start:end].strip())
+            if merged and size < self.min_chunk_chars and end - merged[-1][0] <= self.chunk_size:
+                merged[-1] = (merged[-1][0], end, merged[-1][2] + members)
+            else:
+                merged.append((start, end, members))
+
+        result = []
+        for start, end, members in merged:
+            # Trim whitespace so the chunk is the exact text it starts and ends with
+            body = text[start:end]
+            start += len(body) - len(body.lstrip())
+            end -= len(body) - len(body.rstrip())
+            if start < end:
+                result.append((start, end, self._labels(members)))
+        return result
+
+    def _pack_units(self, text: str, units: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Pack a long block's units into pieces, character-splitting oversized units."""
+        pieces: List[Tuple[int, int]] = []
+        for start, end in units:
+            if end - start > self.chunk_size:
+                pieces.extend(self._split_characters(text, start, end))
+            elif pieces and end - pieces[-1][0] <= self.chunk_size and pieces[-1][1] == start:
+                pieces[-1] = (pieces[-1][0], end)
+            else:
+                pieces.append((start, end))
+        return pieces
+
+    def _split_characters(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Offsets of the recursive character splitter's pieces of text[start:end]."""
+        pieces = []
+        search = start
+        for piece in self._fallback.split_text(text[start:end]):
+            position = text.find(piece, search, end)
+            if position == -1:
+                continue
+            pieces.append((position, position + len(piece)))
+            search = position + 1
+        # Extend the last piece to the end so the next unit continues contiguously
+        if pieces:
+            pieces[-1] = (pieces[-1][0], end)
+        return pieces
+
+    @staticmethod
+    def _joins(members: List[_Block], block: _Block) -> bool:
+        """Whether `block` may join the chunk holding `members`."""
+        if all(member.heading for member in members):
+            # Headings attach to the text after them
+            return True
+        if block.heading or (members[-1].chapter, members[-1].section) != (block.chapter, block.section):
+            return False
+        if members[-1].paragraph is None or block.paragraph is None:
+            return members[-1].paragraph == block.paragraph
+        return _major(members[-1].paragraph) == _major(block.paragraph)
+
+    @staticmethod
+    def _labels(members: List[_Block]) -> Dict[str, Any]:
+        """Structure metadata of a chunk made of `members`."""
+        # Headings at the start of a chunk belong to the text after them
+        first = next((member for member in members if not member.heading), members[-1])
+        labels: Dict[str, Any] = {}
+        if first.chapter:
+            labels["chapter"] = first.chapter
+        if first.section:
+            labels["section"] = first.section
+        paragraphs = []
+        for member in members:
+            if member.paragraph and member.paragraph not in paragraphs:
+                paragraphs.append(member.paragraph)
+        if paragraphs:
+            labels["paragraph"] = paragraphs[0]
+            labels["paragraphs"] = paragraphs
+        return labels
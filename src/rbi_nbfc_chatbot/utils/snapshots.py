@@ -0,0 +1,220 @@
+"""Versioned vector-store snapshots.
+
+Ingestion used to rewrite the vector store in place, so a running server
+kept serving the old index until it was restarted, and a reader could see a
+half-written one. With snapshots every ingestion builds a complete vector
+store in its own directory under `VECTOR_STORE_SNAPSHOTS_DIR`:
+
+    snapshots/
+        CURRENT                  <- name of the snapshot to serve
+        20261017T101500123456/   <- index.faiss, index.pkl, bm25.npz, manifest.json, ...
+        20261018T093012000042/
+
+A snapshot is built in a staging directory of its own (`.staging-<id>`,
+so concurrent builds never share one), renamed into place when it is
+complete, and only then published by atomically replacing `CURRENT`.
+Published snapshots are never modified, so processes that loaded one keep a
+consistent index. Servers pick a new snapshot up with `/admin/reload` or by
+watching `CURRENT` (see `api/server.py`). When no snapshot has been
+published, the legacy `VECTOR_STORE_PATH` is served.
+"""
+
+import glob
+import os
+import re
+import shutil
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import SNAPSHOTS_KEEP, VECTOR_STORE_PATH, VECTOR_STORE_SNAPSHOTS_DIR
+from .file_lock import FileLock
+from .manifest import load_manifest
+
+CURRENT_FILENAME = "CURRENT"
+STAGING_PREFIX = ".staging-"
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def new_snapshot_name() -> str:
+    """Return a new, sortable snapshot name (a UTC timestamp)."""
+    return datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+
+
+def snapshot_path(name: str, root: Optional[str] = None) -> str:
+    """
+    Return the directory of snapshot `name`.
+
+    Raises:
+        ValueError: If the name is not a plain snapshot name (e.g. contains a path)
+    """
+    if not _NAME_RE.match(name or ""):
+        raise ValueError(f"Invalid snapshot name '{name}'")
+    return os.path.join(root or VECTOR_STORE_SNAPSHOTS_DIR, name)
+
+
+def current_snapshot(root: Optional[str] = None) -> Optional[str]:
+    """Name of the published snapshot, or None if none is published."""
+    try:
+        with open(os.path.join(root or VECTOR_STORE_SNAPSHOTS_DIR, CURRENT_FILENAME), encoding="utf-8") as f:
+            name = f.read().strip()
+    except OSError:
+        return None
+    if not _NAME_RE.match(name) or not os.path.isdir(snapshot_path(name, root)):
+        return None
+    return name
+
+
+def resolve_index_path(index_path: Optional[str] = None, root: Optional[str] = None) -> str:
+    """
+    Vector store directory to load.
+
+    Args:
+        index_path: Explicit directory (returned unchanged)
+        root: Snapshot root (default: from config)
+
+    Returns:
+        `index_path`, else the published snapshot, else the legacy `VECTOR_STORE_PATH`
+    """
+    if index_path:
+        return index_path
+    name = current_snapshot(root)
+    return snapshot_path(name, root) if name else VECTOR_STORE_PATH
+
+
+@contextmanager
+def claim_staging(root: Optional[str] = None) -> Iterator[str]:
+    """
+    Claim a staging directory to build one snapshot in.
+
+    Every build gets a directory of its own, locked (`<dir>.lock`) until the
+    context exits. A directory left behind by a failed or interrupted build
+    (its lock is free) is claimed first, so the embedding checkpoint in it
+    lets the build resume; other abandoned ones are deleted. Otherwise a new
+    directory is created.
+
+    Yields:
+        The staging directory
+    """
+    root = root or VECTOR_STORE_SNAPSHOTS_DIR
+    os.makedirs(root, exist_ok=True)
+    staging, lock = None, None
+    leftovers = [p for p in glob.glob(os.path.join(root, STAGING_PREFIX + "*")) if os.path.isdir(p)]
+    for path in sorted(leftovers, key=_mtime, reverse=True):
+        candidate = FileLock(path + ".lock")
+        if not candidate.acquire(blocking=False):
+            continue  # Another build is using it
+        if not os.path.isdir(path):
+            candidate.release(remove=True)  # Committed since it was listed
+        elif staging is None:
+            staging, lock = path, candidate
+        else:
+            shutil.rmtree(path, ignore_errors=True)
+            candidate.release(remove=True)
+
+    if staging is None:
+        # The lock is taken before the directory exists, so no other build can claim it
+        staging = os.path.join(root, f"{STAGING_PREFIX}{uuid.uuid4().hex}")
+        lock = FileLock(staging + ".lock")
+        lock.acquire()
+        os.makedirs(staging)
+    try:
+        yield staging
+    finally:
+        # A failed build keeps its directory (and lock file) for the next build to resume
+        lock.release(remove=not os.path.isdir(staging))
+
+
+def commit_snapshot(staging: str, name: str, root: Optional[str] = None) -> str:
+    """
+    Rename a build's staging directory to snapshot `name` (not yet published).
+
+    Args:
+        staging: Directory the snapshot was built in (from `claim_staging`)
+        name: New snapshot name
+        root: Snapshot root (default: from config)
+
+    Returns:
+        The snapshot directory
+
+    Raises:
+        FileNotFoundError: If the staging directory holds no built index
+        FileExistsError: If a snapshot with that name already exists
+    """
+    if not os.path.exists(os.path.join(staging, "index.faiss")):
+        raise FileNotFoundError(f"No built vector store in {staging}")
+    path = snapshot_path(name, root)
+    if os.path.exists(path):
+        raise FileExistsError(f"Snapshot '{name}' already exists")
+    os.rename(staging, path)
+    return path
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def publish_snapshot(name: str, root: Optional[str] = None) -> None:
+    """
+    Atomically point `CURRENT` at snapshot `name`.
+
+    Raises:
+        FileNotFoundError: If the snapshot does not exist or has no index
+    """
+    root = root or VECTOR_STORE_SNAPSHOTS_DIR
+    if not os.path.exists(os.path.join(snapshot_path(name, root), "index.faiss")):
+        raise FileNotFoundError(f"Snapshot '{name}' not found in {root}")
+    tmp_path = os.path.join(root, CURRENT_FILENAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(name + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(root, CURRENT_FILENAME))
+
+
+def list_snapshots(root: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Describe every snapshot, oldest first.
+
+    Returns:
+        One dictionary per snapshot with its name, whether it is current and
+        manifest fields (created_at, num_chunks, embedding_model, ...)
+    """
+    root = root or VECTOR_STORE_SNAPSHOTS_DIR
+    if not os.path.isdir(root):
+        return []
+    current = current_snapshot(root)
+    snapshots = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if not _NAME_RE.match(name) or not os.path.isdir(path):
+            continue
+        manifest = load_manifest(path) or {}
+        info = {key: value for key, value in manifest.items() if key != "chunks"}
+        snapshots.append({**info, "name": name, "current": name == current})
+    return snapshots
+
+
+def prune_snapshots(root: Optional[str] = None, keep: Optional[int] = None) -> List[str]:
+    """
+    Delete the oldest snapshots beyond the newest `keep` (never the current one).
+
+    Processes still serving a deleted snapshot are unaffected: their index is
+    already in memory (or memory-mapped, which keeps the files alive).
+
+    Returns:
+        Names of the deleted snapshots
+    """
+    root = root or VECTOR_STORE_SNAPSHOTS_DIR
+    keep = keep if keep is not None else SNAPSHOTS_KEEP
+    names = [s["name"] for s in list_snapshots(root) if not s["current"]]
+    # The current snapshot counts towards `keep`
+    stale = names[:max(len(names) - max(keep - 1, 0), 0)]
+    for name in stale:
+        shutil.rmtree(snapshot_path(name, root), ignore_errors=True)
+    return stale
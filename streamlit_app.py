@@ -7,10 +7,11 @@ Gemini + FAISS RAG pipeline unchanged.
 from __future__ import annotations
 
 import sys
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -18,15 +19,15 @@ from dotenv import load_dotenv
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.rbi_nbfc_chatbot.chains import build_rag_chain
+from src.rbi_nbfc_chatbot.chains import ChainPool, build_rag_chain
 from src.rbi_nbfc_chatbot.config import (
     GEMINI_MODEL,
     GOOGLE_API_KEY,
     PDF_PATH,
     RETRIEVAL_K,
     TEMPERATURE,
-    VECTOR_STORE_PATH,
 )
+from src.rbi_nbfc_chatbot.utils.snapshots import resolve_index_path
 
 load_dotenv()
 
@@ -120,8 +121,26 @@ def _init_state() -> None:
 
 
 @st.cache_resource(show_spinner=False)
-def _get_chain(model_name: str, temperature: float, k: int):
-    return build_rag_chain(model_name=model_name, temperature=temperature, k=k)
+def _chain_pool_state() -> Dict[str, Any]:
+    # One cache entry (not one per snapshot): a new snapshot replaces the pool,
+    # so the previous index is released instead of kept for the process lifetime
+    return {"lock": threading.Lock(), "index_path": None, "pool": None}
+
+
+def _get_chain_pool() -> ChainPool:
+    # The index and embedding client load once per snapshot; settings changes reuse them
+    state = _chain_pool_state()
+    index_path = resolve_index_path()
+    with state["lock"]:
+        if state["pool"] is None or state["index_path"] != index_path:
+            state["pool"] = ChainPool(build_rag_chain(index_path=index_path))
+            state["index_path"] = index_path
+        return state["pool"]
+
+
+def _get_chain(model_name: str, temperature: float):
+    # A newly published snapshot is picked up on the next question
+    return _get_chain_pool().get(model_name=model_name, temperature=temperature)
 
 
 def _ensure_welcome_message() -> None:
@@ -149,9 +168,14 @@ def _format_export(messages: List[Dict[str, Any]]) -> str:
     return "\n".join(lines).strip() + "\n"
 
 
-def _ask(chain, question: str, *, show_sources: bool) -> Dict[str, Any]:
-    response = chain.ask_question(question, return_sources=show_sources)
-    return response
+def _stream_answer(chain, question: str, sink: Dict[str, Any]) -> Iterator[str]:
+    """Yield answer tokens as they arrive, capturing sources into `sink`."""
+    # Top-K is a per-call setting: the same chain serves every slider value
+    for event in chain.stream_question(question, k=st.session_state.settings.retrieval_k):
+        if event["event"] == "sources":
+            sink["sources"] = event["data"]
+        elif event["event"] == "token":
+            yield event["data"]
 
 
 def _handle_question(chain, question: str) -> None:
@@ -166,18 +190,22 @@ def _handle_question(chain, question: str) -> None:
             "timestamp": datetime.now().isoformat(timespec="seconds"),
         }
     )
+    with st.chat_message("user"):
+        st.markdown(q)
 
-    with st.spinner("Searching the RBI document and drafting an answer…"):
-        response = _ask(chain, q, show_sources=st.session_state.settings.show_sources)
+    # Render tokens as they are generated instead of waiting for the full answer.
+    sink: Dict[str, Any] = {}
+    with st.chat_message("assistant"):
+        answer = st.write_stream(_stream_answer(chain, q, sink))
 
     assistant_msg: Dict[str, Any] = {
         "role": "assistant",
-        "content": response.get("answer", ""),
+        "content": answer if isinstance(answer, str) else "".join(map(str, answer)),
         "timestamp": datetime.now().isoformat(timespec="seconds"),
     }
 
     if st.session_state.settings.show_sources:
-        assistant_msg["sources"] = response.get("sources", [])
+        assistant_msg["sources"] = sink.get("sources", [])
 
     st.session_state.messages.append(assistant_msg)
     st.session_state.question_count += 1
@@ -242,7 +270,7 @@ with st.sidebar:
         st.rerun()
 
     if rebuild_clicked:
-        _get_chain.clear()
+        _chain_pool_state.clear()
         st.rerun()
 
     st.divider()
@@ -262,7 +290,7 @@ with st.sidebar:
 
     st.divider()
     st.caption(f"PDF: {PDF_PATH.name}")
-    st.caption(f"Vector store: {Path(VECTOR_STORE_PATH).name}")
+    st.caption(f"Vector store: {Path(resolve_index_path()).name}")
 
 
 # Main
@@ -295,7 +323,7 @@ with top_right:
 
 # Chain init (cached)
 try:
-    chain = _get_chain(settings.model_name, settings.temperature, settings.retrieval_k)
+    chain = _get_chain(settings.model_name, settings.temperature)
 except Exception as e:
     st.error(f"Failed to initialize the chatbot: {e}")
     st.stop()
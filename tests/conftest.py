@@ -0,0 +1,55 @@
+"""Shared pytest fixtures: an offline RAG stack built from fake models."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from src.rbi_nbfc_chatbot.chains import DocumentRetriever, RAGChain
+from src.rbi_nbfc_chatbot.chains.retriever import load_bm25_index
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+
+SAMPLE_CHUNKS = [
+    ("Every NBFC shall have a minimum Net Owned Fund of Rs.2 crore.", 12),
+    ("NBFCs cannot accept demand deposits and cannot issue cheques drawn on itself.", 3),
+    ("The Scale Based Regulatory Framework has Base, Middle, Upper and Top layers.", 41),
+    ("Systemically important NBFCs shall maintain a CRAR of 15 percent.", 57),
+    ("Section 45-IA of the RBI Act requires a Certificate of Registration.", 8),
+    ("Fair Practices Code requires disclosure of all-in-cost to borrowers.", 90),
+]
+
+
+@pytest.fixture
+def sample_documents():
+    return [
+        Document(page_content=text, metadata={"page": page, "source": "rbi_nbfc_master_direction.pdf"})
+        for text, page in SAMPLE_CHUNKS
+    ]
+
+
+@pytest.fixture
+def fake_vectorstore(sample_documents):
+    return FAISS.from_documents(sample_documents, HashingEmbeddings())
+
+
+@pytest.fixture
+def fake_llm():
+    return FakeChatModel()
+
+
+@pytest.fixture
+def make_chain(fake_vectorstore):
+    """Factory for RAG chains over the fake vector store; extra kwargs go to RAGChain."""
+
+    def build(vectorstore=None, llm=None, k=2, mode="dense", **kwargs):
+        vectorstore = vectorstore if vectorstore is not None else fake_vectorstore
+        bm25 = load_bm25_index(vectorstore) if mode != "dense" else None
+        retriever = DocumentRetriever(vectorstore=vectorstore, bm25=bm25, mode=mode, k=k)
+        return RAGChain(llm=llm or FakeChatModel(), retriever=retriever, **kwargs)
+
+    return build
@@ -0,0 +1,81 @@
+"""Offline tests for the answer cache."""
+
+import time
+
+from src.rbi_nbfc_chatbot.chains import RAGChain
+from src.rbi_nbfc_chatbot.chains.cache import AnswerCache, normalize_question
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+RESPONSE = {"question": "q", "answer": "Rs.2 crore", "model": "fake", "cached": False, "sources": []}
+
+
+def test_normalize_question():
+    assert normalize_question("  What is   the minimum NOF? ") == normalize_question("what is the minimum nof")
+
+
+def test_exact_hit_and_counters():
+    cache = AnswerCache()
+    assert cache.get("What is the minimum NOF?") is None
+    cache.put("What is the minimum NOF?", RESPONSE)
+
+    hit = cache.get("what is the minimum NOF")
+    assert hit["answer"] == "Rs.2 crore"
+    assert hit["question"] == "what is the minimum NOF"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_semantic_hit_respects_threshold():
+    cache = AnswerCache(similarity_threshold=0.8, embeddings=HashingEmbeddings())
+    cache.get("What is the minimum Net Owned Fund for an NBFC?")
+    cache.put("What is the minimum Net Owned Fund for an NBFC?", RESPONSE)
+
+    assert cache.get("What is the minimum Net Owned Fund for NBFC?") is not None
+    assert cache.get("Can NBFCs accept demand deposits?") is None
+    assert cache.stats()["semantic_hits"] == 1
+
+
+def test_lru_ttl_and_version_invalidation():
+    version = {"value": "v1"}
+    cache = AnswerCache(max_entries=2, ttl_seconds=0.05, version=lambda: version["value"])
+    for question in ("a", "b", "c"):
+        cache.put(question, RESPONSE)
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+    version["value"] = "v2"
+    assert cache.get("c") is None
+    assert cache.stats()["invalidations"] == 1
+
+    cache.put("d", RESPONSE)
+    time.sleep(0.06)
+    assert cache.get("d") is None
+
+
+def test_chain_serves_repeat_questions_from_cache(fake_vectorstore, fake_llm):
+    chain = RAGChain(
+        llm=fake_llm,
+        retriever=fake_vectorstore.as_retriever(search_kwargs={"k": 2}),
+        cache=AnswerCache(),
+    )
+
+    first = chain.ask_question("Can NBFCs accept deposits?")
+    second = chain.ask_question("can NBFCs accept deposits")
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["sources"] == first["sources"]
+    assert "sources" not in chain.ask_question("Can NBFCs accept deposits?", return_sources=False)
+    assert [e["event"] for e in chain.stream_question("Can NBFCs accept deposits?")] == ["sources", "token", "done"]
+
+
+def test_semantic_lookup_skips_expired_best_match():
+    cache = AnswerCache(ttl_seconds=60, similarity_threshold=0.5, embeddings=HashingEmbeddings())
+    stale, fresh = "What is the minimum Net Owned Fund for an NBFC?", "Minimum Net Owned Fund of an NBFC"
+    cache.put(stale, {**RESPONSE, "answer": "stale"})
+    cache.put(fresh, RESPONSE)
+    cache._entries[normalize_question(stale)].created_at -= 120
+
+    hit = cache.get("What is the minimum Net Owned Fund for NBFC?")
+    assert hit["answer"] == "Rs.2 crore"
+    assert cache.stats()["entries"] == 1
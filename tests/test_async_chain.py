@@ -0,0 +1,48 @@
+"""Offline tests for the async question answering path."""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains import RAGChain
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel
+
+
+def test_aask_question_matches_sync(fake_vectorstore, fake_llm):
+    chain = RAGChain(llm=fake_llm, retriever=fake_vectorstore.as_retriever(search_kwargs={"k": 2}))
+
+    sync_response = chain.ask_question("What is the minimum Net Owned Fund?")
+    async_response = asyncio.run(chain.aask_question("What is the minimum Net Owned Fund?"))
+
+    assert async_response == sync_response
+    assert len(async_response["sources"]) == 2
+    assert "Net Owned Fund" in async_response["sources"][0]["content"]
+
+
+def test_aask_question_runs_concurrently(fake_vectorstore):
+    chain = RAGChain(
+        llm=FakeChatModel(latency=0.2),
+        retriever=fake_vectorstore.as_retriever(search_kwargs={"k": 2}),
+    )
+
+    async def ask_many():
+        await asyncio.gather(*(chain.aask_question(f"Question {i}") for i in range(10)))
+
+    start = time.perf_counter()
+    asyncio.run(ask_many())
+    # Ten serial generations would take at least 2 seconds.
+    assert time.perf_counter() - start < 1.5
+
+
+def test_ask_endpoint_uses_async_chain(fake_vectorstore, fake_llm, monkeypatch):
+    chain = RAGChain(llm=fake_llm, retriever=fake_vectorstore.as_retriever(search_kwargs={"k": 3}))
+    monkeypatch.setattr(server, "_rag_chain", chain)
+
+    response = TestClient(server.app).post("/ask", json={"question": "Can NBFCs accept deposits?", "max_sources": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["answer"] == fake_llm.answer
+    assert len(body["sources"]) == 2
@@ -0,0 +1,156 @@
+"""Offline tests for batch question answering."""
+
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains.cache import AnswerCache
+from src.rbi_nbfc_chatbot.chains.faq import FAQ_MODEL_NAME, FAQIndex
+from src.rbi_nbfc_chatbot.utils.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+
+QUESTIONS = [
+    "What is the minimum Net Owned Fund?",
+    "Can NBFCs accept demand deposits?",
+    "What is the minimum Net Owned Fund?",
+    "What does Section 45-IA require?",
+]
+
+
+class BatchEmbeddings(HashingEmbeddings):
+    """Fake embeddings with a batched query API, recording each request."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def embed_queries(self, texts):
+        self.requests.append(list(texts))
+        return self.embed_documents(texts)
+
+
+class QueryCountingEmbeddings(BatchEmbeddings):
+    """Also records single-query requests."""
+
+    def embed_query(self, text):
+        self.requests.append([text])
+        return self.embed_documents([text])[0]
+
+
+class FlakyChatModel(FakeChatModel):
+    """Fails for prompts mentioning "Section 45-IA"."""
+
+    def _generate(self, messages, *args, **kwargs):
+        if "Section 45-IA require" in messages[-1].content:
+            raise RuntimeError("quota exceeded")
+        return super()._generate(messages, *args, **kwargs)
+
+    async def _agenerate(self, messages, *args, **kwargs):
+        if "Section 45-IA require" in messages[-1].content:
+            raise RuntimeError("quota exceeded")
+        return await super()._agenerate(messages, *args, **kwargs)
+
+
+def test_ask_batch_embeds_unique_questions_in_one_call(make_chain, fake_vectorstore):
+    embeddings = BatchEmbeddings()
+    fake_vectorstore.embedding_function = embeddings
+    chain = make_chain()
+
+    responses = chain.ask_batch(QUESTIONS, concurrency=4)
+
+    assert embeddings.requests == [[QUESTIONS[0], QUESTIONS[1], QUESTIONS[3]]]
+    assert [r["question"] for r in responses] == QUESTIONS
+    assert responses[0] == responses[2] and responses[0] is not responses[2]
+    assert responses[0]["sources"] == chain.ask_question(QUESTIONS[0])["sources"]
+
+
+def test_ask_batch_matches_faq_and_retrieves_with_one_embedding_call(make_chain, fake_vectorstore):
+    embeddings = QueryCountingEmbeddings()
+    fake_vectorstore.embedding_function = embeddings
+    chain = make_chain(llm=FakeChatModel(answer="Generated."))
+    samples = [{"question": QUESTIONS[1], "answer": "No."}]
+    chain.faq = FAQIndex.build(samples, embeddings, chain.retriever, threshold=0.7)
+    paraphrase = "Can an NBFC accept demand deposits?"
+    questions = [QUESTIONS[1], paraphrase, QUESTIONS[0], QUESTIONS[3]]
+
+    embeddings.requests.clear()
+    responses = chain.ask_batch(questions)
+    assert embeddings.requests == [[paraphrase, QUESTIONS[0], QUESTIONS[3]]]
+    assert [r["answer"] for r in responses] == ["No.", "No.", "Generated.", "Generated."]
+    assert responses[0]["sources"] == chain.faq.match(QUESTIONS[1]).sources
+
+    # FAQ hits needing more sources than stored join the batched retrieval
+    embeddings.requests.clear()
+    responses = chain.ask_batch(questions, k=3)
+    assert embeddings.requests == [questions]
+    assert [r["model"] == FAQ_MODEL_NAME for r in responses] == [True, True, False, False]
+    assert [len(r["sources"]) for r in responses] == [3, 3, 3, 3]
+
+
+@pytest.mark.parametrize("mode", ["dense", "hybrid", "lexical"])
+def test_retrieve_batch_matches_retrieve(make_chain, mode):
+    retriever = make_chain(mode=mode).retriever
+    batch = retriever.retrieve_batch(QUESTIONS + ["xyzzy"])
+    assert batch == [retriever.retrieve(q) for q in QUESTIONS + ["xyzzy"]]
+
+
+def test_ask_batch_bounds_and_uses_concurrency(make_chain):
+    chain = make_chain(llm=FakeChatModel(latency=0.2))
+    questions = [f"Question {i} about NBFC deposits" for i in range(8)]
+
+    start = time.perf_counter()
+    chain.ask_batch(questions, concurrency=8)
+    assert time.perf_counter() - start < 1.0  # serial would take 1.6 s
+
+    start = time.perf_counter()
+    asyncio.run(chain.aask_batch(questions, concurrency=2))
+    assert time.perf_counter() - start >= 0.8  # 4 rounds of 2
+
+
+def test_failed_generation_does_not_fail_batch(make_chain):
+    chain = make_chain(llm=FlakyChatModel())
+
+    for responses in (chain.ask_batch(QUESTIONS), asyncio.run(chain.aask_batch(QUESTIONS))):
+        assert responses[3]["error"] == "quota exceeded"
+        assert responses[3]["answer"] == ""
+        assert all("error" not in r for r in responses[:3])
+
+
+def test_ask_batch_serves_and_fills_answer_cache(make_chain):
+    chain = make_chain(cache=AnswerCache())
+    chain.ask_question(QUESTIONS[1])
+
+    first = chain.ask_batch(QUESTIONS, return_sources=False)
+    assert [r["cached"] for r in first] == [False, True, False, False]
+    assert "sources" not in first[0]
+    assert all(r["cached"] for r in chain.ask_batch(QUESTIONS))
+
+
+def test_cached_embeddings_batch_only_sends_misses(tmp_path):
+    underlying = BatchEmbeddings()
+    embeddings = CachedEmbeddings(underlying, EmbeddingCache(tmp_path / "e.sqlite3"), model_name="fake")
+    embeddings.embed_query("alpha")
+
+    vectors = embeddings.embed_queries(["alpha", "beta", "beta"])
+    assert underlying.requests == [["beta"]]
+    assert vectors[0] == embeddings.embed_query("alpha")
+    assert vectors[1] == vectors[2]
+
+
+def test_batch_endpoint(make_chain, monkeypatch):
+    monkeypatch.setattr(server, "_rag_chain", make_chain(llm=FlakyChatModel()))
+    client = TestClient(server.app)
+
+    response = client.post("/ask/batch", json={"questions": QUESTIONS, "max_sources": 1})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["question"] for r in results] == QUESTIONS
+    assert all(len(r["sources"]) == 1 for r in results[:3])
+    assert results[3]["error"] == "quota exceeded"
+
+    assert client.post("/ask/batch", json={"questions": []}).status_code == 400
+    too_many = ["q"] * (server.MAX_BATCH_QUESTIONS + 1)
+    assert client.post("/ask/batch", json={"questions": too_many}).status_code == 400
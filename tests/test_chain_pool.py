@@ -0,0 +1,70 @@
+"""Offline tests for the chain pool and per-request chain settings."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains import ChainPool
+from src.rbi_nbfc_chatbot.chains.cache import AnswerCache, index_version
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel
+
+
+def test_pooled_chains_share_the_index(make_chain, tmp_path):
+    base = make_chain(model_name="gemini-2.5-flash", temperature=0.1, cache=AnswerCache(), index_path=str(tmp_path))
+    built = []
+
+    def llm_factory(model_name, temperature):
+        built.append((model_name, temperature))
+        return FakeChatModel()
+
+    pool = ChainPool(base, max_chains=2, llm_factory=llm_factory)
+    assert pool.get() is base
+    assert pool.get(model_name="gemini-2.5-flash", temperature=0.1) is base
+
+    warm = pool.get(temperature=0.7)
+    assert built == [("gemini-2.5-flash", 0.7)]
+    assert warm.llm is not base.llm
+    assert warm.retriever is base.retriever and warm.compressor is base.compressor
+    assert warm.cache is not base.cache
+    # ... but its cache is invalidated by the same vector store as the base chain's
+    assert warm.cache.stats()["version"] == index_version(str(tmp_path))
+    assert pool.get(temperature=0.7) is warm
+
+    # Least recently used chain is evicted once the pool is full
+    pro = pool.get(model_name="gemini-2.5-pro")
+    pool.get(model_name="gemini-2.5-pro", temperature=0.7)
+    assert pool.stats()["evictions"] == 1
+    assert pool.get(model_name="gemini-2.5-pro") is pro
+    assert pool.get(temperature=0.7) is not warm
+    assert pool.stats()["hits"] == 2
+
+
+def test_ask_endpoint_uses_per_request_settings(make_chain, monkeypatch):
+    base = make_chain(model_name="gemini-2.5-flash", temperature=0.1, cache=AnswerCache())
+    monkeypatch.setattr(server, "_rag_chain", base)
+    pool = ChainPool(base, llm_factory=lambda model_name, temperature: FakeChatModel())
+    monkeypatch.setattr(server, "_chain_pool", pool)
+    monkeypatch.setattr(server, "_single_flight", server.SingleFlight())
+
+    question = "What is the minimum Net Owned Fund?"
+
+    async def ask(**settings):
+        return await server.ask_question(server.QuestionRequest(question=question, max_sources=10, **settings))
+
+    assert len(asyncio.run(ask()).sources) == 2
+    assert len(asyncio.run(ask(k=5)).sources) == 5
+    assert pool.stats()["chains"] == 0
+    assert len(asyncio.run(ask(temperature=0.5, k=3)).sources) == 3
+    asyncio.run(ask(temperature=0.5))
+    assert server._chain_pool is pool
+    assert pool.stats()["chains"] == 1
+
+    invalid = (
+        {"k": 0}, {"k": server.MAX_REQUEST_K + 1}, {"temperature": -1.0}, {"model": " "}, {"max_context_tokens": -1}
+    )
+    for settings in invalid:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(ask(**settings))
+        assert error.value.status_code == 400
@@ -0,0 +1,76 @@
+"""Offline tests for merging adjacent retrieved chunks into passages."""
+
+import pytest
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from src.rbi_nbfc_chatbot.chains.retriever import DocumentRetriever, load_bm25_index, merge_adjacent_chunks
+from src.rbi_nbfc_chatbot.utils.document_loader import split_documents
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+PAGE_TEXT = " ".join(
+    f"Paragraph {i}: NBFCs shall maintain liquidity coverage and report item {i} to the Reserve Bank."
+    for i in range(12)
+)
+
+
+def _chunks(with_offsets=True):
+    page = Document(page_content=PAGE_TEXT, metadata={"source": "md.pdf", "page": 7})
+    chunks = split_documents([page], chunk_size=300, chunk_overlap=60, strategy="recursive")
+    if not with_offsets:
+        for chunk in chunks:
+            del chunk.metadata["start_index"]
+    return chunks
+
+
+@pytest.mark.parametrize("with_offsets", [True, False])
+def test_overlapping_chunks_merge_into_contiguous_passage(with_offsets):
+    chunks = _chunks(with_offsets)
+    assert len(chunks) >= 4
+
+    # Ranked out of document order; the two pairs of neighbours each merge
+    passages = merge_adjacent_chunks([chunks[2], chunks[0], chunks[1], chunks[3]], k=4)
+    assert len(passages) == 1
+    merged = passages[0]
+    assert merged.metadata["merged_chunks"] == 4
+    assert merged.page_content == PAGE_TEXT[:PAGE_TEXT.index(chunks[3].page_content) + len(chunks[3].page_content)]
+    if with_offsets:
+        assert merged.metadata["start_index"] == 0
+
+
+def test_non_adjacent_chunks_and_other_pages_stay_separate():
+    chunks = _chunks()
+    elsewhere = Document(page_content=chunks[1].page_content, metadata={"source": "md.pdf", "page": 8})
+    passages = merge_adjacent_chunks([chunks[0], chunks[2], elsewhere, chunks[4]], k=3)
+    assert [p.page_content for p in passages] == [
+        chunks[0].page_content, chunks[2].page_content, elsewhere.page_content
+    ]
+    assert all("merged_chunks" not in p.metadata for p in passages)
+
+
+def test_merging_frees_slots_for_other_passages():
+    chunks = _chunks()
+    other = Document(
+        page_content="Fair Practices Code requires disclosure of all-in-cost.",
+        metadata={"source": "md.pdf", "page": 90},
+    )
+    passages = merge_adjacent_chunks(iter([chunks[0], chunks[1], other, chunks[4]]), k=2)
+    assert len(passages) == 2
+    assert passages[0].metadata["merged_chunks"] == 2
+    assert passages[1] is other
+
+
+@pytest.mark.parametrize("mode", ["dense", "hybrid", "lexical"])
+def test_retriever_returns_k_distinct_passages(mode):
+    chunks = _chunks()
+    vectorstore = FAISS.from_documents(chunks, HashingEmbeddings())
+    bm25 = load_bm25_index(vectorstore) if mode != "dense" else None
+    question = "How should NBFCs report liquidity coverage to the Reserve Bank?"
+
+    plain = DocumentRetriever(vectorstore=vectorstore, bm25=bm25, mode=mode, k=3)
+    merging = DocumentRetriever(vectorstore=vectorstore, bm25=bm25, mode=mode, k=3, merge_adjacent=True)
+
+    docs = merging.retrieve(question)
+    assert len(docs) == 1 and docs[0].page_content == PAGE_TEXT
+    assert len(plain.retrieve(question)) == 3
+    assert merging.retrieve_batch([question]) == [docs]
@@ -0,0 +1,53 @@
+"""Offline tests for the memory-mapped chunk store."""
+
+import os
+
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+
+from src.rbi_nbfc_chatbot.utils.chunk_store import ChunkStore, has_chunk_store, write_chunk_store
+from src.rbi_nbfc_chatbot.utils.faiss_index import load_vector_store
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.ingest import build_vector_store
+
+
+def test_round_trip_preserves_text_and_metadata(tmp_path):
+    documents = [
+        Document(page_content="Net Owned Fund of ₹2 crore", metadata={"page": 1, "source": "a.pdf"}),
+        Document(page_content="", metadata={"page": 2}),
+        Document(page_content="Section 45-IA", metadata={"source": "b.pdf", "tags": ["nbfc", "cor"]}),
+    ]
+    write_chunk_store(str(tmp_path), documents)
+
+    store = ChunkStore(str(tmp_path))
+    assert len(store) == 3
+    for row, doc in enumerate(documents):
+        assert store.search(row) == doc
+    assert store.search(3) == "ID 3 not found."
+
+
+def test_empty_store(tmp_path):
+    write_chunk_store(str(tmp_path), [])
+    assert len(ChunkStore(str(tmp_path))) == 0
+    assert has_chunk_store(str(tmp_path), 0)
+
+
+def test_load_vector_store_does_not_need_pickle(tmp_path, sample_documents):
+    output_path = str(tmp_path / "index.faiss")
+    built = build_vector_store(sample_documents, output_path=output_path, embeddings=HashingEmbeddings())
+    os.remove(os.path.join(output_path, "index.pkl"))
+
+    loaded = load_vector_store(output_path, HashingEmbeddings())
+    assert isinstance(loaded.docstore, ChunkStore)
+    query = "minimum Net Owned Fund"
+    assert loaded.similarity_search(query, k=2) == built.similarity_search(query, k=2)
+
+
+def test_row_count_mismatch_falls_back_to_pickle(tmp_path, fake_vectorstore, sample_documents):
+    fake_vectorstore.save_local(str(tmp_path))
+    write_chunk_store(str(tmp_path), sample_documents[:2])
+    assert not has_chunk_store(str(tmp_path), fake_vectorstore.index.ntotal)
+
+    loaded = load_vector_store(str(tmp_path), HashingEmbeddings())
+    assert not isinstance(loaded.docstore, ChunkStore)
+    assert isinstance(loaded, FAISS)
@@ -0,0 +1,103 @@
+"""Offline tests for context compression and token budgeting."""
+
+from langchain.schema import Document
+
+from src.rbi_nbfc_chatbot.chains import DocumentRetriever, RAGChain
+from src.rbi_nbfc_chatbot.chains.context import (
+    ContextCompressor,
+    remove_overlaps,
+    score_sentences,
+    split_sentences,
+)
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel
+from src.rbi_nbfc_chatbot.utils.metrics import PipelineMetrics
+
+
+def count_words(text):
+    return len(text.split())
+
+
+PAGE = (
+    "38. \nExperience of the Board \nAt least one of the directors shall have relevant experience of \n"
+    "having worked in a bank/ NBFC. \n39. \nRisk Management Committee \nNBFCs shall constitute a Risk "
+    "Management Committee (RMC) either at the Board or executive level. The RMC shall report to the Board. "
+    "Loans above Rs. 5 crore shall be reported. \n40. \nLoans to directors shall follow a Board approved policy."
+)
+
+
+def _docs():
+    # Two chunks of PAGE overlapping the way the splitter overlaps them
+    first, second = PAGE[:PAGE.index(" The RMC")], PAGE[PAGE.index("39."):]
+    return [Document(page_content=second, metadata={"page": 44}), Document(page_content=first, metadata={"page": 44})]
+
+
+def test_split_sentences_handles_wrapping_numbering_and_abbreviations():
+    assert split_sentences(PAGE) == [
+        "38. Experience of the Board At least one of the directors shall have relevant experience "
+        "of having worked in a bank/ NBFC.",
+        "39. Risk Management Committee NBFCs shall constitute a Risk Management Committee (RMC) "
+        "either at the Board or executive level.",
+        "The RMC shall report to the Board.",
+        "Loans above Rs. 5 crore shall be reported.",
+        "40. Loans to directors shall follow a Board approved policy.",
+    ]
+
+
+def test_remove_overlaps_in_either_order():
+    second, first = (doc.page_content for doc in _docs())
+    assert remove_overlaps([first, second]) == [first.strip(), PAGE[len(first):].strip()]
+    assert remove_overlaps([second, first]) == [second.strip(), PAGE[:PAGE.index("39.")].strip()]
+    assert remove_overlaps([PAGE, PAGE[50:150], "unrelated text"]) == [PAGE.strip(), "", "unrelated text"]
+
+
+def test_overlap_and_duplicate_sentences_are_dropped():
+    compressed = ContextCompressor(max_tokens=0, token_counter=count_words).compress("board", _docs())
+    assert compressed.text.count("shall constitute a Risk Management Committee") == 1
+    assert compressed.tokens < compressed.original_tokens
+    assert all(sentence in compressed.text for sentence in split_sentences(PAGE))
+
+
+def test_budget_keeps_most_relevant_sentences_in_order():
+    question = "Who must the Risk Management Committee report to?"
+    scores = score_sentences(question, split_sentences(PAGE))
+    assert max(range(len(scores)), key=scores.__getitem__) in (1, 2)
+
+    compressed = ContextCompressor(max_tokens=30, token_counter=count_words).compress(question, _docs())
+    assert compressed.tokens <= 30
+    assert "Risk Management Committee (RMC)" in compressed.text
+    assert "The RMC shall report to the Board." in compressed.text
+    assert "Loans to directors" not in compressed.text
+    assert compressed.text.index("(RMC)") < compressed.text.index("The RMC shall report")
+
+
+def test_sentence_filter_keeps_only_matching_sentences():
+    compressor = ContextCompressor(max_tokens=0, sentence_filter=True, token_counter=count_words)
+    assert compressor.compress("crore", _docs()).text == "Loans above Rs. 5 crore shall be reported."
+    # No sentence matches: keep everything rather than send an empty context
+    assert compressor.compress("xyzzy", _docs()).text.count(".") > 3
+
+
+def test_chain_uses_compressed_context(fake_vectorstore):
+    retriever = DocumentRetriever(vectorstore=fake_vectorstore, k=4)
+    chain = RAGChain(
+        llm=FakeChatModel(),
+        retriever=retriever,
+        compressor=ContextCompressor(max_tokens=15, token_counter=count_words),
+        metrics=PipelineMetrics(),
+    )
+    question = "What is the minimum Net Owned Fund?"
+    prompt = chain._build_prompt(question, retriever.retrieve(question))
+    assert "Net Owned Fund of Rs.2 crore" in prompt
+    assert prompt.count("\n\n") < RAGChain(llm=FakeChatModel(), retriever=retriever)._build_prompt(
+        question, retriever.retrieve(question)
+    ).count("\n\n")
+
+    timings = chain.ask_question(question, return_timings=True)["timings"]
+    assert 0 < timings["context_tokens"] <= 15
+    assert timings["context_tokens_saved"] > 0
+
+    # Compression stats get their own histogram, not the LLM usage one
+    rendered = chain.metrics.render()
+    assert 'rag_context_tokens_count{kind="kept"} 1' in rendered
+    assert 'rag_context_tokens_count{kind="saved"} 1' in rendered
+    assert 'rag_llm_tokens_count{kind="context' not in rendered
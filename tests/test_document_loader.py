@@ -0,0 +1,82 @@
+"""Offline tests for multi-document PDF loading."""
+
+import fitz
+import pytest
+
+from src.rbi_nbfc_chatbot.utils.document_loader import (
+    extract_document_metadata,
+    find_pdfs,
+    load_documents,
+    load_pdf,
+)
+from src.rbi_nbfc_chatbot.utils.pdf_backends import PDF_BACKENDS
+
+# Spacing inside the numbers mirrors what pypdf extracts from the Master Direction
+FRONT_MATTER = """RESERVE BANK OF INDIA
+DEPARTMENT OF REGULATION
+RBI/DoR/202 3-24/ 106
+DoR.FIN.REC.No. 45/03.10.119/202 3-24    October 19,  2023
+Master Direction - Scale Based Regulation"""
+
+
+def _write_pdf(path, pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+
+
+def test_extract_document_metadata():
+    assert extract_document_metadata(FRONT_MATTER) == {
+        "circular_number": "RBI/DoR/2023-24/106",
+        "reference_number": "DoR.FIN.REC.No.45/03.10.119/2023-24",
+        "circular_date": "2023-10-19",
+        "department": "Department of Regulation",
+    }
+    assert extract_document_metadata("no front matter")["circular_number"] is None
+
+
+def test_find_pdfs_accepts_file_directory_and_glob(tmp_path):
+    (tmp_path / "nested").mkdir()
+    for name in ("b.pdf", "a.pdf", "nested/c.pdf"):
+        _write_pdf(tmp_path / name, ["text"])
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    assert find_pdfs(tmp_path / "a.pdf") == [str(tmp_path / "a.pdf")]
+    assert [p.split("/")[-1] for p in find_pdfs(tmp_path)] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert len(find_pdfs(str(tmp_path / "*.pdf"))) == 2
+    with pytest.raises(FileNotFoundError):
+        find_pdfs(tmp_path / "missing")
+
+
+def test_load_documents_in_process_pool(tmp_path):
+    _write_pdf(tmp_path / "circular_1.pdf", [FRONT_MATTER, "Paragraph 2 text"])
+    _write_pdf(tmp_path / "circular_2.pdf", ["Department of Supervision\nJanuary 5, 2024"])
+
+    pages = load_documents(tmp_path, max_workers=2)
+
+    assert [(p.metadata["document"], p.metadata["page"]) for p in pages] == [
+        ("circular_1.pdf", 0), ("circular_1.pdf", 1), ("circular_2.pdf", 0),
+    ]
+    assert pages[1].metadata["circular_number"] == "RBI/DoR/2023-24/106"
+    assert pages[2].metadata["department"] == "Department of Supervision"
+    assert pages[2].metadata["circular_date"] == "2024-01-05"
+
+
+@pytest.mark.parametrize("backend", sorted(PDF_BACKENDS))
+def test_backends_return_pages_with_pypdf_metadata(tmp_path, backend):
+    path = tmp_path / "doc.pdf"
+    _write_pdf(path, ["Net Owned Fund of Rs.2 crore", "Section 45-IA registration"])
+
+    pages = load_pdf(str(path), backend=backend)
+
+    assert [p.metadata for p in pages] == [{"source": str(path), "page": 0}, {"source": str(path), "page": 1}]
+    assert "Net Owned Fund" in pages[0].page_content
+    assert "45-IA" in pages[1].page_content
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    path = tmp_path / "doc.pdf"
+    _write_pdf(path, ["text"])
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        load_pdf(str(path), backend="ocr")
@@ -0,0 +1,46 @@
+"""Offline tests for the persistent query-embedding cache."""
+
+from src.rbi_nbfc_chatbot.utils.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return super().embed_documents(texts)
+
+
+def test_repeated_queries_hit_cache_across_instances(tmp_path):
+    path = tmp_path / "embeddings.sqlite3"
+    underlying = CountingEmbeddings()
+    embeddings = CachedEmbeddings(underlying, EmbeddingCache(path), model_name="fake")
+
+    first = embeddings.embed_query("What is the minimum NOF?")
+    second = embeddings.embed_query("  What is the   minimum NOF? ")
+    assert underlying.calls == 1
+    assert second == first
+
+    # A second process/app opening the same file reuses the stored vector.
+    other = CachedEmbeddings(underlying, EmbeddingCache(path), model_name="fake")
+    other.embed_query("What is the minimum NOF?")
+    assert underlying.calls == 1
+
+    # Different model names do not share entries.
+    CachedEmbeddings(underlying, EmbeddingCache(path), model_name="other").embed_query("What is the minimum NOF?")
+    assert underlying.calls == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite3", max_entries=2)
+    cache.put("m", "a", [1.0])
+    cache.put("m", "b", [2.0])
+    assert cache.get("m", "a") == [1.0]
+    cache.put("m", "c", [3.0])
+
+    assert len(cache) == 2
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") == [1.0]
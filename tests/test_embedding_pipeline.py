@@ -0,0 +1,72 @@
+"""Offline tests for the batched embedding pipeline."""
+
+import pytest
+
+from src.rbi_nbfc_chatbot.utils.embedding_pipeline import EmbeddingStats, embed_in_batches, is_rate_limit_error
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+class RateLimited(Exception):
+    code = 429
+
+
+class FlakyEmbeddings(HashingEmbeddings):
+    """Fails with a 429 on selected calls, or hard-fails after `fail_after` calls."""
+
+    def __init__(self, rate_limit_calls=(), fail_after=None):
+        super().__init__()
+        self.calls = 0
+        self.embedded = []
+        self.rate_limit_calls = set(rate_limit_calls)
+        self.fail_after = fail_after
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        if self.calls in self.rate_limit_calls:
+            raise RateLimited("429 Too Many Requests")
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise RuntimeError("connection reset")
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+TEXTS = [f"chunk {i}" for i in range(10)]
+
+
+def test_batches_preserve_order():
+    vectors = embed_in_batches(TEXTS, HashingEmbeddings(), batch_size=3, max_workers=4, requests_per_second=1000)
+    assert vectors == HashingEmbeddings().embed_documents(TEXTS)
+
+
+def test_rate_limited_batches_are_retried(monkeypatch):
+    monkeypatch.setattr("src.rbi_nbfc_chatbot.utils.embedding_pipeline.time.sleep", lambda _: None)
+    embeddings = FlakyEmbeddings(rate_limit_calls={1, 2})
+    stats = EmbeddingStats()
+
+    vectors = embed_in_batches(TEXTS, embeddings, batch_size=5, max_workers=1, requests_per_second=1000, stats=stats)
+
+    assert len(vectors) == 10
+    assert stats.retries == 2
+    assert is_rate_limit_error(RateLimited())
+    assert not is_rate_limit_error(RuntimeError("boom"))
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.jsonl")
+
+    with pytest.raises(RuntimeError):
+        embed_in_batches(
+            TEXTS, FlakyEmbeddings(fail_after=2), batch_size=2, max_workers=1,
+            requests_per_second=1000, checkpoint_path=checkpoint,
+        )
+
+    resumed = FlakyEmbeddings()
+    stats = EmbeddingStats()
+    vectors = embed_in_batches(
+        TEXTS, resumed, batch_size=2, max_workers=1,
+        requests_per_second=1000, checkpoint_path=checkpoint, stats=stats,
+    )
+
+    assert stats.resumed == 4
+    assert resumed.embedded == TEXTS[4:]
+    assert vectors == HashingEmbeddings().embed_documents(TEXTS)
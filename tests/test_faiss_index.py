@@ -0,0 +1,90 @@
+"""Offline tests for approximate FAISS index types."""
+
+import numpy as np
+import pytest
+from langchain.schema import Document
+
+from src.rbi_nbfc_chatbot.utils.faiss_index import (
+    INDEX_TYPES,
+    VECTORS_FILENAME,
+    build_faiss_index,
+    configure_search,
+    index_type_of,
+    load_vector_store,
+    read_faiss_dimension,
+)
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.ingest import build_vector_store
+from src.rbi_nbfc_chatbot.utils.manifest import load_manifest
+
+
+def _vectors(n=2000, d=64, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal((n, d), dtype=np.float32)
+    return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("index_type", INDEX_TYPES)
+def test_index_types_find_stored_vectors(index_type):
+    vectors = _vectors()
+    index = build_faiss_index(vectors, index_type, pq_m=16)
+    assert index_type_of(index) == index_type
+    assert index.ntotal == len(vectors)
+
+    # Generous search settings: every query is a stored vector
+    configure_search(index, nprobe=index.nlist if hasattr(index, "nlist") else None, ef_search=256)
+    _, rows = index.search(vectors[:50], 1)
+    hit_rate = np.mean(rows[:, 0] == np.arange(50))
+    assert hit_rate >= (0.7 if index_type == "ivf-pq" else 0.98)
+
+
+def test_configure_search_sets_nprobe_and_ef_search():
+    ivf = build_faiss_index(_vectors(), "ivf-flat", nlist=16)
+    assert configure_search(ivf, nprobe=5).nprobe == 5
+    assert configure_search(ivf, nprobe=500).nprobe == 16
+
+    hnsw = build_faiss_index(_vectors(200), "hnsw")
+    assert configure_search(hnsw, ef_search=77).hnsw.efSearch == 77
+
+
+def test_unknown_index_type_raises():
+    with pytest.raises(ValueError, match="Unknown FAISS index type"):
+        build_faiss_index(_vectors(10), "annoy")
+
+
+def test_build_vector_store_with_hnsw_reuses_raw_vectors(tmp_path):
+    output_path = str(tmp_path / "index.faiss")
+    docs = [Document(page_content=f"chunk {i} about NBFC rule {i}", metadata={"page": i}) for i in range(50)]
+
+    store = build_vector_store(docs, output_path=output_path, embeddings=HashingEmbeddings(), index_type="hnsw")
+    assert index_type_of(store.index) == "hnsw"
+    assert (tmp_path / "index.faiss" / VECTORS_FILENAME).exists()
+    assert store.similarity_search("chunk 7 about NBFC rule 7", k=1)[0].metadata["page"] == 7
+
+    # Switching back to flat reuses the saved vectors and drops the side file
+    flat = build_vector_store(docs, output_path=output_path, embeddings=HashingEmbeddings(), index_type="flat")
+    assert index_type_of(flat.index) == "flat"
+    assert load_manifest(output_path)["reused"] == 50
+    assert not (tmp_path / "index.faiss" / VECTORS_FILENAME).exists()
+    np.testing.assert_allclose(flat.index.reconstruct(3), store.index.reconstruct(3), rtol=1e-6)
+
+
+def test_read_faiss_dimension_reads_header_only(tmp_path, fake_vectorstore):
+    fake_vectorstore.save_local(str(tmp_path))
+    assert read_faiss_dimension(str(tmp_path)) == 768
+    assert read_faiss_dimension(str(tmp_path / "missing")) is None
+
+
+@pytest.mark.parametrize("index_type", ["flat", "ivf-flat"])
+def test_load_vector_store_mmap_matches_regular_load(tmp_path, index_type):
+    output_path = str(tmp_path / "index.faiss")
+    docs = [Document(page_content=f"paragraph {i} on NBFC deposits", metadata={"page": i}) for i in range(100)]
+    build_vector_store(docs, output_path=output_path, embeddings=HashingEmbeddings(), index_type=index_type)
+
+    mapped = load_vector_store(output_path, HashingEmbeddings(), mmap=True)
+    loaded = load_vector_store(output_path, HashingEmbeddings(), mmap=False)
+    assert index_type_of(mapped.index) == index_type
+    query = "paragraph 42 on NBFC deposits"
+    assert [d.metadata for d in mapped.similarity_search(query, k=3)] == [
+        d.metadata for d in loaded.similarity_search(query, k=3)
+    ]
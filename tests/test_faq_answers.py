@@ -0,0 +1,82 @@
+"""Offline tests for the curated FAQ answer fast path."""
+
+import asyncio
+import os
+
+from src.rbi_nbfc_chatbot.chains import DocumentRetriever
+from src.rbi_nbfc_chatbot.chains.faq import FAQ_MODEL_NAME, FAQIndex, load_faq_index
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+
+SAMPLES = [
+    {"question": "What is the minimum Net Owned Fund (NOF) requirement for NBFCs?", "answer": "Rs.2 crore."},
+    {"question": "Can NBFCs accept demand deposits?", "answer": "No, NBFCs cannot accept demand deposits."},
+]
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return super().embed_documents([text])[0]
+
+    def embed_documents(self, texts):
+        raise AssertionError("FAQ questions are matched against queries and must be embedded as queries")
+
+
+def test_faq_questions_skip_generation(make_chain, fake_vectorstore):
+    chain = make_chain(llm=FakeChatModel(answer="Generated."))
+    chain.faq = FAQIndex.build(SAMPLES, fake_vectorstore.embeddings, chain.retriever, threshold=0.7)
+
+    exact = chain.ask_question("what is the minimum net owned fund (NOF) requirement for NBFCs", return_timings=True)
+    assert exact["answer"] == "Rs.2 crore." and exact["model"] == FAQ_MODEL_NAME
+    assert exact["faq_match"] == {"question": SAMPLES[0]["question"], "score": 1.0}
+    assert exact["sources"][0]["page"] == 12 and len(exact["sources"]) == 2
+    assert "faq_ms" in exact["timings"] and "llm_total_ms" not in exact["timings"]
+
+    paraphrase = asyncio.run(chain.aask_question("Can an NBFC accept demand deposits?", k=1))
+    assert paraphrase["answer"] == SAMPLES[1]["answer"]
+    assert 0.7 <= paraphrase["faq_match"]["score"] < 1.0
+    assert len(paraphrase["sources"]) == 1
+
+    other = chain.ask_question("What does the Fair Practices Code require?")
+    assert other["answer"] == "Generated." and "faq_match" not in other
+    assert chain.faq.stats()["exact_hits"] == 1 and chain.faq.stats()["semantic_hits"] == 1
+
+    events = list(chain.stream_question("Can NBFCs accept demand deposits?"))
+    assert [e["event"] for e in events] == ["sources", "token", "done"]
+    assert events[1]["data"] == SAMPLES[1]["answer"]
+    batch = chain.ask_batch(["Can NBFCs accept demand deposits?", "What does the Fair Practices Code require?"])
+    assert [r["answer"] for r in batch] == [SAMPLES[1]["answer"], "Generated."]
+
+
+def test_faq_index_is_cached_outside_the_store_and_rebuilt_when_stale(fake_vectorstore, tmp_path):
+    retriever = DocumentRetriever(vectorstore=fake_vectorstore, k=2)
+    embeddings = CountingEmbeddings()
+    store, cache_dir = tmp_path / "store", str(tmp_path / "cache")
+    store.mkdir()
+    (store / "index.faiss").write_bytes(b"v1")
+
+    def load(samples=SAMPLES, model="m"):
+        return load_faq_index(
+            retriever, embeddings, samples=samples, index_path=str(store), embedding_model=model, cache_dir=cache_dir
+        )
+
+    faq = load()
+    assert embeddings.calls == 2
+    assert os.listdir(store) == ["index.faiss"] and len(os.listdir(cache_dir)) == 1
+
+    loaded = load()
+    assert embeddings.calls == 2
+    assert loaded.questions == faq.questions and loaded.sources == faq.sources
+    assert (loaded.vectors == faq.vectors).all()
+
+    # A different FAQ set, embedding model or vector store rebuilds the index
+    load(samples=SAMPLES[:1])
+    load(samples=SAMPLES[:1], model="m2")
+    (store / "index.faiss").write_bytes(b"v2")
+    load(samples=SAMPLES[:1], model="m2")
+    assert embeddings.calls == 5
+    assert os.listdir(store) == ["index.faiss"] and len(os.listdir(cache_dir)) == 1
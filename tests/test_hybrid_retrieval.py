@@ -0,0 +1,94 @@
+"""Offline tests for BM25 and hybrid (dense + lexical) retrieval."""
+
+import asyncio
+
+from src.rbi_nbfc_chatbot.chains.retriever import DocumentRetriever, load_bm25_index, reciprocal_rank_fusion
+from src.rbi_nbfc_chatbot.utils.bm25 import BM25_FILENAME, BM25Index, tokenize
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    def __init__(self):
+        super().__init__()
+        self.queries = 0
+
+    def embed_query(self, text):
+        self.queries += 1
+        return super().embed_query(text)
+
+    async def aembed_query(self, text):
+        self.queries += 1
+        return await super().aembed_query(text)
+
+
+def test_tokenize_keeps_regulatory_compounds():
+    tokens = tokenize("Section 45-IA applies to NBFC-ND-SI with Rs.2 crore NOF")
+    assert {"45-ia", "nbfc-nd-si", "rs.2"} <= set(tokens)
+    assert {"45", "ia", "nbfc", "si"} <= set(tokens)
+
+
+def test_bm25_ranks_exact_token_match_first(sample_documents):
+    index = BM25Index.build([doc.page_content for doc in sample_documents])
+    rows = [row for row, _ in index.search("What does Section 45-IA say?", 3)]
+    assert sample_documents[rows[0]].metadata["page"] == 8
+    assert index.search("zzz unrelated", 3) == []
+
+
+def test_bm25_save_load_roundtrip(tmp_path, sample_documents):
+    texts = [doc.page_content for doc in sample_documents]
+    index = BM25Index.build(texts)
+    path = str(tmp_path / BM25_FILENAME)
+    index.save(path)
+    loaded = BM25Index.load(path)
+    assert len(loaded) == len(texts)
+    assert loaded.search("CRAR of 15 percent", 2) == index.search("CRAR of 15 percent", 2)
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    assert reciprocal_rank_fusion([[1, 2, 3], [2, 4]], k=60) == [2, 1, 4, 3]
+
+
+def test_load_bm25_index_never_writes_the_store(tmp_path, fake_vectorstore, monkeypatch):
+    fake_vectorstore.save_local(str(tmp_path))
+    bm25 = load_bm25_index(fake_vectorstore, str(tmp_path))
+    assert not (tmp_path / BM25_FILENAME).exists()
+    assert len(bm25) == fake_vectorstore.index.ntotal
+
+    # The index saved at build time is loaded rather than rebuilt
+    bm25.save(str(tmp_path / BM25_FILENAME))
+    monkeypatch.setattr(BM25Index, "build", None)
+    assert len(load_bm25_index(fake_vectorstore, str(tmp_path))) == len(bm25)
+
+
+def test_lexical_mode_skips_embedding_call(fake_vectorstore):
+    embeddings = CountingEmbeddings()
+    fake_vectorstore.embedding_function = embeddings
+    retriever = DocumentRetriever(
+        vectorstore=fake_vectorstore, bm25=load_bm25_index(fake_vectorstore), mode="lexical", k=2
+    )
+
+    docs = retriever.invoke("Certificate of Registration under Section 45-IA")
+    assert docs[0].metadata["page"] == 8
+    assert embeddings.queries == 0
+
+    # No shared terms: fall back to dense search
+    assert len(retriever.invoke("xyzzy")) == 2
+    assert embeddings.queries == 1
+
+
+def test_hybrid_mode_fuses_dense_and_lexical(fake_vectorstore):
+    retriever = DocumentRetriever(
+        vectorstore=fake_vectorstore, bm25=load_bm25_index(fake_vectorstore), mode="hybrid", k=3
+    )
+    docs = retriever.invoke("minimum Net Owned Fund Rs.2 crore")
+    assert docs[0].metadata["page"] == 12
+    assert len(docs) == 3
+
+    async_docs = asyncio.run(retriever.ainvoke("minimum Net Owned Fund Rs.2 crore"))
+    assert [d.page_content for d in async_docs] == [d.page_content for d in docs]
+
+
+def test_dense_mode_matches_similarity_search(fake_vectorstore):
+    retriever = DocumentRetriever(vectorstore=fake_vectorstore, k=2)
+    expected = fake_vectorstore.similarity_search("CRAR requirement", k=2)
+    assert [d.page_content for d in retriever.invoke("CRAR requirement")] == [d.page_content for d in expected]
@@ -0,0 +1,57 @@
+"""Offline tests for content-hashed incremental ingestion."""
+
+from langchain.schema import Document
+
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.ingest import build_vector_store
+from src.rbi_nbfc_chatbot.utils.manifest import load_manifest
+
+
+class CountingEmbeddings(HashingEmbeddings):
+    def __init__(self):
+        super().__init__()
+        self.embedded = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+def _docs(texts):
+    return [Document(page_content=text, metadata={"page": i}) for i, text in enumerate(texts)]
+
+
+def test_rebuild_embeds_only_changed_chunks(tmp_path):
+    output_path = str(tmp_path / "index.faiss")
+    embeddings = CountingEmbeddings()
+
+    build_vector_store(_docs(["alpha", "beta", "gamma"]), output_path=output_path, embeddings=embeddings)
+    assert embeddings.embedded == 3
+
+    store = build_vector_store(_docs(["alpha", "gamma", "delta"]), output_path=output_path, embeddings=embeddings)
+    assert embeddings.embedded == 4
+
+    manifest = load_manifest(output_path)
+    assert manifest["num_chunks"] == 3
+    assert (manifest["reused"], manifest["embedded"], manifest["removed"]) == (2, 1, 1)
+    assert store.index.ntotal == 3
+    assert store.similarity_search("delta", k=1)[0].page_content == "delta"
+    assert "beta" not in [doc.page_content for doc in store.docstore._dict.values()]
+
+
+def test_full_rebuild_ignores_stored_vectors(tmp_path):
+    output_path = str(tmp_path / "index.faiss")
+    embeddings = CountingEmbeddings()
+
+    build_vector_store(_docs(["alpha", "beta"]), output_path=output_path, embeddings=embeddings)
+    build_vector_store(_docs(["alpha", "beta"]), output_path=output_path, embeddings=embeddings, incremental=False)
+    assert embeddings.embedded == 4
+
+
+def test_changed_chunking_parameters_invalidate_vectors(tmp_path):
+    output_path = str(tmp_path / "index.faiss")
+    embeddings = CountingEmbeddings()
+
+    build_vector_store(_docs(["alpha"]), output_path=output_path, embeddings=embeddings, chunk_size=500)
+    build_vector_store(_docs(["alpha"]), output_path=output_path, embeddings=embeddings, chunk_size=800)
+    assert embeddings.embedded == 2
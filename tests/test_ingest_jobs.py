@@ -0,0 +1,128 @@
+"""Offline tests for background ingestion jobs."""
+
+import asyncio
+import json
+import os
+import time
+
+import fitz
+import pytest
+from fastapi import HTTPException
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.utils.fakes import HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.ingest_jobs import IngestJobQueue
+from src.rbi_nbfc_chatbot.utils.manifest import load_manifest
+from src.rbi_nbfc_chatbot.utils.snapshots import current_snapshot, snapshot_path
+
+
+def _write_pdf(path, pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    doc.save(str(path))
+
+
+def _wait(queue, job_id, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_jobs_add_documents_and_survive_restarts(tmp_path):
+    master, circular = tmp_path / "master.pdf", tmp_path / "circular.pdf"
+    _write_pdf(master, ["Every NBFC shall have a minimum Net Owned Fund.", "NBFCs cannot accept demand deposits."])
+    _write_pdf(circular, ["Gold loans shall not exceed a loan-to-value ratio of 75 percent."])
+    root, jobs_dir = str(tmp_path / "snapshots"), str(tmp_path / "jobs")
+    queue = IngestJobQueue(jobs_dir=jobs_dir, root=root, embeddings=HashingEmbeddings())
+
+    first = _wait(queue, queue.submit([str(master)], mode="replace")["id"])
+    assert first["status"] == "succeeded", first["error"]
+    progress = first["progress"]
+    assert (progress["stage"], progress["files_parsed"], progress["pages_parsed"]) == ("done", 1, 2)
+    assert progress["chunks_embedded"] == progress["chunks_to_embed"] == progress["chunks"]
+    assert first["snapshot"] == current_snapshot(root)
+
+    # Adding a circular keeps the corpus and embeds only the new chunks
+    added = _wait(queue, queue.submit([str(circular)])["id"])
+    assert added["status"] == "succeeded", added["error"]
+    assert added["progress"]["files_parsed"] == 2
+    manifest = load_manifest(snapshot_path(current_snapshot(root), root))
+    assert sorted(manifest["sources"]) == ["circular.pdf", "master.pdf"]
+    assert (manifest["reused"], manifest["embedded"]) == (progress["chunks"], 1)
+    queue.shutdown(wait=True)
+
+    # A job that was running when the process stopped runs again on restart
+    with open(os.path.join(jobs_dir, f"{added['id']}.json"), encoding="utf-8") as f:
+        interrupted = json.load(f)
+    interrupted.update(id="interrupted", status="running")
+    with open(os.path.join(jobs_dir, "interrupted.json"), "w", encoding="utf-8") as f:
+        json.dump(interrupted, f)
+
+    restarted = IngestJobQueue(jobs_dir=jobs_dir, root=root, embeddings=HashingEmbeddings())
+    assert restarted.get(first["id"])["status"] == "succeeded"
+    assert _wait(restarted, "interrupted")["status"] == "succeeded"
+    restarted.shutdown(wait=True)
+
+    assert restarted.get("../interrupted") is None
+    with pytest.raises(ValueError):
+        restarted.submit([str(master)], mode="append")
+    with pytest.raises(FileNotFoundError):
+        restarted.submit([str(tmp_path / "missing.pdf")])
+
+
+def test_each_job_runs_in_one_process(tmp_path):
+    pdf = tmp_path / "master.pdf"
+    _write_pdf(pdf, ["Every NBFC shall have a minimum Net Owned Fund."])
+    root, jobs_dir = str(tmp_path / "snapshots"), str(tmp_path / "jobs")
+    queue = IngestJobQueue(jobs_dir=jobs_dir, root=root, embeddings=HashingEmbeddings())
+    done = _wait(queue, queue.submit([str(pdf)])["id"])
+    queue.shutdown(wait=True)
+    assert not os.path.exists(os.path.join(jobs_dir, f"{done['id']}.lock"))
+
+    # Two workers start over the same jobs directory: only one may resume the job
+    done.update(id="interrupted", status="running")
+    with open(os.path.join(jobs_dir, "interrupted.json"), "w", encoding="utf-8") as f:
+        json.dump(done, f)
+    published = []
+    workers = [
+        IngestJobQueue(jobs_dir=jobs_dir, root=root, embeddings=HashingEmbeddings(), on_success=published.append)
+        for _ in range(2)
+    ]
+    for worker in workers:
+        assert _wait(worker, "interrupted")["status"] == "succeeded"
+        worker.shutdown(wait=True)
+    assert [job["id"] for job in published] == ["interrupted"]
+    assert workers[1].stats()["succeeded"] == 2
+
+
+def test_ingest_endpoints_reject_bad_requests(tmp_path, monkeypatch):
+    queue = IngestJobQueue(jobs_dir=str(tmp_path / "jobs"), root=str(tmp_path / "snapshots"))
+    monkeypatch.setattr(server, "_ingest_queue", queue)
+
+    def status(endpoint, *args, token="secret"):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(endpoint(*args, x_admin_token=token))
+        return error.value.status_code
+
+    # Without a configured token the admin endpoints are disabled
+    monkeypatch.setattr(server, "ADMIN_TOKEN", None)
+    assert status(server.ingest_jobs) == 503
+    assert status(server.admin_snapshots, token=None) == 503
+
+    monkeypatch.setattr(server, "ADMIN_TOKEN", "secret")
+    assert status(server.ingest_jobs, token=None) == 401
+    assert status(server.admin_reload, server.ReloadRequest(), token="wrong") == 401
+    assert status(server.ingest, server.IngestRequest(paths=["../../../etc"])) == 400
+    assert status(server.ingest, server.IngestRequest(paths=["missing-circular.pdf"])) == 404
+    assert status(server.ingest_job, "unknown") == 404
+
+    # Without snapshots a job would rewrite the served store in place
+    monkeypatch.setattr(server, "VECTOR_STORE_SNAPSHOTS", False)
+    assert status(server.ingest, server.IngestRequest(paths=["circulars"])) == 409
+    assert queue.list_jobs() == []
+    queue.shutdown()
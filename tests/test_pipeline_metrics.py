@@ -0,0 +1,113 @@
+"""Offline tests for per-stage pipeline timings and the /metrics endpoint."""
+
+import asyncio
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains.cache import AnswerCache
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.metrics import PipelineMetrics, PipelineTimings, stage
+
+QUESTION = "What is the minimum Net Owned Fund?"
+
+
+@pytest.mark.parametrize("mode", ["dense", "hybrid"])
+def test_ask_question_reports_stage_timings(make_chain, fake_vectorstore, mode):
+    fake_vectorstore.embedding_function = HashingEmbeddings(latency=0.02)
+    chain = make_chain(mode=mode, llm=FakeChatModel(latency=0.05), metrics=PipelineMetrics())
+
+    timings = chain.ask_question(QUESTION, return_timings=True)["timings"]
+    stages = {"embed_ms", "search_ms", "retrieval_ms", "context_ms", "llm_first_token_ms", "llm_total_ms", "total_ms"}
+    assert stages <= set(timings)
+    assert timings["embed_ms"] >= 20
+    assert timings["llm_first_token_ms"] >= 50
+    assert timings["llm_total_ms"] >= timings["llm_first_token_ms"]
+    assert timings["total_ms"] >= timings["retrieval_ms"] + timings["llm_total_ms"]
+    assert timings["input_tokens"] > 0 and timings["output_tokens"] == len(FakeChatModel().answer.split())
+
+    async_timings = asyncio.run(chain.aask_question(QUESTION, return_timings=True))["timings"]
+    assert async_timings.keys() == timings.keys()
+    assert "timings" not in chain.ask_question(QUESTION)
+
+
+def test_lexical_hits_skip_embedding(make_chain):
+    chain = make_chain(mode="lexical", metrics=PipelineMetrics())
+    timings = chain.ask_question(QUESTION, return_timings=True)["timings"]
+    assert "embed_ms" not in timings and "search_ms" in timings
+
+
+def test_cache_hits_are_timed_and_not_cached_with_timings(make_chain):
+    chain = make_chain(cache=AnswerCache(), metrics=PipelineMetrics())
+    chain.ask_question(QUESTION, return_timings=True)
+
+    hit = chain.ask_question(QUESTION, return_timings=True)
+    assert hit["cached"] and set(hit["timings"]) == {"cache_ms", "total_ms"}
+    assert "timings" not in chain.ask_question(QUESTION)
+
+    rendered = chain.metrics.render()
+    assert 'rag_requests_total{endpoint="ask",cached="true"} 2' in rendered
+    assert 'rag_requests_total{endpoint="ask",cached="false"} 1' in rendered
+
+
+def test_batch_answers_are_timed(make_chain):
+    chain = make_chain(cache=AnswerCache(), metrics=PipelineMetrics())
+    chain.ask_batch([QUESTION, "Can NBFCs accept deposits?", QUESTION])
+    asyncio.run(chain.aask_batch([QUESTION]))
+
+    rendered = chain.metrics.render()
+    assert 'rag_requests_total{endpoint="batch",cached="false"} 2' in rendered
+    assert 'rag_requests_total{endpoint="batch",cached="true"} 1' in rendered
+    for stage_name in ("retrieval", "context", "llm_total"):
+        assert f'rag_stage_duration_seconds_count{{stage="{stage_name}"}} 2' in rendered
+    assert 'rag_stage_duration_seconds_count{stage="total"} 3' in rendered
+
+
+def test_stage_without_active_timings_is_a_no_op():
+    with stage("embed"):
+        pass
+    timings = PipelineTimings()
+    with timings.activate():
+        with stage("embed"):
+            pass
+        with stage("embed"):
+            pass
+    assert list(timings.stages) == ["embed"]
+
+
+def test_prometheus_histograms_are_cumulative():
+    metrics = PipelineMetrics()
+    for seconds in (0.003, 0.2, 40.0):
+        timings = PipelineTimings()
+        timings.add("search", seconds)
+        timings.record_usage({"input_tokens": 100, "output_tokens": 10})
+        metrics.observe(timings)
+
+    rendered = metrics.render()
+    assert "# TYPE rag_stage_duration_seconds histogram" in rendered
+    assert 'rag_stage_duration_seconds_bucket{stage="search",le="0.005"} 1' in rendered
+    assert 'rag_stage_duration_seconds_bucket{stage="search",le="0.25"} 2' in rendered
+    assert 'rag_stage_duration_seconds_bucket{stage="search",le="30.0"} 2' in rendered
+    assert 'rag_stage_duration_seconds_bucket{stage="search",le="+Inf"} 3' in rendered
+    assert 'rag_stage_duration_seconds_count{stage="search"} 3' in rendered
+    assert 'rag_llm_tokens_bucket{kind="input",le="128"} 3' in rendered
+    sample = re.compile(r'^[a-z_]+(\{[^}]*\})? \S+$')
+    assert all(line.startswith("#") or sample.match(line) for line in rendered.splitlines())
+
+
+def test_ask_endpoint_timings_and_metrics(make_chain, monkeypatch):
+    chain = make_chain(metrics=PipelineMetrics())
+    monkeypatch.setattr(server, "_rag_chain", chain)
+    monkeypatch.setattr(server, "PIPELINE_METRICS", chain.metrics)
+    client = TestClient(server.app)
+
+    assert client.post("/ask", json={"question": QUESTION}).json()["timings"] is None
+    body = client.post("/ask", json={"question": "Can NBFCs accept deposits?", "include_timings": True}).json()
+    assert body["timings"]["llm_total_ms"] >= 0
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'rag_stage_duration_seconds_count{stage="llm_first_token"} 2' in response.text
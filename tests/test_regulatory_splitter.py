@@ -0,0 +1,112 @@
+"""Offline tests for the structure-aware regulatory splitter."""
+
+import pytest
+from langchain.schema import Document
+
+from src.rbi_nbfc_chatbot.utils.document_loader import split_documents
+from src.rbi_nbfc_chatbot.utils.regulatory_splitter import RegulatoryTextSplitter
+
+PAGE_ONE = """-4-
+
+Section II
+Chapter III
+Registration
+5.
+Requirement of registration
+5.1
+Every NBFC shall obtain a certificate of registration from the Reserve Bank before
+commencing business.
+5.2
+Minimum Net Owned Fund
+The minimum Net Owned Fund required is Rs.10 crore for NBFC-ICC, NBFC-MFI and
+NBFC-Factors, and Rs.2 crore for NBFC-P2P and NBFC-AA.
+6.
+Applications for registration
+An applicant NBFC shall submit the application with the following documents, which
+"""
+
+PAGE_TWO = """-5-
+
+shall be verified by the Regional Office before the application is processed:
+(i) Certified copy of the Memorandum and Articles of Association of the company,
+along with the certificate of incorporation issued by the Registrar of Companies.
+(ii) Board resolution approving the application and the business plan for the next
+three years, including the projected balance sheet and profit and loss account.
+(iii) Details of the directors, including their identification numbers and other
+directorships, with a declaration of fit and proper status from each director.
+Sl.
+No.
+Category
+Minimum NOF
+1
+NBFC-ICC
+Rs.10 crore
+2
+NBFC-P2P
+Rs.2 crore
+7.
+Cancellation of registration
+The Reserve Bank may cancel a certificate of registration for the reasons listed in
+section 45-IA(6) of the RBI Act, 1934, after giving the NBFC an opportunity of hearing.
+"""
+
+
+def _pages():
+    return [
+        Document(page_content=PAGE_ONE, metadata={"source": "md.pdf", "page": 4}),
+        Document(page_content=PAGE_TWO, metadata={"source": "md.pdf", "page": 5}),
+    ]
+
+
+def test_chunks_follow_paragraph_numbering():
+    chunks = RegulatoryTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(_pages())
+
+    for chunk in chunks:
+        page = PAGE_ONE if chunk.metadata["page"] == 4 else PAGE_TWO
+        start = chunk.metadata["start_index"]
+        assert page[start:start + len(chunk.page_content)] == chunk.page_content
+        assert not chunk.page_content.startswith("-")
+
+    labels = [(c.metadata["page"], c.metadata.get("paragraphs")) for c in chunks]
+    # Paragraph 5 and its sub-paragraphs stay together; 6 starts a new chunk
+    assert labels[0] == (4, ["5", "5.1", "5.2"])
+    assert chunks[0].page_content.startswith("Section II")
+    assert labels[1] == (4, ["6"])
+    # Paragraph 6 continues on the next page and keeps its id
+    assert labels[2] == (5, ["6"])
+    assert labels[-1] == (5, ["7"])
+    assert all(c.metadata["section"] == "II" and c.metadata["chapter"] == "III" for c in chunks)
+
+
+def test_long_paragraph_splits_between_list_items_and_keeps_tables_whole():
+    chunks = RegulatoryTextSplitter(chunk_size=300, chunk_overlap=50).split_documents(_pages())
+    paragraph_six = [c for c in chunks if c.metadata["page"] == 5 and c.metadata["paragraph"] == "6"]
+
+    assert len(paragraph_six) > 1
+    assert all(len(c.page_content) <= 300 for c in chunks)
+    # Every item starts a chunk or sits wholly inside one
+    for item in ("(i) Certified copy", "(ii) Board resolution", "(iii) Details of the directors"):
+        owner = next(c for c in paragraph_six if item in c.page_content)
+        text = PAGE_TWO[PAGE_TWO.index(item):]
+        assert text[:text.index(".") + 1] in owner.page_content
+    table = PAGE_TWO[PAGE_TWO.index("Sl.\n"):PAGE_TWO.index("7.\n")].strip()
+    assert any(table in c.page_content for c in paragraph_six)
+
+
+def test_numbers_inside_text_are_not_paragraphs():
+    page = Document(page_content="""12.1
+NBFCs shall maintain Tier 1 and Tier
+2 capital of not less than 15 percent, and report by
+31.3 of each year
+150.5 Crore limits do not apply.
+""", metadata={"source": "md.pdf", "page": 9})
+    chunks = RegulatoryTextSplitter().split_documents([page])
+    assert [c.metadata["paragraphs"] for c in chunks] == [["12.1"]]
+
+
+def test_split_documents_strategies(sample_documents):
+    regulatory = split_documents(sample_documents, chunk_size=200, chunk_overlap=40, strategy="regulatory")
+    recursive = split_documents(sample_documents, chunk_size=200, chunk_overlap=40, strategy="recursive")
+    assert all("start_index" in chunk.metadata for chunk in regulatory + recursive)
+    with pytest.raises(ValueError, match="Unknown chunk strategy"):
+        split_documents(sample_documents, strategy="semantic")
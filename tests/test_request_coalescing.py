@@ -0,0 +1,100 @@
+"""Offline tests for single-flight coalescing of identical /ask requests."""
+
+import asyncio
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains import DocumentRetriever, RAGChain
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel
+
+
+class CountingChatModel(FakeChatModel):
+    """Fake chat model that counts generations."""
+
+    calls: int = 0
+
+    async def _astream(self, messages, *args, **kwargs):
+        self.calls += 1
+        async for chunk in super()._astream(messages, *args, **kwargs):
+            yield chunk
+
+
+def test_single_flight_shares_one_execution():
+    flight = server.SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.05)
+        return {"answer": "shared"}
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(runs) == 1
+    assert [coalesced for _, coalesced in results] == [False, True, True, True, True]
+    assert all(result == {"answer": "shared"} for result, _ in results)
+    assert results[0][0] is not results[1][0]
+    assert flight.stats() == {"in_flight": 0, "executions": 1, "coalesced": 4}
+
+
+def test_single_flight_propagates_errors_and_forgets_key():
+    flight = server.SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("quota exceeded")
+
+    async def succeed():
+        return "ok"
+
+    async def main():
+        results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # A failed run is not reused by later callers
+        return await flight.do("key", succeed)
+
+    assert asyncio.run(main()) == ("ok", False)
+    assert flight.stats()["executions"] == 2
+
+
+def test_single_flight_survives_leader_cancellation():
+    flight = server.SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main()) == ("done", True)
+
+
+def test_ask_endpoint_coalesces_identical_questions(fake_vectorstore, monkeypatch):
+    llm = CountingChatModel(latency=0.1)
+    chain = RAGChain(llm=llm, retriever=DocumentRetriever(vectorstore=fake_vectorstore, k=2))
+    monkeypatch.setattr(server, "_rag_chain", chain)
+    monkeypatch.setattr(server, "_single_flight", server.SingleFlight())
+
+    questions = [
+        "What is the minimum Net Owned Fund?",
+        "what is the minimum net owned fund",
+        "Can NBFCs accept deposits?",
+    ]
+
+    async def main():
+        return await asyncio.gather(*(
+            server.ask_question(server.QuestionRequest(question=q, max_sources=1)) for q in questions
+        ))
+
+    responses = asyncio.run(main())
+    assert llm.calls == 2
+    assert [r.coalesced for r in responses] == [False, True, False]
+    assert [r.question for r in responses] == questions
+    assert responses[0].answer == responses[1].answer
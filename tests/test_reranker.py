@@ -0,0 +1,71 @@
+"""Offline tests for the second-stage reranker."""
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from src.rbi_nbfc_chatbot.chains.reranker import LexicalReranker, create_reranker, rerank_order
+from src.rbi_nbfc_chatbot.chains.retriever import DocumentRetriever, load_bm25_index
+from src.rbi_nbfc_chatbot.utils.metrics import PipelineTimings
+
+
+class RecordingReranker:
+    """Prefers one text and records how many candidates it was given."""
+
+    def __init__(self, preferred):
+        self.preferred = preferred
+        self.calls = []
+
+    def score(self, question, texts):
+        self.calls.append(list(texts))
+        return np.array([1.0 if self.preferred in text else 0.0 for text in texts])
+
+
+def test_lexical_reranker_prefers_coverage_and_phrases_over_repetition():
+    texts = [
+        "Deposits deposits deposits: the deposits chapter lists deposits.",
+        "NBFCs cannot accept demand deposits from the public.",
+        "A demand notice is sent before deposits are repaid.",
+    ]
+    scores = LexicalReranker().score("Can NBFCs accept demand deposits?", texts)
+    assert rerank_order(scores) == [1, 2, 0]
+    assert LexicalReranker().score("???", texts).tolist() == [0.0, 0.0, 0.0]
+
+
+def test_rerank_order_keeps_first_stage_order_on_ties():
+    assert rerank_order(np.array([0.5, 1.0, 0.5, 1.0])) == [1, 3, 0, 2]
+
+
+@pytest.mark.parametrize("mode", ["dense", "lexical", "hybrid"])
+def test_retriever_reranks_over_fetched_candidates(fake_vectorstore, mode):
+    reranker = RecordingReranker("Fair Practices Code")
+    retriever = DocumentRetriever(
+        vectorstore=fake_vectorstore,
+        bm25=load_bm25_index(fake_vectorstore) if mode != "dense" else None,
+        mode=mode,
+        k=2,
+        reranker=reranker,
+        rerank_candidates=6,
+    )
+    question = "What does the Fair Practices Code say about NBFC deposits?"
+    timings = PipelineTimings()
+    with timings.activate():
+        docs = retriever.retrieve(question)
+
+    assert len(docs) == 2
+    assert docs[0].metadata["page"] == 90
+    assert len(reranker.calls[0]) > 2
+    assert "rerank" in timings.stages
+    assert retriever.retrieve_batch([question])[0] == docs
+
+
+def test_create_reranker(fake_vectorstore):
+    assert create_reranker("none") is None
+    bm25 = load_bm25_index(fake_vectorstore)
+    assert create_reranker("lexical", bm25=bm25).bm25 is bm25
+    with pytest.raises(ValueError, match="Unknown reranker"):
+        create_reranker("colbert")
+    if importlib.util.find_spec("sentence_transformers") is None:
+        with pytest.raises(ImportError, match="sentence-transformers"):
+            create_reranker("cross-encoder")
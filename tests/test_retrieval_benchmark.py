@@ -0,0 +1,53 @@
+"""Offline tests for the FAQ retrieval benchmark harness."""
+
+import pytest
+from langchain.schema import Document
+
+from src.evals.retrieval_benchmark import (
+    compare,
+    label_relevant_pages,
+    latency_percentiles,
+    recall_at_k,
+    reciprocal_rank,
+    run_benchmark,
+)
+
+SAMPLES = [
+    {"question": "What is the minimum Net Owned Fund?", "answer": "Minimum Net Owned Fund of Rs.2 crore."},
+    {"question": "Can NBFCs accept demand deposits?", "answer": "NBFCs cannot accept demand deposits."},
+]
+
+
+@pytest.fixture
+def pages(sample_documents):
+    return [Document(page_content=doc.page_content * 4, metadata=doc.metadata) for doc in sample_documents]
+
+
+def test_ranking_metrics():
+    assert recall_at_k([3, 5, 3, 9], {3, 9}, k=2) == 0.5
+    assert recall_at_k([3, 5, 3, 9], {3, 9}, k=4) == 1.0
+    assert recall_at_k([1], set(), k=1) == 0.0
+    assert reciprocal_rank([4, 7, 3], {3}) == pytest.approx(1 / 3)
+    assert reciprocal_rank([4, 7], {3}) == 0.0
+    assert latency_percentiles(list(range(1, 101))) == {"p50": 50.5, "p95": 95.05, "p99": 99.01}
+
+
+def test_relevant_pages_follow_the_expected_answer(pages):
+    assert label_relevant_pages(pages, [s["answer"] for s in SAMPLES], top_n=1) == [{12}, {3}]
+
+
+def test_run_benchmark_covers_the_grid(pages):
+    results = run_benchmark(
+        pages, SAMPLES, chunk_sizes=[80, 200], ks=[1, 2], index_types=["flat", "hnsw"],
+        modes=["dense", "lexical"], relevant_pages=1,
+    )
+    assert len(results) == 2 * 2 * 2 * 2
+    assert {(r["chunk_size"], r["chunk_overlap"]) for r in results} == {(80, 16), (200, 40)}
+    lexical = [r for r in results if r["mode"] == "lexical"]
+    assert all(r["recall_at_k"] == 1.0 and r["mrr"] == 1.0 for r in lexical)
+    assert all(set(r["latency_ms"]) == {"p50", "p95", "p99"} for r in results)
+
+    # Deterministic embeddings: a rerun differs only in latency
+    rerun = run_benchmark(pages, SAMPLES, [80, 200], [1, 2], ["flat", "hnsw"], ["dense", "lexical"], relevant_pages=1)
+    assert all(delta["recall_at_k"] == 0 and delta["mrr"] == 0 for delta in compare(rerun, results))
+    assert len(compare(rerun, results[:3])) == 3
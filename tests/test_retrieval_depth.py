@@ -0,0 +1,63 @@
+"""Offline tests for per-call retrieval depth and context budget."""
+
+import asyncio
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.chains.cache import AnswerCache
+from src.rbi_nbfc_chatbot.chains.context import ContextCompressor
+
+QUESTION = "What is the minimum Net Owned Fund?"
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def test_k_per_call_sends_fewer_chunks(make_chain):
+    chain = make_chain(k=4, cache=AnswerCache())
+
+    shallow = chain.ask_question(QUESTION, k=1, return_timings=True)
+    deep = chain.ask_question(QUESTION, return_timings=True)
+    assert len(shallow["sources"]) == 1 and len(deep["sources"]) == 4
+    assert shallow["timings"]["input_tokens"] < deep["timings"]["input_tokens"]
+    assert shallow["sources"][0] == deep["sources"][0]
+
+    # Only default-settings answers are cached; k equal to the default is the default
+    assert chain.cache.stats()["entries"] == 1
+    assert not chain.ask_question(QUESTION, k=1)["cached"]
+    assert chain.ask_question(QUESTION, k=4)["cached"]
+
+    events = list(chain.stream_question("Can NBFCs accept deposits?", k=2))
+    assert len(events[0]["data"]) == 2
+    async_response = asyncio.run(chain.aask_question("Can NBFCs accept deposits?", k=2))
+    assert async_response["sources"] == events[0]["data"]
+    batch = chain.ask_batch([QUESTION, "Can NBFCs accept deposits?"], k=3)
+    assert [len(response["sources"]) for response in batch] == [3, 3]
+
+
+def test_max_context_tokens_per_call(make_chain):
+    compressed = make_chain(k=4, compressor=ContextCompressor(max_tokens=0, token_counter=count_words))
+    timings = compressed.ask_question(QUESTION, max_context_tokens=12, return_timings=True)["timings"]
+    assert 0 < timings["context_tokens"] <= 12
+    assert compressed.compressor.max_tokens == 0
+
+    # Without a compressor the budget alone trims the context
+    plain = make_chain(k=4)
+    full = plain.ask_question(QUESTION, return_timings=True)["timings"]
+    trimmed = plain.ask_question(QUESTION, max_context_tokens=12, return_timings=True)["timings"]
+    assert "context_tokens" not in full
+    assert trimmed["input_tokens"] < full["input_tokens"]
+
+
+def test_ask_endpoint_retrieves_max_sources(make_chain, monkeypatch):
+    monkeypatch.setattr(server, "_rag_chain", make_chain(k=4))
+    monkeypatch.setattr(server, "_single_flight", server.SingleFlight())
+
+    def input_tokens(**fields):
+        request = server.QuestionRequest(question=QUESTION, include_timings=True, **fields)
+        return asyncio.run(server.ask_question(request)).timings["input_tokens"]
+
+    # A small max_sources is the retrieval depth, not a cut after generation
+    assert input_tokens(max_sources=1) < input_tokens(max_sources=4)
+    assert input_tokens(max_sources=10) == input_tokens(max_sources=4)
+    assert input_tokens(max_sources=1, k=4) == input_tokens(max_sources=4)
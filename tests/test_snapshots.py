@@ -0,0 +1,93 @@
+"""Offline tests for versioned vector-store snapshots and hot reloads."""
+
+import asyncio
+import os
+
+import pytest
+
+from src.rbi_nbfc_chatbot.api import server
+from src.rbi_nbfc_chatbot.utils.fakes import FakeChatModel, HashingEmbeddings
+from src.rbi_nbfc_chatbot.utils.ingest import build_snapshot
+from src.rbi_nbfc_chatbot.utils.manifest import load_manifest
+from src.rbi_nbfc_chatbot.utils.snapshots import (
+    STAGING_PREFIX,
+    claim_staging,
+    current_snapshot,
+    list_snapshots,
+    prune_snapshots,
+    publish_snapshot,
+    resolve_index_path,
+    snapshot_path,
+)
+
+
+def test_snapshots_publish_reuse_and_prune(tmp_path, sample_documents):
+    root = str(tmp_path / "snapshots")
+    assert current_snapshot(root) is None
+
+    first, _ = build_snapshot(sample_documents[:4], root=root, embeddings=HashingEmbeddings(), incremental=False)
+    assert current_snapshot(root) == first
+    assert resolve_index_path(root=root) == snapshot_path(first, root)
+
+    second, store = build_snapshot(sample_documents, root=root, embeddings=HashingEmbeddings())
+    assert current_snapshot(root) == second
+    assert store.index.ntotal == len(sample_documents)
+    manifest = load_manifest(snapshot_path(second, root))
+    assert (manifest["reused"], manifest["embedded"], manifest["parent"]) == (4, 2, first)
+    assert not [name for name in os.listdir(root) if name.startswith(STAGING_PREFIX)]
+    # The previous snapshot is left untouched for servers still using it
+    assert load_manifest(snapshot_path(first, root))["num_chunks"] == 4
+
+    # Rolling back is publishing an older snapshot
+    publish_snapshot(first, root)
+    assert [(s["name"], s["current"]) for s in list_snapshots(root)] == [(first, True), (second, False)]
+    assert prune_snapshots(root, keep=1) == [second]
+    assert not os.path.exists(snapshot_path(second, root))
+
+    for name in ("../escape", "", "missing"):
+        with pytest.raises((ValueError, FileNotFoundError)):
+            publish_snapshot(name, root)
+
+
+def test_each_build_claims_its_own_staging_directory(tmp_path):
+    root = str(tmp_path)
+    with pytest.raises(RuntimeError):
+        with claim_staging(root) as failed:
+            (tmp_path / os.path.basename(failed) / "embedding_checkpoint.jsonl").write_text("")
+            raise RuntimeError("embedding quota exceeded")
+
+    # The next build resumes the failed one's directory; a concurrent build gets a new one
+    with claim_staging(root) as resumed, claim_staging(root) as concurrent:
+        assert resumed == failed and os.listdir(resumed) == ["embedding_checkpoint.jsonl"]
+        assert concurrent != resumed and os.listdir(concurrent) == []
+        os.rename(resumed, os.path.join(root, "committed"))
+    leftover = os.path.basename(concurrent)
+    assert sorted(os.listdir(root)) == sorted(["committed", leftover, f"{leftover}.lock"])
+
+
+def test_reload_swaps_chain_without_dropping_requests(make_chain, monkeypatch):
+    old = make_chain(llm=FakeChatModel(answer="old answer", latency=0.2), index_path="snapshots/old")
+    new = make_chain(llm=FakeChatModel(answer="new answer"), index_path="snapshots/new")
+    monkeypatch.setattr(server, "_rag_chain", old)
+    monkeypatch.setattr(server, "_chain_pool", None)
+    monkeypatch.setattr(server, "_single_flight", server.SingleFlight())
+    monkeypatch.setattr(server, "_reload_lock", None)
+    monkeypatch.setattr(server, "_index_status", dict(server._index_status))
+    monkeypatch.setattr(server, "build_rag_chain", lambda index_path=None: new)
+
+    def ask():
+        return server.ask_question(server.QuestionRequest(question="What is the minimum Net Owned Fund?"))
+
+    async def scenario():
+        in_flight = asyncio.create_task(ask())
+        await asyncio.sleep(0.05)
+        await server.reload_rag_chain("snapshots/new")
+        after = await ask()
+        return await in_flight, after
+
+    before, after = asyncio.run(scenario())
+    assert before.answer == "old answer"
+    assert after.answer == "new answer"
+    assert server._rag_chain is new
+    assert server._index_status["index_path"] == "snapshots/new"
+    assert server._index_status["reloading"] is False
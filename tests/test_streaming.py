@@ -0,0 +1,48 @@
+"""Offline tests for streamed answers and the SSE endpoint."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from src.rbi_nbfc_chatbot.api import server
+
+
+def test_stream_question_emits_sources_then_tokens(make_chain, fake_llm):
+    events = list(make_chain(llm=fake_llm).stream_question("What is the minimum Net Owned Fund?"))
+
+    names = [event["event"] for event in events]
+    assert names[0] == "sources"
+    assert names[-1] == "done"
+    assert set(names[1:-1]) == {"token"}
+    assert len(events[0]["data"]) == 2
+    assert "".join(e["data"] for e in events if e["event"] == "token") == fake_llm.answer
+    assert events[-1]["data"]["answer"] == fake_llm.answer
+
+
+def test_astream_question_matches_sync(make_chain, fake_llm):
+    chain = make_chain(llm=fake_llm)
+
+    async def collect():
+        return [event async for event in chain.astream_question("Can NBFCs accept deposits?")]
+
+    assert asyncio.run(collect()) == list(chain.stream_question("Can NBFCs accept deposits?"))
+
+
+def test_ask_stream_endpoint(make_chain, fake_llm, monkeypatch):
+    monkeypatch.setattr(server, "_rag_chain", make_chain(llm=fake_llm))
+
+    response = TestClient(server.app).post(
+        "/ask/stream", json={"question": "Can NBFCs accept deposits?", "max_sources": 1}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    assert events[0][0] == "sources"
+    assert len(events[0][1]) == 1
+    assert events[-1][0] == "done"
+    assert events[-1][1]["answer"] == fake_llm.answer